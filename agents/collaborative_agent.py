@@ -1,9 +1,11 @@
 import cohere
 from langsmith import traceable
 from core.config import (
-    cohere_api_key, COHERE_GENERATE_MODEL,
-    get_mysql_connection, get_neo4j_connection
+    cohere_api_key, COHERE_GENERATE_MODEL, close_cohere_client,
+    get_mysql_connection, get_neo4j_connection, get_course_catalog, get_co_enrollment_index,
+    get_course_factor_index
 )
+from core.catalog import NO_COURSE_DATA_MESSAGE
 from utils.logger import SystemLogger
 from utils.exceptions import (
     DatabaseConnectionError, DatabaseQueryError, APIRequestError, 
@@ -28,6 +30,12 @@ class CollaborativeAgent:
         MySQL database connection for course catalog access  
     cohere_client : cohere.Client
         Cohere API client for recommendation text generation
+    catalog : CourseCatalog
+        Shared course catalog backing ``impel_data``
+    co_enrollment : CoEnrollmentIndex
+        Precomputed "students who took X also took Y" course lists
+    course_factors : CourseFactorIndex
+        Offline matrix factorisation model for per-user course scores
     impel_data : str
         Formatted course and module data for recommendation context
         
@@ -49,6 +57,8 @@ class CollaborativeAgent:
             SystemLogger.debug("Acquiring database connections for CollaborativeAgent")
             self.neo4j = get_neo4j_connection()
             self.mysql = get_mysql_connection()
+            self.co_enrollment = get_co_enrollment_index()
+            self.course_factors = get_course_factor_index()
             
             # Initialize Cohere client
             SystemLogger.debug("Initializing Cohere client for CollaborativeAgent")
@@ -61,9 +71,10 @@ class CollaborativeAgent:
             
             self.cohere_client = cohere.Client(cohere_api_key)
             
-            # Load course data
-            SystemLogger.debug("Loading IMPEL course data from MySQL")
-            self.impel_data = self._load_impel_courses_and_modules()
+            # Course data comes from the process-wide catalog; warm it here
+            SystemLogger.debug("Loading IMPEL course data from shared course catalog")
+            self.catalog = get_course_catalog()
+            self.catalog.get_prompt_text()
             
             SystemLogger.info("CollaborativeAgent initialized successfully", {
                 'mysql_connected': self.mysql is not None,
@@ -87,89 +98,15 @@ class CollaborativeAgent:
             )
             raise AgentExecutionError(f"Failed to initialize CollaborativeAgent: {e}")
     
-    @traceable(run_type="tool", name="load_courses_for_collaborative_filtering")
-    def _load_impel_courses_and_modules(self):
-        """Load and format course data from MySQL for recommendations."""
-        SystemLogger.debug("Loading and formatting IMPEL course data from MySQL")
-        
-        try:
-            if not self.mysql:
-                SystemLogger.error(
-                    "MySQL connection not available for course loading - Check database initialization",
-                    context={'mysql_connector_available': self.mysql is not None}
-                )
-                raise DatabaseConnectionError("MySQL connection not available")
-            
-            courses_data = self.mysql.get_courses()
-            
-            if not courses_data:
-                SystemLogger.info("No course data found in MySQL database", {
-                    'courses_returned': len(courses_data) if courses_data else 0
-                })
-                return "No course data available in database."
-            
-            SystemLogger.debug(f"Retrieved course data from MySQL", {
-                'total_entries': len(courses_data)
-            })
-            
-            # Group by course name
-            courses_dict = {}
-            for row in courses_data:
-                if not row or 'course_name' not in row:
-                    SystemLogger.debug("Skipping invalid course data row", {
-                        'row_data': row
-                    })
-                    continue
-                    
-                course_name = row['course_name']
-                if course_name not in courses_dict:
-                    courses_dict[course_name] = []
-                courses_dict[course_name].append({
-                    'module': row.get('module_name', 'Unknown Module'),
-                    'summary': row.get('module_summary', 'No summary available')
-                })
-            
-            if not courses_dict:
-                SystemLogger.error(
-                    "No valid course data found after processing - Check database schema and data integrity",
-                    context={'raw_entries': len(courses_data)}
-                )
-                raise DatabaseQueryError("No valid course data found")
-            
-            # Format for LLM
-            formatted = ""
-            for course_name, modules in courses_dict.items():
-                formatted += f"**Course: {course_name}**\nModules:\n"
-                for module_info in modules:
-                    formatted += f"- {module_info['module']}: {module_info['summary']}\n"
-                formatted += "\n"
-            
-            formatted_data = formatted.strip()
-            
-            SystemLogger.info("IMPEL course data loaded and formatted successfully", {
-                'unique_courses': len(courses_dict),
-                'total_modules': sum(len(modules) for modules in courses_dict.values()),
-                'formatted_length': len(formatted_data)
-            })
-            
-            return formatted_data
-            
-        except (DatabaseConnectionError, DatabaseQueryError) as e:
-            SystemLogger.error(
-                "Database error loading IMPEL course data",
-                exception=e,
-                context={'mysql_available': self.mysql is not None}
-            )
-            # Re-raise database errors - they should be handled upstream
-            raise
-        except Exception as e:
-            SystemLogger.error(
-                "Unexpected error loading IMPEL course data",
-                exception=e,
-                context={'mysql_available': self.mysql is not None}
-            )
-            raise DatabaseQueryError(f"Failed to load course data: {e}")
-
+    @property
+    def impel_data(self):
+        """Formatted course and module listing from the shared course catalog."""
+        return self.catalog.get_prompt_text()
+    
+    def close(self):
+        """Close this agent's Cohere client; shared database connectors stay open."""
+        close_cohere_client(self.cohere_client)
+    
     @traceable(run_type="agent", name="collaborative_agent_recommendations")
     def generate_recommendations(self, query: str, user_context: dict) -> dict:
         """
@@ -242,18 +179,22 @@ class CollaborativeAgent:
             raise AgentExecutionError(f"Failed to generate user vector: {e}")
         
         try:
-            # Find similar users with LangSmith tracing
+            # Find similar users, their prior responses and enrolled courses in one read with LangSmith tracing
             @traceable(run_type="retriever", name="find_collaborative_similar_users")
-            def _find_similar_users(vector):
-                """Find similar users for collaborative filtering with LangSmith tracing."""
-                users = self.neo4j.get_similar_users(vector)
+            def _find_collaborative_context(vector):
+                """Find similar users and what they asked and enrolled in with LangSmith tracing."""
+                context = self.neo4j.get_collaborative_context(vector, cohort=cohort)
                 SystemLogger.debug("Similar users search completed", {
-                    'similar_users_count': len(users) if users else 0
+                    'similar_users_count': len(context["similar_users"]),
+                    'responses_count': len(context["responses"]),
+                    'courses_count': len(context["courses"])
                 })
-                return users
+                return context
             
             SystemLogger.debug("Finding similar users for collaborative filtering")
-            similar_users = _find_similar_users(user_vector)
+            cohort = (user_context["education"], user_context["age_group"], user_context["profession"])
+            collaborative_context = _find_collaborative_context(user_vector)
+            similar_users = collaborative_context["similar_users"]
             
         except (DatabaseConnectionError, DatabaseQueryError) as e:
             SystemLogger.error(
@@ -297,29 +238,51 @@ Format:
                 })
                 response_prefix = "Recommended based on similar users' interests:\\n\\n"
                 
-                try:
-                    most_similar_query = similar_users[0].get("query", "")
-                    if not most_similar_query:
-                        SystemLogger.debug("Most similar user has empty query - using general approach")
-                        similar_user_recs = []
-                    else:
-                        similar_user_recs = self.neo4j.get_recommendations_for_user(most_similar_query)
-                        SystemLogger.debug("Retrieved recommendations for most similar user", {
-                            'recommendations_count': len(similar_user_recs) if similar_user_recs else 0
-                        })
-                        
-                except Exception as rec_error:
-                    SystemLogger.error(
-                        "Error retrieving recommendations for similar user - using fallback",
-                        exception=rec_error,
-                        context={'most_similar_user_id': similar_users[0].get('user_id', 'unknown') if similar_users else 'none'}
+                # Responses to the most similar user's query, fetched with the similar users
+                similar_user_recs = collaborative_context["responses"]
+                if not similar_users[0].get("query"):
+                    SystemLogger.debug("Most similar user has empty query - using general approach")
+                else:
+                    SystemLogger.debug("Retrieved recommendations for most similar user", {
+                        'recommendations_count': len(similar_user_recs)
+                    })
+                
+                # Co-enrollment lists are precomputed, so this evidence costs no query or LLM call
+                enrolled_courses = sorted(set(collaborative_context["courses"]))
+                # Without enrollments among the similar users, the cohort's most-enrolled courses seed the lists
+                seed_courses = enrolled_courses or self.neo4j.get_cohort_courses(cohort)
+                co_enrolled_courses = self.co_enrollment.also_took_any(seed_courses)
+                # Users the factor model has not seen are folded in from the seed courses
+                factor_courses = self.course_factors.recommend(user_context.get("user_id"), seed_courses)
+                SystemLogger.debug("Collected precomputed collaborative evidence", {
+                    'seed_courses': len(seed_courses),
+                    'co_enrolled_courses': len(co_enrolled_courses),
+                    'factor_courses': len(factor_courses)
+                })
+                
+                if co_enrolled_courses:
+                    seed_label = (
+                        "Similar users enrolled in" if enrolled_courses
+                        else "Users with the same education, age group and profession most often enrolled in"
+                    )
+                    similar_user_evidence = (
+                        f"{seed_label}: {', '.join(seed_courses)}\n"
+                        "Students who took those courses also took: " + ", ".join(
+                            f"{c['course']} ({c['shared_students']} shared students)" for c in co_enrolled_courses
+                        )
+                    )
+                else:
+                    similar_user_evidence = f"A similar user was interested in: {similar_user_recs}"
+                if factor_courses:
+                    similar_user_evidence += (
+                        "\nCourses predicted for this user from enrollment patterns: "
+                        + ", ".join(c["course"] for c in factor_courses)
                     )
-                    similar_user_recs = []
                 
                 prompt = f"""
 You are a course recommendation assistant. Below are courses and their modules from the IMPEL database:
 {self.impel_data}
-A similar user was interested in: {similar_user_recs}
+{similar_user_evidence}
 Current user query: '{query}'
 Suggest relevant courses and modules for this user.
 Format:
@@ -338,7 +301,7 @@ Format:
 
         try:
             # Check if course data is available
-            if not self.impel_data or self.impel_data == "No course data available in database.":
+            if not self.impel_data or self.impel_data == NO_COURSE_DATA_MESSAGE:
                 SystemLogger.error(
                     "Course data not available for recommendations - Database may be empty or connection failed",
                     context={'impel_data_length': len(self.impel_data) if self.impel_data else 0}
@@ -389,15 +352,15 @@ Format:
             raise APIRequestError(f"Failed to generate recommendations: {e}")
 
         try:
-            # Get courses similar users enrolled in
-            SystemLogger.debug("Finding enrolled courses from similar users")
+            # Courses similar users enrolled in, fetched with the similar users
+            SystemLogger.debug("Formatting enrolled courses from similar users")
             similar_user_courses = ""
             
             if similar_users:
                 similar_user_ids = [user["user_id"] for user in similar_users if user.get("user_id")]
                 
                 if similar_user_ids:
-                    enrolled_courses = self.neo4j.get_enrolled_courses_from_similar_users(similar_user_ids)
+                    enrolled_courses = collaborative_context["courses"]
                     if enrolled_courses:
                         unique_courses = sorted(set(enrolled_courses))
                         similar_user_courses = "\\n".join(f"- {name}" for name in unique_courses)
@@ -5,13 +5,14 @@ import fitz
 import docx2txt
 
 from langchain.chains import RetrievalQA
-from langchain_community.vectorstores import FAISS
 from langchain_cohere import ChatCohere
 from langsmith import traceable
 
-from core.config import COURSE_VS, PAPERS_DIR, EMBED_MODEL, tavily_api_key, COHERE_CHAT_MODEL
+from core.config import (
+    get_course_vector_store, get_embed_model, get_paper_vector_store,
+    PAPERS_DIR, tavily_api_key, COHERE_CHAT_MODEL, close_cohere_client
+)
 from tools.web_search_tool import web_search
-from utils.data_loaders import load_research_papers
 from utils.logger import SystemLogger
 from utils.exceptions import (
     FileProcessingError, APIRequestError, VectorStoreError, 
@@ -64,45 +65,39 @@ class ContentAgent:
                 temperature=0
             )
             
-            # Load research papers
-            SystemLogger.debug("Loading research papers for ContentAgent")
+            # Load research paper index (from the on-disk cache when up to date)
+            SystemLogger.debug("Loading research paper index for ContentAgent")
             if not PAPERS_DIR:
                 SystemLogger.error(
                     "Papers directory not configured - Check PAPERS_DIR in config",
                     context={'papers_dir': PAPERS_DIR}
                 )
                 raise ConfigurationError("Papers directory not configured")
-                
-            docs = load_research_papers(PAPERS_DIR)
-            
-            if not docs:
-                SystemLogger.error(
-                    "No research papers loaded - Check papers directory and file permissions",
-                    context={'papers_dir': PAPERS_DIR, 'docs_count': len(docs)}
-                )
-                raise FileProcessingError("No research papers loaded")
             
-            # Initialize vector store
-            SystemLogger.debug("Creating FAISS vector store for research papers")
-            if not EMBED_MODEL:
+            embed_model = get_embed_model()
+            if not embed_model:
                 SystemLogger.error(
-                    "Embedding model not configured - Check EMBED_MODEL in config",
-                    context={'embed_model_configured': EMBED_MODEL is not None}
+                    "Embedding model not configured - Check get_embed_model() in config",
+                    context={'embed_model_configured': embed_model is not None}
                 )
                 raise ConfigurationError("Embedding model not configured")
-                
-            self.paper_vs = FAISS.from_documents(docs, EMBED_MODEL).as_retriever(
-                search_kwargs={"k": 5}
-            )
+            
+            # Warm the shared course vector store so the first request does not pay for it
+            SystemLogger.debug("Warming shared course vector store for ContentAgent")
+            get_course_vector_store()
+            
+            # Shared across agents and, in preforked server mode, across workers
+            paper_index = get_paper_vector_store()
+            self.set_paper_index(paper_index)
             
             SystemLogger.info("ContentAgent initialized successfully", {
                 'llm_model': COHERE_CHAT_MODEL,
-                'papers_loaded': len(docs),
+                'paper_chunks_indexed': paper_index.index.ntotal,
                 'papers_dir': PAPERS_DIR,
-                'embedding_model': type(EMBED_MODEL).__name__
+                'embedding_model': type(embed_model).__name__
             })
             
-        except (ConfigurationError, FileProcessingError) as e:
+        except (ConfigurationError, FileProcessingError, VectorStoreError) as e:
             SystemLogger.error(
                 "Configuration or file processing error initializing ContentAgent",
                 exception=e,
@@ -117,6 +112,27 @@ class ContentAgent:
             )
             raise AgentExecutionError(f"Failed to initialize ContentAgent: {e}")
 
+    def set_paper_index(self, paper_index):
+        """
+        Swap in a research paper index for subsequent requests.
+        
+        The retriever is replaced with a single attribute assignment, so
+        requests already running keep the retriever they started with.
+        
+        Parameters
+        ----------
+        paper_index : FAISS
+            Research paper vector store to serve from
+        """
+        self.paper_vs = paper_index.as_retriever(search_kwargs={"k": 5})
+        SystemLogger.debug("ContentAgent paper index swapped", {
+            'paper_chunks_indexed': paper_index.index.ntotal
+        })
+
+    def close(self):
+        """Close the chat model's Cohere client; the shared vector stores stay loaded."""
+        close_cohere_client(getattr(self.llm, 'client', None))
+    
     @traceable(run_type="llm", name="content_agent_query_classification")
     def classify_query(self, query: str) -> Dict[str, Any]:
         """Classify user query to determine content agent intents."""
@@ -568,21 +584,22 @@ class ContentAgent:
             # Prepare search query
             q = (resume + '\n' + query).strip() if resume else query.strip()
             
+            course_vs = get_course_vector_store()
             SystemLogger.debug("Searching for similar courses", {
                 'search_query_length': len(q),
-                'vector_store_available': COURSE_VS is not None
+                'vector_store_available': course_vs is not None
             })
             
             # Course similarity search
-            if not COURSE_VS:
+            if not course_vs:
                 SystemLogger.error(
                     "Course vector store not available for similarity search",
-                    context={'course_vs_configured': COURSE_VS is not None}
+                    context={'course_vs_configured': course_vs is not None}
                 )
                 return "## Course Recommendations\nCourse database not available."
             
             try:
-                recs = COURSE_VS.similarity_search(q, k=3)
+                recs = course_vs.similarity_search(q, k=3)
                 SystemLogger.debug("Course similarity search completed", {
                     'recommendations_found': len(recs) if recs else 0
                 })
@@ -642,16 +659,18 @@ class ContentAgent:
             papers = ['## Related Research Papers']
             
             try:
-                if not self.paper_vs:
+                # Pin the retriever for this request; a hot reload may swap self.paper_vs
+                paper_vs = self.paper_vs
+                if not paper_vs:
                     SystemLogger.error(
                         "Paper vector store not available for research recommendations",
-                        context={'paper_vs_configured': self.paper_vs is not None}
+                        context={'paper_vs_configured': paper_vs is not None}
                     )
                     papers.append("Research papers database not available.")
                 else:
                     qa = RetrievalQA.from_chain_type(
                         llm=self.llm,
-                        retriever=self.paper_vs,
+                        retriever=paper_vs,
                         return_source_documents=True
                     )
                     
@@ -1,9 +1,10 @@
 import cohere
 from langsmith import traceable
 from core.config import (
-    cohere_api_key, COHERE_GENERATE_MODEL, 
-    get_mysql_connection, get_neo4j_connection
+    cohere_api_key, COHERE_GENERATE_MODEL, close_cohere_client, 
+    get_mysql_connection, get_neo4j_connection, get_course_catalog
 )
+from core.catalog import NO_COURSE_DATA_MESSAGE
 from utils.logger import SystemLogger
 from utils.exceptions import (
     DatabaseConnectionError, DatabaseQueryError, APIRequestError, 
@@ -27,6 +28,8 @@ class DatabaseAgent:
         MySQL database connection for course catalog data
     cohere_client : cohere.Client
         Cohere API client for natural language response generation
+    catalog : CourseCatalog
+        Shared course catalog backing ``impel_data``
     impel_data : str
         Formatted string of course and module information from database
         
@@ -60,9 +63,10 @@ class DatabaseAgent:
             
             self.cohere_client = cohere.Client(cohere_api_key)
             
-            # Load course data
-            SystemLogger.debug("Loading IMPEL course data from MySQL")
-            self.impel_data = self._load_impel_courses_and_modules()
+            # Course data comes from the process-wide catalog; warm it here
+            SystemLogger.debug("Loading IMPEL course data from shared course catalog")
+            self.catalog = get_course_catalog()
+            self.catalog.get_prompt_text()
             
             SystemLogger.info("DatabaseAgent initialized successfully", {
                 'mysql_connected': self.mysql is not None,
@@ -86,89 +90,15 @@ class DatabaseAgent:
             )
             raise AgentExecutionError(f"Failed to initialize DatabaseAgent: {e}")
     
-    @traceable(run_type="tool", name="load_impel_courses_data")
-    def _load_impel_courses_and_modules(self):
-        """Load and format course data from MySQL for database queries."""
-        SystemLogger.debug("Loading and formatting IMPEL course data from MySQL")
-        
-        try:
-            if not self.mysql:
-                SystemLogger.error(
-                    "MySQL connection not available for course loading - Check database initialization",
-                    context={'mysql_connector_available': self.mysql is not None}
-                )
-                raise DatabaseConnectionError("MySQL connection not available")
-            
-            courses_data = self.mysql.get_courses()
-            
-            if not courses_data:
-                SystemLogger.info("No course data found in MySQL database", {
-                    'courses_returned': len(courses_data) if courses_data else 0
-                })
-                return "No course data available in database."
-            
-            SystemLogger.debug(f"Retrieved course data from MySQL", {
-                'total_entries': len(courses_data)
-            })
-            
-            # Group by course name
-            courses_dict = {}
-            for row in courses_data:
-                if not row or 'course_name' not in row:
-                    SystemLogger.debug("Skipping invalid course data row", {
-                        'row_data': row
-                    })
-                    continue
-                    
-                course_name = row['course_name']
-                if course_name not in courses_dict:
-                    courses_dict[course_name] = []
-                courses_dict[course_name].append({
-                    'module': row.get('module_name', 'Unknown Module'),
-                    'summary': row.get('module_summary', 'No summary available')
-                })
-            
-            if not courses_dict:
-                SystemLogger.error(
-                    "No valid course data found after processing - Check database schema and data integrity",
-                    context={'raw_entries': len(courses_data)}
-                )
-                raise DatabaseQueryError("No valid course data found")
-            
-            # Format for LLM
-            formatted = ""
-            for course_name, modules in courses_dict.items():
-                formatted += f"**Course: {course_name}**\nModules:\n"
-                for module_info in modules:
-                    formatted += f"- {module_info['module']}: {module_info['summary']}\n"
-                formatted += "\n"
-            
-            formatted_data = formatted.strip()
-            
-            SystemLogger.info("IMPEL course data loaded and formatted successfully", {
-                'unique_courses': len(courses_dict),
-                'total_modules': sum(len(modules) for modules in courses_dict.values()),
-                'formatted_length': len(formatted_data)
-            })
-            
-            return formatted_data
-            
-        except (DatabaseConnectionError, DatabaseQueryError) as e:
-            SystemLogger.error(
-                "Database error loading IMPEL course data",
-                exception=e,
-                context={'mysql_available': self.mysql is not None}
-            )
-            # Re-raise database errors - they should be handled upstream
-            raise
-        except Exception as e:
-            SystemLogger.error(
-                "Unexpected error loading IMPEL course data",
-                exception=e,
-                context={'mysql_available': self.mysql is not None}
-            )
-            raise DatabaseQueryError(f"Failed to load course data: {e}")
-
+    @property
+    def impel_data(self):
+        """Formatted course and module listing from the shared course catalog."""
+        return self.catalog.get_prompt_text()
+    
+    def close(self):
+        """Close this agent's Cohere client; shared database connectors stay open."""
+        close_cohere_client(self.cohere_client)
+    
     @traceable(run_type="agent", name="database_agent_lookup")
     def lookup_courses(self, query: str, user_context: dict) -> dict:
         """
@@ -243,7 +173,7 @@ class DatabaseAgent:
         
         try:
             # Check if course data is available
-            if not self.impel_data or self.impel_data == "No course data available in database.":
+            if not self.impel_data or self.impel_data == NO_COURSE_DATA_MESSAGE:
                 SystemLogger.error(
                     "Course data not available for lookup - Database may be empty or connection failed",
                     context={'impel_data_length': len(self.impel_data) if self.impel_data else 0}
@@ -318,7 +248,12 @@ Format:
             @traceable(run_type="retriever", name="find_similar_users_and_courses")
             def _find_similar_users_courses(user_vector):
                 """Find similar users and their enrolled courses with LangSmith tracing."""
-                similar_users = self.neo4j.get_similar_users(user_vector)
+                # Neighbours and their courses come back from a single read transaction
+                context = self.neo4j.get_collaborative_context(
+                    user_vector,
+                    cohort=(user_context["education"], user_context["age_group"], user_context["profession"])
+                )
+                similar_users = context["similar_users"]
                 similar_courses_text = ""
                 
                 if similar_users:
@@ -326,7 +261,7 @@ Format:
                     user_ids = [user["user_id"] for user in similar_users if user.get("user_id")]
                     
                     if user_ids:
-                        courses = self.neo4j.get_enrolled_courses_from_similar_users(user_ids)
+                        courses = context["courses"]
                         if courses:
                             unique_courses = sorted(set(courses))
                             similar_courses_text = "\n".join(f"- {c}" for c in unique_courses)
@@ -2,7 +2,25 @@
 
 # Main entry point for the application
 
+import argparse
+
 from app.gradio_interface import create_gradio_interface
+from app.server import run_preforked_server, DEFAULT_BASE_PORT
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Course recommendation system")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes; above 1 preloads shared resources and forks")
+    parser.add_argument("--host", default=None, help="Host to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_BASE_PORT,
+                        help="Port (first worker's port in multi-worker mode)")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    create_gradio_interface()
+    args = parse_args()
+    if args.workers > 1:
+        run_preforked_server(args.workers, server_name=args.host, base_port=args.port)
+    else:
+        create_gradio_interface(server_name=args.host, server_port=args.port)
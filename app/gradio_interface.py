@@ -1,7 +1,10 @@
 # Gradio interface 
 
 import gradio as gr
-from core.orchestrator import RecommendationSystem
+from core.config import EDUCATION_LEVELS, AGE_GROUPS, PROFESSION_TYPES
+from core.orchestrator import (
+    get_recommendation_system, is_recommendation_system_ready
+)
 from utils.logger import SystemLogger
 from utils.exceptions import (
     WorkflowError, AgentExecutionError, ConfigurationError,
@@ -88,10 +91,22 @@ def process_recommendations(user_id, education, age_group, profession, user_quer
                 gr.update(visible=False)
             )
         
-        # Initialize orchestrator
-        SystemLogger.debug("Initializing RecommendationSystem orchestrator")
+        # Reject traffic until the shared orchestrator has finished warming up
+        if not is_recommendation_system_ready():
+            SystemLogger.info("Request received before RecommendationSystem is ready", {
+                'user_id': user_id
+            })
+            return (
+                gr.update(value="The system is still starting up. Please try again in a moment.", visible=True),
+                gr.update(visible=False),
+                gr.update(visible=False),
+                gr.update(visible=False)
+            )
+        
+        # Reuse the process-wide orchestrator
+        SystemLogger.debug("Acquiring shared RecommendationSystem orchestrator")
         try:
-            recommender = RecommendationSystem()
+            recommender = get_recommendation_system()
         except (ConfigurationError, AgentExecutionError) as init_error:
             SystemLogger.error(
                 "Failed to initialize RecommendationSystem in Gradio interface",
@@ -243,7 +258,7 @@ def process_recommendations(user_id, education, age_group, profession, user_quer
 
 
 
-def create_gradio_interface():
+def create_gradio_interface(server_name=None, server_port=None):
     """
     Create and configure Gradio web interface for course recommendation system.
     
@@ -251,10 +266,17 @@ def create_gradio_interface():
     and user feedback mechanisms. Provides interactive forms for user profile data,
     query input, and file upload capabilities with real-time processing feedback.
     
+    Parameters
+    ----------
+    server_name : str, optional
+        Host to bind, by default Gradio's default (127.0.0.1)
+    server_port : int, optional
+        Port to bind, by default Gradio's default (7860)
+    
     Returns
     -------
     None
-        Launches Gradio interface in debug mode on default port
+        Launches Gradio interface in debug mode on the requested or default port
         
     Raises
     ------
@@ -278,6 +300,18 @@ def create_gradio_interface():
     """
     SystemLogger.info("Creating Gradio interface for course recommendation system")
     
+    # Warm the shared orchestrator before the UI starts accepting traffic
+    try:
+        SystemLogger.info("Warming up RecommendationSystem before launching interface")
+        get_recommendation_system()
+    except Exception as warmup_error:
+        SystemLogger.error(
+            "Failed to warm up RecommendationSystem - Interface will not be launched",
+            exception=warmup_error,
+            context={'interface_creation_step': 'warmup'}
+        )
+        raise
+    
     try:
         SystemLogger.debug("Building Gradio Blocks interface")
         
@@ -312,17 +346,17 @@ def create_gradio_interface():
                         info="Enter a unique identifier for your session"
                     )
                     education = gr.Radio(
-                        ["High School", "Undergraduate", "Graduate"], 
+                        list(EDUCATION_LEVELS), 
                         label="Education",
                         info="Select your highest education level"
                     )
                     age_group = gr.Radio(
-                        ["Under 18", "18-25", "26-40", "40+"], 
+                        list(AGE_GROUPS), 
                         label="Age Group",
                         info="Select your age range"
                     )
                     profession = gr.Radio(
-                        ["Student", "Professional"], 
+                        list(PROFESSION_TYPES), 
                         label="Professional Status",
                         info="Are you currently a student or working professional?"
                     )
@@ -421,16 +455,20 @@ def create_gradio_interface():
         try:
             SystemLogger.info("Launching Gradio interface", {
                 'debug_mode': True,
+                'server_name': server_name,
+                'server_port': server_port,
                 'interface_components': ['user_id', 'education', 'age_group', 'profession', 'query', 'file_upload']
             })
             
-            demo.launch(debug=True)
+            demo.launch(debug=True, server_name=server_name, server_port=server_port)
             
         except Exception as launch_error:
             SystemLogger.error(
                 "Error launching Gradio interface",
                 exception=launch_error,
-                context={'launch_config': {'debug': True}}
+                context={'launch_config': {
+                    'debug': True, 'server_name': server_name, 'server_port': server_port
+                }}
             )
             raise
     
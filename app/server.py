@@ -0,0 +1,196 @@
+# Preforking server mode
+
+import gc
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from multiprocessing.connection import wait
+
+from core.config import (
+    get_embed_model, get_course_catalog, get_course_vector_store,
+    get_paper_vector_store, reset_database_connections
+)
+from utils.logger import SystemLogger
+from utils.exceptions import ConfigurationError
+
+DEFAULT_BASE_PORT = 7860
+
+# Thread count for torch inside workers; OpenMP thread pools do not survive fork
+WORKER_TORCH_THREADS = int(os.getenv("WORKER_TORCH_THREADS", "1"))
+# A worker that dies sooner than this after starting is respawned only after
+# WORKER_RESPAWN_DELAY_SECONDS, so a worker that crashes on startup does not spin
+WORKER_MIN_UPTIME_SECONDS = 10
+WORKER_RESPAWN_DELAY_SECONDS = 5
+
+
+def preload_shared_resources():
+    """
+    Build the read-only resources every worker needs in the current process.
+
+    Loads the sentence-transformer model, the course catalog, the course
+    vector store and the research paper vector store through the shared
+    config accessors so that forked workers inherit them instead of
+    rebuilding them.
+
+    Returns
+    -------
+    dict
+        Seconds spent on each preloaded resource
+    """
+    timings = {}
+    for name, loader in (
+        ('embed_model', get_embed_model),
+        ('course_catalog', lambda: get_course_catalog().get_prompt_text()),
+        ('course_vector_store', get_course_vector_store),
+        ('paper_vector_store', get_paper_vector_store),
+    ):
+        start_time = time.perf_counter()
+        loader()
+        timings[name] = round(time.perf_counter() - start_time, 3)
+
+    SystemLogger.info("Shared resources preloaded in parent process", timings)
+    return timings
+
+
+def _worker_main(worker_index, server_name, server_port):
+    """Entry point of a forked worker: own connections, own orchestrator, own port."""
+    # Import here so the parent never builds an orchestrator or touches Gradio
+    from app.gradio_interface import create_gradio_interface
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    torch = sys.modules.get('torch')
+    if torch is not None:
+        torch.set_num_threads(WORKER_TORCH_THREADS)
+
+    # Defensive: never reuse a connector object inherited from the parent
+    reset_database_connections()
+
+    SystemLogger.info("Worker process starting", {
+        'worker_index': worker_index,
+        'pid': os.getpid(),
+        'server_port': server_port
+    })
+    create_gradio_interface(server_name=server_name, server_port=server_port)
+
+
+def run_preforked_server(workers, server_name=None, base_port=DEFAULT_BASE_PORT):
+    """
+    Preload shared resources once, then fork worker processes that serve the UI.
+
+    The parent process loads the embedding model and vector stores, closes any
+    database connections it opened, freezes the garbage collector so inherited
+    objects are not dirtied by collections, and forks ``workers`` processes.
+    Worker ``i`` opens its own MySQL and Neo4j connections, builds its own
+    orchestrator and serves Gradio on ``base_port + i``. The read-only model
+    and index pages stay shared copy-on-write between workers. The parent
+    then supervises the workers: one that exits is forked again on the same
+    port, until the parent receives SIGTERM or SIGINT.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes to fork
+    server_name : str, optional
+        Host each worker binds, by default Gradio's default
+    base_port : int, optional
+        Port of the first worker, by default 7860
+
+    Raises
+    ------
+    ConfigurationError
+        If workers is not positive or the platform does not support fork
+
+    Notes
+    -----
+    Gradio keeps per-session state in process memory, so a load balancer in
+    front of the workers must use sticky sessions.
+    """
+    if workers < 1:
+        SystemLogger.error(
+            "Worker count must be positive",
+            context={'workers': workers},
+            fail_fast=False
+        )
+        raise ConfigurationError(f"Invalid worker count: {workers}")
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        SystemLogger.error(
+            "Preforked server mode requires the fork start method",
+            context={'platform': sys.platform},
+            fail_fast=False
+        )
+        raise ConfigurationError(f"fork is not available on {sys.platform}")
+
+    SystemLogger.info("Starting preforked server", {
+        'workers': workers,
+        'server_name': server_name,
+        'ports': [base_port + i for i in range(workers)]
+    })
+
+    preload_shared_resources()
+    reset_database_connections()
+
+    # Move everything loaded so far out of GC tracking so collections in the
+    # workers do not write to (and thereby copy) the shared pages
+    gc.collect()
+    gc.freeze()
+
+    context = multiprocessing.get_context('fork')
+    processes = {}
+    started_at = {}
+    stopping = False
+
+    def _spawn(worker_index):
+        process = context.Process(
+            target=_worker_main,
+            args=(worker_index, server_name, base_port + worker_index),
+            name=f"gradio-worker-{worker_index}"
+        )
+        process.start()
+        processes[worker_index] = process
+        started_at[worker_index] = time.monotonic()
+
+    def _shutdown(signum, frame):
+        nonlocal stopping
+        stopping = True
+        SystemLogger.info("Stopping worker processes", {'signal': signum})
+        for process in list(processes.values()):
+            if process.is_alive():
+                process.terminate()
+
+    for worker_index in range(workers):
+        _spawn(worker_index)
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    while processes:
+        by_sentinel = {process.sentinel: worker_index for worker_index, process in processes.items()}
+        for sentinel in wait(list(by_sentinel)):
+            worker_index = by_sentinel[sentinel]
+            process = processes.pop(worker_index)
+            process.join()
+            uptime = time.monotonic() - started_at[worker_index]
+            SystemLogger.info("Worker process exited", {
+                'worker': process.name,
+                'pid': process.pid,
+                'exit_code': process.exitcode,
+                'uptime_seconds': round(uptime, 3)
+            })
+            if stopping:
+                continue
+
+            # Keep every sticky-session port in service
+            if uptime < WORKER_MIN_UPTIME_SECONDS:
+                time.sleep(WORKER_RESPAWN_DELAY_SECONDS)
+            if stopping:
+                continue
+            SystemLogger.info("Respawning worker process", {
+                'worker_index': worker_index,
+                'server_port': base_port + worker_index
+            })
+            _spawn(worker_index)
@@ -0,0 +1,256 @@
+# In-process course catalog service
+
+import threading
+import time
+from collections import namedtuple
+
+from langsmith import traceable
+from utils.logger import SystemLogger
+from utils.exceptions import DatabaseConnectionError, DatabaseQueryError
+
+NO_COURSE_DATA_MESSAGE = "No course data available in database."
+
+# Immutable view of the catalog; replaced wholesale on refresh so readers never lock
+CatalogSnapshot = namedtuple('CatalogSnapshot', [
+    'version',       # catalog version string, or None if it could not be computed
+    'courses',       # dict: course name -> tuple of (module name, summary)
+    'prompt_text',   # pre-rendered course/module listing for LLM prompts
+    'loaded_at',     # time.monotonic() of the full load
+])
+
+
+def _render_prompt_text(courses):
+    """Render the course/module listing used in agent prompts."""
+    if not courses:
+        return NO_COURSE_DATA_MESSAGE
+
+    parts = []
+    for course_name, modules in courses.items():
+        parts.append(f"**Course: {course_name}**\nModules:\n")
+        for module_name, summary in modules:
+            parts.append(f"- {module_name}: {summary}\n")
+        parts.append("\n")
+    return "".join(parts).strip()
+
+
+class CourseCatalog:
+    """
+    Process-wide cache of ``course_modules_view`` shared by all agents.
+
+    The catalog is read from MySQL once and kept as courses indexed by name,
+    each holding its ordered modules, plus the pre-rendered prompt text the
+    agents embed in their LLM prompts. Once ``ttl_seconds`` have passed, the
+    next read checks the catalog version and reloads only if it changed.
+    Whenever a reload publishes a different (or unknown) version than the
+    previous load, ``on_change`` is called so data derived from the catalog,
+    such as the course vector store, follows it.
+
+    Parameters
+    ----------
+    connection_factory : callable
+        Zero-argument callable returning a MySQLConnector; called on every
+        load so the catalog follows connector resets (e.g. after fork)
+    ttl_seconds : float
+        Seconds between version checks
+    on_change : callable, optional
+        Zero-argument callback invoked after a reload published a new
+        catalog version; runs on the reloading thread, so it should hand
+        slow work off. A failing callback is logged and ignored
+
+    Raises
+    ------
+    DatabaseConnectionError
+        If MySQL is unavailable for the initial load
+    DatabaseQueryError
+        If the initial load fails or yields no valid rows
+    """
+
+    def __init__(self, connection_factory, ttl_seconds, on_change=None):
+        self._connection_factory = connection_factory
+        self._ttl_seconds = ttl_seconds
+        self._on_change = on_change
+        self._refresh_lock = threading.Lock()
+        self._snapshot = None
+        self._checked_at = 0.0
+        # Version of the last load, kept across invalidate() so changes are still detected
+        self._has_loaded = False
+        self._loaded_version = None
+
+    @property
+    def version(self):
+        """Catalog version the current snapshot was loaded at (None if unknown)."""
+        return self._get_snapshot().version
+
+    def get_prompt_text(self):
+        """Return the pre-rendered course/module listing for LLM prompts."""
+        return self._get_snapshot().prompt_text
+
+    def get_course_names(self):
+        """Return course names in catalog order."""
+        return list(self._get_snapshot().courses)
+
+    def get_modules(self, course_name):
+        """Return (module name, summary) pairs for a course, empty if unknown."""
+        return self._get_snapshot().courses.get(course_name, ())
+
+    def get_module_summary(self, course_name, module_name):
+        """Return a module's summary, or None if the course or module is unknown."""
+        for name, summary in self.get_modules(course_name):
+            if name == module_name:
+                return summary
+        return None
+
+    def iter_rows(self):
+        """Yield catalog rows shaped like ``course_modules_view`` results."""
+        for course_name, modules in self._get_snapshot().courses.items():
+            for module_name, summary in modules:
+                yield {
+                    'course_name': course_name,
+                    'module_name': module_name,
+                    'module_summary': summary
+                }
+
+    def invalidate(self):
+        """Drop the cached catalog so the next read reloads it from MySQL."""
+        SystemLogger.info("Invalidating course catalog")
+        with self._refresh_lock:
+            self._snapshot = None
+            self._checked_at = 0.0
+
+    def refresh(self, force=False):
+        """
+        Reload the catalog if its version changed (or unconditionally if forced).
+
+        Parameters
+        ----------
+        force : bool, optional
+            Reload even if the version is unchanged, by default False
+
+        Returns
+        -------
+        bool
+            True if a new snapshot was loaded
+        """
+        with self._refresh_lock:
+            return self._refresh_locked(force)
+
+    def _get_snapshot(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._refresh_lock:
+                if self._snapshot is None:
+                    self._refresh_locked(force=True)
+                return self._snapshot
+
+        if time.monotonic() - self._checked_at >= self._ttl_seconds:
+            # Only one thread checks; the rest keep serving the current snapshot
+            if self._refresh_lock.acquire(blocking=False):
+                try:
+                    self._refresh_locked(force=False)
+                except Exception as e:
+                    self._checked_at = time.monotonic()
+                    SystemLogger.error(
+                        "Course catalog refresh failed - Serving previous snapshot",
+                        exception=e,
+                        context={'catalog_version': snapshot.version},
+                        fail_fast=False
+                    )
+                finally:
+                    self._refresh_lock.release()
+            return self._snapshot
+
+        return snapshot
+
+    def _refresh_locked(self, force):
+        mysql = self._connection_factory()
+        if not mysql:
+            SystemLogger.error(
+                "MySQL connection not available for course catalog - Check database initialization",
+                context={'mysql_connector_available': mysql is not None},
+                fail_fast=False
+            )
+            raise DatabaseConnectionError("MySQL connection not available")
+
+        try:
+            version = mysql.get_catalog_version()
+        except Exception as e:
+            SystemLogger.error(
+                "Could not determine course catalog version - Reloading catalog unconditionally",
+                exception=e,
+                context={'cached_version': self._snapshot.version if self._snapshot else None},
+                fail_fast=False
+            )
+            version = None
+
+        current = self._snapshot
+        if not force and current is not None and version is not None and version == current.version:
+            self._checked_at = time.monotonic()
+            SystemLogger.debug("Course catalog unchanged", {'catalog_version': version})
+            return False
+
+        self._snapshot = self._load(mysql, version)
+        self._checked_at = time.monotonic()
+        changed = self._has_loaded and (version is None or version != self._loaded_version)
+        self._has_loaded, self._loaded_version = True, version
+        if changed and self._on_change is not None:
+            try:
+                self._on_change()
+            except Exception as e:
+                SystemLogger.error(
+                    "Course catalog change callback failed - Derived data may be stale",
+                    exception=e,
+                    context={'catalog_version': version},
+                    fail_fast=False
+                )
+        return True
+
+    @traceable(run_type="tool", name="load_course_catalog")
+    def _load(self, mysql, version):
+        """Read course_modules_view once and build an immutable snapshot."""
+        start_time = time.perf_counter()
+        rows = mysql.get_courses()
+
+        if rows is None:
+            SystemLogger.error(
+                "Course catalog query returned no result - Check course_modules_view",
+                context={'catalog_version': version},
+                fail_fast=False
+            )
+            raise DatabaseQueryError("Course catalog could not be retrieved from MySQL")
+
+        courses = {}
+        skipped = 0
+        for row in rows:
+            if not row or 'course_name' not in row:
+                skipped += 1
+                continue
+            courses.setdefault(row['course_name'], []).append((
+                row.get('module_name') or 'Unknown Module',
+                row.get('module_summary') or 'No summary available'
+            ))
+
+        if rows and not courses:
+            SystemLogger.error(
+                "No valid course data found after processing - Check database schema and data integrity",
+                context={'raw_entries': len(rows)},
+                fail_fast=False
+            )
+            raise DatabaseQueryError("No valid course data found")
+
+        courses = {name: tuple(modules) for name, modules in courses.items()}
+        snapshot = CatalogSnapshot(
+            version=version,
+            courses=courses,
+            prompt_text=_render_prompt_text(courses),
+            loaded_at=time.monotonic()
+        )
+
+        SystemLogger.info("Course catalog loaded", {
+            'catalog_version': version,
+            'unique_courses': len(courses),
+            'total_modules': sum(len(modules) for modules in courses.values()),
+            'skipped_rows': skipped,
+            'prompt_length': len(snapshot.prompt_text),
+            'load_seconds': round(time.perf_counter() - start_time, 3)
+        })
+        return snapshot
@@ -1,19 +1,79 @@
 import os
-import sys
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain.schema import Document
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import FAISS
-from database.mysql_connector import MySQLConnector
+import threading
 from utils.logger import SystemLogger
 from utils.exceptions import (
-    ConfigurationError, DatabaseConnectionError, VectorStoreError
+    ConfigurationError, DatabaseConnectionError, DatabaseQueryError, VectorStoreError
 )
 
+# NOTE: This module must stay cheap to import. Heavy resources (embedding model,
+# vector stores, database connectors, LangSmith client) are built on first use
+# through the accessor functions below and memoised for the rest of the process.
+
 # Set up relative paths
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 PAPERS_DIR = os.path.join(DATA_DIR, "papers")
+VECTOR_CACHE_DIR = os.getenv('VECTOR_CACHE_DIR', os.path.join(DATA_DIR, "cache"))
+PAPER_INDEX_CACHE_DIR = os.path.join(VECTOR_CACHE_DIR, "papers")
+COURSE_INDEX_CACHE_DIR = os.path.join(VECTOR_CACHE_DIR, "courses")
+USER_ANN_INDEX_DIR = os.path.join(VECTOR_CACHE_DIR, "user_ann")
+# Offline collaborative models, published by scripts and loaded read-only when serving
+MODEL_DIR = os.getenv('MODEL_DIR', os.path.join(DATA_DIR, "models"))
+CO_ENROLLMENT_DIR = os.path.join(MODEL_DIR, "co_enrollment")
+COURSE_FACTORS_DIR = os.path.join(MODEL_DIR, "course_factors")
+
+# Lazily initialised resource registry
+_resources = {}
+_resource_locks = {}
+_registry_lock = threading.Lock()
+
+
+def _get_or_create(name, factory):
+    """
+    Return the memoised resource called ``name``, creating it on first use.
+    
+    Each resource has its own lock, so building one resource (for example the
+    embedding model) never blocks callers waiting on an unrelated one.
+    """
+    resource = _resources.get(name)
+    if resource is not None:
+        return resource
+    
+    with _registry_lock:
+        lock = _resource_locks.setdefault(name, threading.Lock())
+    
+    with lock:
+        resource = _resources.get(name)
+        if resource is None:
+            resource = factory()
+            _resources[name] = resource
+        return resource
+
+
+def reset_resource(name):
+    """Drop a memoised resource so the next accessor call rebuilds it."""
+    with _registry_lock:
+        lock = _resource_locks.setdefault(name, threading.Lock())
+    
+    with lock:
+        _resources.pop(name, None)
+
+
+def rebuild_resource(name, factory):
+    """
+    Build a replacement for the resource called ``name`` and publish it.
+    
+    Callers that already hold the old resource, or that read it while the
+    replacement is being built, keep using the old one; the swap is a single
+    dict assignment once the new resource is complete.
+    """
+    with _registry_lock:
+        lock = _resource_locks.setdefault(name, threading.Lock())
+    
+    with lock:
+        resource = factory()
+        _resources[name] = resource
+        return resource
 
 # Database configuration from environment variables
 try:
@@ -82,13 +142,221 @@ except Exception as e:
     )
     raise ConfigurationError(f"Neo4j configuration failed: {e}")
 
-# API Keys - fail fast if not provided
+# User similarity configuration
+SIMILARITY_BACKENDS = ('cache', 'scan', 'neo4j_index', 'ann')
+USER_VECTOR_BACKENDS = ('cohere', 'local')
+VECTOR_STORAGE_ENCODINGS = ('list', 'float16', 'int8')
+ANN_INDEX_TYPES = ('hnsw', 'ivf')
+
 try:
-    cohere_api_key = os.getenv('COHERE_API_KEY')
+    SIMILARITY_BACKEND = os.getenv('SIMILARITY_BACKEND', 'cache').strip().lower()
+    USER_VECTOR_CACHE_REFRESH_SECONDS = float(os.getenv('USER_VECTOR_CACHE_REFRESH_SECONDS', '30'))
+    # cohere embeds user profiles with COHERE_EMBED_MODEL over the network,
+    # local with the in-process EMBEDDING_MODEL_NAME model
+    USER_VECTOR_BACKEND = os.getenv('USER_VECTOR_BACKEND', 'cohere').strip().lower()
+    # Must match the user vector model (embed-english-v3.0 -> 1024, all-MiniLM-L6-v2 -> 384)
+    USER_VECTOR_DIMENSIONS = int(os.getenv(
+        'USER_VECTOR_DIMENSIONS', '384' if USER_VECTOR_BACKEND == 'local' else '1024'
+    ))
+    # Weight floor of the newest interaction in User.profile_vector: the profile is the
+    # plain mean of a user's first 1/decay interactions, then an exponential moving average
+    USER_PROFILE_DECAY = float(os.getenv('USER_PROFILE_DECAY', '0.1'))
+    # How new interaction and profile vectors are stored: list (8 bytes per value),
+    # float16 (2) or int8 (1); reads decode any of them
+    VECTOR_STORAGE_ENCODING = os.getenv('VECTOR_STORAGE_ENCODING', 'list').strip().lower()
+    
+    if SIMILARITY_BACKEND not in SIMILARITY_BACKENDS:
+        SystemLogger.error(
+            f"Invalid similarity backend - Must be one of {', '.join(SIMILARITY_BACKENDS)}",
+            context={'similarity_backend': SIMILARITY_BACKEND}
+        )
+        raise ConfigurationError(f"Invalid similarity backend: {SIMILARITY_BACKEND}")
+    
+    if USER_VECTOR_BACKEND not in USER_VECTOR_BACKENDS:
+        SystemLogger.error(
+            f"Invalid user vector backend - Must be one of {', '.join(USER_VECTOR_BACKENDS)}",
+            context={'user_vector_backend': USER_VECTOR_BACKEND}
+        )
+        raise ConfigurationError(f"Invalid user vector backend: {USER_VECTOR_BACKEND}")
+    
+    # Approximate nearest-neighbour index (SIMILARITY_BACKEND=ann)
+    ANN_INDEX_TYPE = os.getenv('ANN_INDEX_TYPE', 'hnsw').strip().lower()
+    ANN_HNSW_M = int(os.getenv('ANN_HNSW_M', '32'))
+    ANN_HNSW_EF_CONSTRUCTION = int(os.getenv('ANN_HNSW_EF_CONSTRUCTION', '200'))
+    ANN_HNSW_EF_SEARCH = int(os.getenv('ANN_HNSW_EF_SEARCH', '64'))
+    ANN_IVF_NLIST = int(os.getenv('ANN_IVF_NLIST', '1024'))
+    ANN_IVF_NPROBE = int(os.getenv('ANN_IVF_NPROBE', '16'))
+    ANN_PERSIST_SECONDS = float(os.getenv('ANN_PERSIST_SECONDS', '300'))
+    
+    if ANN_INDEX_TYPE not in ANN_INDEX_TYPES:
+        SystemLogger.error(
+            f"Invalid ANN index type - Must be one of {', '.join(ANN_INDEX_TYPES)}",
+            context={'ann_index_type': ANN_INDEX_TYPE}
+        )
+        raise ConfigurationError(f"Invalid ANN index type: {ANN_INDEX_TYPE}")
+    
+    ann_int_settings = {
+        'ANN_HNSW_M': ANN_HNSW_M,
+        'ANN_HNSW_EF_CONSTRUCTION': ANN_HNSW_EF_CONSTRUCTION,
+        'ANN_HNSW_EF_SEARCH': ANN_HNSW_EF_SEARCH,
+        'ANN_IVF_NLIST': ANN_IVF_NLIST,
+        'ANN_IVF_NPROBE': ANN_IVF_NPROBE,
+    }
+    invalid_ann_settings = {k: v for k, v in ann_int_settings.items() if v <= 0}
+    if invalid_ann_settings or ANN_PERSIST_SECONDS < 0:
+        SystemLogger.error(
+            "Invalid ANN index parameters - Counts must be positive and persist interval non-negative",
+            context=dict(invalid_ann_settings, ANN_PERSIST_SECONDS=ANN_PERSIST_SECONDS)
+        )
+        raise ConfigurationError(f"Invalid ANN index parameters: {invalid_ann_settings}")
+    
+    if USER_VECTOR_DIMENSIONS <= 0:
+        SystemLogger.error(
+            "Invalid user vector dimensions - Must be positive",
+            context={'user_vector_dimensions': USER_VECTOR_DIMENSIONS}
+        )
+        raise ConfigurationError(f"Invalid user vector dimensions: {USER_VECTOR_DIMENSIONS}")
+    
+    if VECTOR_STORAGE_ENCODING not in VECTOR_STORAGE_ENCODINGS:
+        SystemLogger.error(
+            f"Invalid vector storage encoding - Must be one of {', '.join(VECTOR_STORAGE_ENCODINGS)}",
+            context={'vector_storage_encoding': VECTOR_STORAGE_ENCODING}
+        )
+        raise ConfigurationError(f"Invalid vector storage encoding: {VECTOR_STORAGE_ENCODING}")
+    
+    if not 0 <= USER_PROFILE_DECAY <= 1:
+        SystemLogger.error(
+            "Invalid user profile decay - Must be between 0 (running mean) and 1 (latest interaction only)",
+            context={'user_profile_decay': USER_PROFILE_DECAY}
+        )
+        raise ConfigurationError(f"Invalid user profile decay: {USER_PROFILE_DECAY}")
+    
+    if USER_VECTOR_CACHE_REFRESH_SECONDS <= 0:
+        SystemLogger.error(
+            "Invalid user vector cache refresh interval - Must be positive",
+            context={'refresh_seconds': USER_VECTOR_CACHE_REFRESH_SECONDS}
+        )
+        raise ConfigurationError(f"Invalid user vector cache refresh interval: {USER_VECTOR_CACHE_REFRESH_SECONDS}")
+    
+except Exception as e:
+    SystemLogger.error(
+        "Failed to load user similarity configuration - Check environment variables",
+        exception=e,
+        context={'initialization_step': 'similarity_configuration'}
+    )
+    raise ConfigurationError(f"Similarity configuration failed: {e}")
+
+# User cohorts: every combination of the profile options the interface offers
+EDUCATION_LEVELS = ("High School", "Undergraduate", "Graduate")
+AGE_GROUPS = ("Under 18", "18-25", "26-40", "40+")
+PROFESSION_TYPES = ("Student", "Professional")
+COHORT_SEARCH_MODES = ('off', 'fallback', 'narrow')
+
+try:
+    # off ignores cohorts, fallback answers from the user's cohort when the full
+    # similarity search fails or is empty, narrow searches the cohort's users first
+    COHORT_SEARCH = os.getenv('COHORT_SEARCH', 'fallback').strip().lower()
+    COHORT_REFRESH_SECONDS = float(os.getenv('COHORT_REFRESH_SECONDS', '600'))
+    # Users closest to each cohort centroid kept as that cohort's search candidates
+    COHORT_TOP_USERS = int(os.getenv('COHORT_TOP_USERS', '200'))
+    COHORT_TOP_COURSES = int(os.getenv('COHORT_TOP_COURSES', '10'))
+    
+    if COHORT_SEARCH not in COHORT_SEARCH_MODES:
+        SystemLogger.error(
+            f"Invalid cohort search mode - Must be one of {', '.join(COHORT_SEARCH_MODES)}",
+            context={'cohort_search': COHORT_SEARCH}
+        )
+        raise ConfigurationError(f"Invalid cohort search mode: {COHORT_SEARCH}")
+    
+    if COHORT_REFRESH_SECONDS <= 0 or COHORT_TOP_USERS <= 0 or COHORT_TOP_COURSES <= 0:
+        SystemLogger.error(
+            "Invalid cohort parameters - Refresh interval and top counts must be positive",
+            context={
+                'refresh_seconds': COHORT_REFRESH_SECONDS,
+                'top_users': COHORT_TOP_USERS,
+                'top_courses': COHORT_TOP_COURSES
+            }
+        )
+        raise ConfigurationError(
+            f"Invalid cohort parameters: refresh={COHORT_REFRESH_SECONDS}, "
+            f"top_users={COHORT_TOP_USERS}, top_courses={COHORT_TOP_COURSES}"
+        )
+    
+except Exception as e:
+    SystemLogger.error(
+        "Failed to load user cohort configuration - Check environment variables",
+        exception=e,
+        context={'initialization_step': 'cohort_configuration'}
+    )
+    raise ConfigurationError(f"Cohort configuration failed: {e}")
+
+# User profile embedding cache (memoises Cohere embeddings of profile text)
+try:
+    USER_EMBEDDING_CACHE_SIZE = int(os.getenv('USER_EMBEDDING_CACHE_SIZE', '4096'))
+    # Optional SQLite file shared by all workers and restarts; empty disables the disk tier
+    USER_EMBEDDING_CACHE_DB = os.getenv('USER_EMBEDDING_CACHE_DB', '').strip()
+    
+    if USER_EMBEDDING_CACHE_SIZE < 0:
+        SystemLogger.error(
+            "Invalid user embedding cache size - Must be zero (disabled) or positive",
+            context={'user_embedding_cache_size': USER_EMBEDDING_CACHE_SIZE}
+        )
+        raise ConfigurationError(f"Invalid user embedding cache size: {USER_EMBEDDING_CACHE_SIZE}")
+    
+except Exception as e:
+    SystemLogger.error(
+        "Failed to load user embedding cache configuration - Check environment variables",
+        exception=e,
+        context={'initialization_step': 'embedding_cache_configuration'}
+    )
+    raise ConfigurationError(f"Embedding cache configuration failed: {e}")
+
+# Offline collaborative models (co-enrollment, course factors)
+try:
+    # Seconds between checks for a newly published model version
+    COLLABORATIVE_MODEL_REFRESH_SECONDS = float(os.getenv('COLLABORATIVE_MODEL_REFRESH_SECONDS', '60'))
+    # Course pairs need this many shared students to count as co-enrolled
+    CO_ENROLLMENT_MIN_SUPPORT = int(os.getenv('CO_ENROLLMENT_MIN_SUPPORT', '2'))
+    # Co-enrolled courses kept per course by the build job
+    CO_ENROLLMENT_TOP_N = int(os.getenv('CO_ENROLLMENT_TOP_N', '20'))
+    
+    if COLLABORATIVE_MODEL_REFRESH_SECONDS < 0:
+        SystemLogger.error(
+            "Invalid collaborative model refresh interval - Must be zero or positive",
+            context={'refresh_seconds': COLLABORATIVE_MODEL_REFRESH_SECONDS}
+        )
+        raise ConfigurationError(f"Invalid collaborative model refresh interval: {COLLABORATIVE_MODEL_REFRESH_SECONDS}")
+    
+    if CO_ENROLLMENT_MIN_SUPPORT <= 0 or CO_ENROLLMENT_TOP_N <= 0:
+        SystemLogger.error(
+            "Invalid co-enrollment parameters - Minimum support and neighbours per course must be positive",
+            context={'min_support': CO_ENROLLMENT_MIN_SUPPORT, 'top_n': CO_ENROLLMENT_TOP_N}
+        )
+        raise ConfigurationError(
+            f"Invalid co-enrollment parameters: min_support={CO_ENROLLMENT_MIN_SUPPORT}, top_n={CO_ENROLLMENT_TOP_N}"
+        )
+    
+except Exception as e:
+    SystemLogger.error(
+        "Failed to load collaborative model configuration - Check environment variables",
+        exception=e,
+        context={'initialization_step': 'collaborative_model_configuration'}
+    )
+    raise ConfigurationError(f"Collaborative model configuration failed: {e}")
+
+# API Keys - validated on first use through validate_api_keys()
+cohere_api_key = os.getenv('COHERE_API_KEY')
+tavily_api_key = os.getenv('TAVILY_API_KEY')
+langsmith_api_key = os.getenv('LANGSMITH_API_KEY')
+langchain_project = os.getenv('LANGCHAIN_PROJECT', 'course-recommendation-system')
+
+
+def _validate_api_keys():
     if not cohere_api_key or not cohere_api_key.strip():
         SystemLogger.error(
             "Cohere API key not configured - Check COHERE_API_KEY environment variable",
-            context={'api_key_provided': bool(cohere_api_key)}
+            context={'api_key_provided': bool(cohere_api_key)},
+            fail_fast=False
         )
         raise ConfigurationError("COHERE_API_KEY not set in environment variables")
         
@@ -96,15 +364,16 @@ try:
     if len(cohere_api_key.strip()) < 20:
         SystemLogger.error(
             "Cohere API key appears too short - Check key format",
-            context={'key_length': len(cohere_api_key.strip())}
+            context={'key_length': len(cohere_api_key.strip())},
+            fail_fast=False
         )
         raise ConfigurationError("Invalid Cohere API key format")
     
-    tavily_api_key = os.getenv('TAVILY_API_KEY')
     if not tavily_api_key or not tavily_api_key.strip():
         SystemLogger.error(
             "Tavily API key not configured - Check TAVILY_API_KEY environment variable",
-            context={'api_key_provided': bool(tavily_api_key)}
+            context={'api_key_provided': bool(tavily_api_key)},
+            fail_fast=False
         )
         raise ConfigurationError("TAVILY_API_KEY not set in environment variables")
         
@@ -112,20 +381,37 @@ try:
     if len(tavily_api_key.strip()) < 20:
         SystemLogger.error(
             "Tavily API key appears too short - Check key format",
-            context={'key_length': len(tavily_api_key.strip())}
+            context={'key_length': len(tavily_api_key.strip())},
+            fail_fast=False
         )
         raise ConfigurationError("Invalid Tavily API key format")
     
-    # LangSmith configuration - MANDATORY for system observability
-    langsmith_api_key = os.getenv('LANGSMITH_API_KEY')
-    langchain_project = os.getenv('LANGCHAIN_PROJECT', 'course-recommendation-system')
-    # Initialize client variable for module-level access
-    langsmith_client = None
+    SystemLogger.info("API keys validated successfully", {
+        'cohere_key_length': len(cohere_api_key.strip()),
+        'tavily_key_length': len(tavily_api_key.strip())
+    })
+    return True
+
+
+def validate_api_keys():
+    """
+    Validate the Cohere and Tavily API keys once per process.
     
+    Raises
+    ------
+    ConfigurationError
+        If a required API key is missing or malformed
+    """
+    return _get_or_create('api_keys_validated', _validate_api_keys)
+
+
+def _create_langsmith_client():
+    # LangSmith configuration - MANDATORY for system observability
     if not langsmith_api_key or not langsmith_api_key.strip():
         SystemLogger.error(
             "LangSmith API key not configured - Required for system observability",
-            context={'api_key_provided': bool(langsmith_api_key)}
+            context={'api_key_provided': bool(langsmith_api_key)},
+            fail_fast=False
         )
         raise ConfigurationError("LANGSMITH_API_KEY not set in environment variables")
     
@@ -143,15 +429,14 @@ try:
     try:
         from langsmith import Client as LangSmithClient
         # Create verified LangSmith client for use throughout the system
-        langsmith_client = LangSmithClient()
-        # Test connection by attempting to get current user/organization info
-        SystemLogger.debug("Testing LangSmith client connection")
+        client = LangSmithClient()
         SystemLogger.info("LangSmith tracing configured and verified successfully", {
             'tracing_enabled': True,
             'project_name': langchain_project,
             'api_key_length': len(langsmith_api_key.strip()),
             'client_verified': True
         })
+        return client
     except Exception as client_error:
         SystemLogger.error(
             "LangSmith client verification failed - Check API key and network connectivity",
@@ -159,32 +444,40 @@ try:
             context={
                 'project_name': langchain_project,
                 'api_key_length': len(langsmith_api_key.strip())
-            }
+            },
+            fail_fast=False
         )
         raise ConfigurationError(f"LangSmith client verification failed: {client_error}")
+
+
+def get_langsmith_client():
+    """
+    Configure LangSmith tracing and return the shared client.
     
-    SystemLogger.info("API keys validated successfully", {
-        'cohere_key_length': len(cohere_api_key.strip()),
-        'tavily_key_length': len(tavily_api_key.strip()),
-        'langsmith_key_length': len(langsmith_api_key.strip())
-    })
+    Sets the tracing environment variables on first call so that all
+    subsequent LangChain/LangGraph operations are traced.
     
-except ConfigurationError as e:
-    SystemLogger.error(
-        "API key configuration failed - Application cannot start",
-        exception=e,
-        context={'initialization_step': 'api_key_validation'}
-    )
-    print(f"ERROR: {e}")
-    sys.exit(1)
-except Exception as e:
-    SystemLogger.error(
-        "Unexpected error during API key validation",
-        exception=e,
-        context={'initialization_step': 'api_key_validation'}
-    )
-    print(f"ERROR: Unexpected API key validation failure: {e}")
-    sys.exit(1)
+    Returns
+    -------
+    langsmith.Client
+        Verified LangSmith client
+        
+    Raises
+    ------
+    ConfigurationError
+        If LANGSMITH_API_KEY is missing or the client cannot be created
+    """
+    return _get_or_create('langsmith_client', _create_langsmith_client)
+
+
+def close_cohere_client(client):
+    """
+    Close the HTTP connection pool of a ``cohere.Client``.
+    
+    The SDK only exposes this through the client's context manager exit.
+    """
+    if client is not None:
+        client.__exit__(None, None, None)
 
 # Model configuration (now configurable via env)
 try:
@@ -209,11 +502,17 @@ try:
             )
             raise ConfigurationError(f"{model_name} cannot be empty")
     
+    # Recorded on every interaction and profile; similarity only compares vectors of one model
+    USER_VECTOR_MODEL = EMBEDDING_MODEL_NAME if USER_VECTOR_BACKEND == 'local' else COHERE_EMBED_MODEL
+    # Vectors stored before the model was recorded were all embedded by Cohere
+    UNTAGGED_USER_VECTOR_MODEL = COHERE_EMBED_MODEL
+    
     SystemLogger.info("Model configurations loaded successfully", {
         'cohere_embed_model': COHERE_EMBED_MODEL,
         'cohere_generate_model': COHERE_GENERATE_MODEL,
         'cohere_chat_model': COHERE_CHAT_MODEL,
-        'embedding_model_name': EMBEDDING_MODEL_NAME
+        'embedding_model_name': EMBEDDING_MODEL_NAME,
+        'user_vector_model': USER_VECTOR_MODEL
     })
     
 except Exception as e:
@@ -224,49 +523,131 @@ except Exception as e:
     )
     raise ConfigurationError(f"Model configuration failed: {e}")
 
-# Embedding & Splitter (now configurable)
+# Text splitter configuration
 try:
-    SystemLogger.debug("Initializing HuggingFace embeddings model")
-    EMBED_MODEL = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL_NAME)
+    CHUNK_SIZE = int(os.getenv('CHUNK_SIZE', '500'))
+    CHUNK_OVERLAP = int(os.getenv('CHUNK_OVERLAP', '50'))
     
-    SystemLogger.debug("Initializing text splitter")
-    chunk_size = int(os.getenv('CHUNK_SIZE', '500'))
-    chunk_overlap = int(os.getenv('CHUNK_OVERLAP', '50'))
-    
-    if chunk_size <= 0 or chunk_size > 10000:
+    if CHUNK_SIZE <= 0 or CHUNK_SIZE > 10000:
         SystemLogger.error(
             "Invalid chunk size - Must be between 1 and 10000",
-            context={'chunk_size': chunk_size}
+            context={'chunk_size': CHUNK_SIZE}
         )
-        raise ConfigurationError(f"Invalid chunk size: {chunk_size}")
+        raise ConfigurationError(f"Invalid chunk size: {CHUNK_SIZE}")
         
-    if chunk_overlap < 0 or chunk_overlap >= chunk_size:
+    if CHUNK_OVERLAP < 0 or CHUNK_OVERLAP >= CHUNK_SIZE:
         SystemLogger.error(
             "Invalid chunk overlap - Must be between 0 and chunk_size",
-            context={'chunk_overlap': chunk_overlap, 'chunk_size': chunk_size}
+            context={'chunk_overlap': CHUNK_OVERLAP, 'chunk_size': CHUNK_SIZE}
         )
-        raise ConfigurationError(f"Invalid chunk overlap: {chunk_overlap}")
+        raise ConfigurationError(f"Invalid chunk overlap: {CHUNK_OVERLAP}")
     
-    SPLITTER = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+except Exception as e:
+    SystemLogger.error(
+        "Failed to load text splitter configuration - Check environment variables",
+        exception=e,
+        context={'initialization_step': 'splitter_configuration'}
+    )
+    raise ConfigurationError(f"Splitter configuration failed: {e}")
+
+# Course catalog configuration
+try:
+    CATALOG_TTL_SECONDS = float(os.getenv('CATALOG_TTL_SECONDS', '300'))
     
-    SystemLogger.info("Embedding model and text splitter initialized successfully", {
-        'embedding_model': EMBEDDING_MODEL_NAME,
-        'chunk_size': chunk_size,
-        'chunk_overlap': chunk_overlap
-    })
+    if CATALOG_TTL_SECONDS < 0:
+        SystemLogger.error(
+            "Invalid catalog TTL - Must be zero or positive",
+            context={'catalog_ttl_seconds': CATALOG_TTL_SECONDS}
+        )
+        raise ConfigurationError(f"Invalid catalog TTL: {CATALOG_TTL_SECONDS}")
     
 except Exception as e:
     SystemLogger.error(
-        "Failed to initialize embedding model or text splitter",
+        "Failed to load course catalog configuration - Check environment variables",
         exception=e,
-        context={'embedding_model_name': EMBEDDING_MODEL_NAME}
+        context={'initialization_step': 'catalog_configuration'}
     )
-    raise ConfigurationError(f"Embedding/splitter initialization failed: {e}")
+    raise ConfigurationError(f"Catalog configuration failed: {e}")
+
+# Research paper hot reload configuration
+try:
+    PAPER_WATCH_INTERVAL_SECONDS = float(os.getenv('PAPER_WATCH_INTERVAL_SECONDS', '0'))
+    
+    if PAPER_WATCH_INTERVAL_SECONDS < 0:
+        SystemLogger.error(
+            "Invalid paper watch interval - Must be zero (disabled) or positive",
+            context={'paper_watch_interval_seconds': PAPER_WATCH_INTERVAL_SECONDS}
+        )
+        raise ConfigurationError(f"Invalid paper watch interval: {PAPER_WATCH_INTERVAL_SECONDS}")
+    
+except Exception as e:
+    SystemLogger.error(
+        "Failed to load paper watcher configuration - Check environment variables",
+        exception=e,
+        context={'initialization_step': 'paper_watch_configuration'}
+    )
+    raise ConfigurationError(f"Paper watcher configuration failed: {e}")
+
+
+def _create_embed_model():
+    try:
+        SystemLogger.debug("Initializing HuggingFace embeddings model")
+        from langchain_community.embeddings import HuggingFaceEmbeddings
+        embed_model = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL_NAME)
+        SystemLogger.info("Embedding model initialized successfully", {
+            'embedding_model': EMBEDDING_MODEL_NAME
+        })
+        return embed_model
+    except Exception as e:
+        SystemLogger.error(
+            "Failed to initialize embedding model",
+            exception=e,
+            context={'embedding_model_name': EMBEDDING_MODEL_NAME},
+            fail_fast=False
+        )
+        raise ConfigurationError(f"Embedding model initialization failed: {e}")
 
-# Database connection singletons
-_mysql_connector = None
-_neo4j_connector = None
 
+def get_embed_model():
+    """
+    Get the shared HuggingFace embedding model, loading it on first use.
+    
+    Returns
+    -------
+    HuggingFaceEmbeddings
+        Embedding model named by EMBEDDING_MODEL_NAME
+        
+    Raises
+    ------
+    ConfigurationError
+        If the model cannot be loaded
+    """
+    return _get_or_create('embed_model', _create_embed_model)
+
+
+def _create_splitter():
+    SystemLogger.debug("Initializing text splitter")
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    SystemLogger.info("Text splitter initialized successfully", {
+        'chunk_size': CHUNK_SIZE,
+        'chunk_overlap': CHUNK_OVERLAP
+    })
+    return splitter
+
+
+def get_splitter():
+    """
+    Get the shared text splitter used to chunk research papers.
+    
+    Returns
+    -------
+    RecursiveCharacterTextSplitter
+        Splitter configured with CHUNK_SIZE and CHUNK_OVERLAP
+    """
+    return _get_or_create('splitter', _create_splitter)
+
+# Database connection singletons
 def get_mysql_connection():
     """
     Get singleton MySQL database connector with connection pooling.
@@ -294,11 +675,11 @@ def get_mysql_connection():
     """
     SystemLogger.debug("Acquiring MySQL connection singleton")
     
-    global _mysql_connector
-    if _mysql_connector is None:
+    def _create_mysql_connector():
         try:
             SystemLogger.debug("Creating new MySQL connector instance")
-            _mysql_connector = MySQLConnector(
+            from database.mysql_connector import MySQLConnector
+            connector = MySQLConnector(
                 host=MYSQL_HOST,
                 database=MYSQL_DATABASE,
                 user=MYSQL_USER,
@@ -310,6 +691,7 @@ def get_mysql_connection():
                 'database': MYSQL_DATABASE,
                 'pool_size': MYSQL_POOL_SIZE
             })
+            return connector
         except Exception as e:
             SystemLogger.error(
                 "Failed to create MySQL connector singleton - Check database configuration",
@@ -323,8 +705,7 @@ def get_mysql_connection():
             )
             raise DatabaseConnectionError(f"MySQL connector creation failed: {e}")
     
-    SystemLogger.debug("Returning existing MySQL connector singleton")
-    return _mysql_connector
+    return _get_or_create('mysql_connector', _create_mysql_connector)
 
 def get_neo4j_connection():
     """
@@ -353,17 +734,17 @@ def get_neo4j_connection():
     """
     SystemLogger.debug("Acquiring Neo4j connection singleton")
     
-    global _neo4j_connector
-    if _neo4j_connector is None:
+    def _create_neo4j_connector():
         try:
             SystemLogger.debug("Creating new Neo4j connector instance")
             from database.neo4j_connector import Neo4jConnector
-            _neo4j_connector = Neo4jConnector()
+            connector = Neo4jConnector()
             
             SystemLogger.info("Neo4j connector singleton created successfully", {
                 'uri': neo4j_uri,
                 'user': neo4j_user
             })
+            return connector
         except Exception as e:
             SystemLogger.error(
                 "Failed to create Neo4j connector singleton - Check database configuration",
@@ -375,105 +756,186 @@ def get_neo4j_connection():
             )
             raise DatabaseConnectionError(f"Neo4j connector creation failed: {e}")
     
-    SystemLogger.debug("Returning existing Neo4j connector singleton")
-    return _neo4j_connector
+    return _get_or_create('neo4j_connector', _create_neo4j_connector)
 
-def _load_course_vector_store():
-    """Load course data from MySQL and create FAISS vector store."""
-    SystemLogger.debug("Loading course data from MySQL to create FAISS vector store")
-    
+def _create_course_catalog():
+    from core.catalog import CourseCatalog
+    return CourseCatalog(get_mysql_connection, CATALOG_TTL_SECONDS, on_change=_on_course_catalog_change)
+
+
+def _on_course_catalog_change():
+    """Rebuild a course vector store built from an older catalog version, off the calling thread."""
+    if _resources.get('course_vector_store') is None:
+        # Not built yet; the first access loads the current version
+        return
+    threading.Thread(
+        target=_reload_course_vector_store_in_background, name="course-vector-store-reload", daemon=True
+    ).start()
+
+
+def _reload_course_vector_store_in_background():
     try:
-        # Get MySQL connection
-        mysql_connector = get_mysql_connection()
-        
-        if not mysql_connector:
-            SystemLogger.error(
-                "MySQL connector not available for course vector store loading",
-                context={'mysql_connector_available': mysql_connector is not None}
-            )
-            raise DatabaseConnectionError("MySQL connector not available")
-        
-        SystemLogger.debug("Fetching course data from MySQL")
-        courses_data = mysql_connector.get_courses()
-        
-        if not courses_data:
-            SystemLogger.info("No course data found in MySQL - creating empty vector store", {
-                'courses_returned': len(courses_data) if courses_data else 0
-            })
-            # Create empty vector store for graceful degradation
-            return FAISS.from_documents([
-                Document(page_content="No courses available", metadata={"source": "empty_fallback"})
-            ], EMBED_MODEL)
+        reload_course_vector_store()
+    except Exception as e:
+        SystemLogger.error(
+            "Course vector store reload after catalog change failed - Keeping previous store",
+            exception=e,
+            context={'initialization_step': 'course_vector_store'},
+            fail_fast=False
+        )
+
+
+def get_course_catalog():
+    """
+    Get the shared in-process course catalog.
+    
+    The catalog reads ``course_modules_view`` once per process and is the
+    single source of course data for the agents and the course vector store.
+    Call ``invalidate()`` or ``refresh()`` on it to pick up catalog changes
+    before the TTL expires; a new catalog version also reloads the course
+    vector store in the background.
+    
+    Returns
+    -------
+    CourseCatalog
+        Shared catalog instance (data is loaded on first read)
         
-        SystemLogger.debug("Converting course data to Document format", {
-            'total_courses': len(courses_data)
+    Examples
+    --------
+    >>> catalog = get_course_catalog()
+    >>> prompt_courses = catalog.get_prompt_text()
+    """
+    return _get_or_create('course_catalog', _create_course_catalog)
+
+def _build_course_vector_store(courses_data):
+    """Create FAISS vector store from course_modules_view rows."""
+    from langchain.schema import Document
+    from langchain_community.vectorstores import FAISS
+    
+    embed_model = get_embed_model()
+    
+    if not courses_data:
+        SystemLogger.info("No course data found in MySQL - creating empty vector store", {
+            'courses_returned': len(courses_data) if courses_data else 0
         })
-        
-        # Convert to Document format for FAISS
-        documents = []
-        processed_count = 0
-        error_count = 0
-        
-        for i, row in enumerate(courses_data):
-            try:
-                if not row or not isinstance(row, dict):
-                    SystemLogger.debug(f"Skipping invalid course data row {i}", {
-                        'row_type': type(row), 'row_data': row
-                    })
-                    error_count += 1
-                    continue
-                
-                # Validate required fields
-                required_fields = ['course_name', 'module_name', 'module_summary']
-                missing_fields = [field for field in required_fields if field not in row or not row[field]]
-                if missing_fields:
-                    SystemLogger.debug(f"Skipping course row {i} with missing fields", {
-                        'missing_fields': missing_fields, 'row_data': row
-                    })
-                    error_count += 1
-                    continue
-                
-                page_content = f"Course Title: {row['course_name']}\nModule: {row['module_name']}\nSummary: {row['module_summary']}"
-                documents.append(Document(
-                    page_content=page_content,
-                    metadata={"source": "impel_mysql", "course": row['course_name'], "module": row['module_name']}
-                ))
-                processed_count += 1
-                
-            except Exception as row_error:
-                SystemLogger.error(
-                    f"Error processing course data row {i}",
-                    exception=row_error,
-                    context={'row_index': i, 'row_data': row}
-                )
+        # Create empty vector store for graceful degradation
+        return FAISS.from_documents([
+            Document(page_content="No courses available", metadata={"source": "empty_fallback"})
+        ], embed_model)
+    
+    SystemLogger.debug("Converting course data to Document format", {
+        'total_courses': len(courses_data)
+    })
+    
+    # Convert to Document format for FAISS
+    documents = []
+    processed_count = 0
+    error_count = 0
+    
+    for i, row in enumerate(courses_data):
+        try:
+            if not row or not isinstance(row, dict):
+                SystemLogger.debug(f"Skipping invalid course data row {i}", {
+                    'row_type': type(row), 'row_data': row
+                })
                 error_count += 1
                 continue
-        
-        if not documents:
+            
+            # Validate required fields
+            required_fields = ['course_name', 'module_name', 'module_summary']
+            missing_fields = [field for field in required_fields if field not in row or not row[field]]
+            if missing_fields:
+                SystemLogger.debug(f"Skipping course row {i} with missing fields", {
+                    'missing_fields': missing_fields, 'row_data': row
+                })
+                error_count += 1
+                continue
+            
+            page_content = f"Course Title: {row['course_name']}\nModule: {row['module_name']}\nSummary: {row['module_summary']}"
+            documents.append(Document(
+                page_content=page_content,
+                metadata={"source": "impel_mysql", "course": row['course_name'], "module": row['module_name']}
+            ))
+            processed_count += 1
+            
+        except Exception as row_error:
             SystemLogger.error(
-                "No valid documents created from course data - All rows had errors",
-                context={'total_rows': len(courses_data), 'error_count': error_count}
+                f"Error processing course data row {i}",
+                exception=row_error,
+                context={'row_index': i, 'row_data': row}
             )
-            # Create empty vector store as fallback
-            return FAISS.from_documents([
-                Document(page_content="No valid courses available", metadata={"source": "error_fallback"})
-            ], EMBED_MODEL)
+            error_count += 1
+            continue
+    
+    if not documents:
+        SystemLogger.error(
+            "No valid documents created from course data - All rows had errors",
+            context={'total_rows': len(courses_data), 'error_count': error_count}
+        )
+        # Create empty vector store as fallback
+        return FAISS.from_documents([
+            Document(page_content="No valid courses available", metadata={"source": "error_fallback"})
+        ], embed_model)
+    
+    SystemLogger.debug("Creating FAISS vector store from documents")
+    
+    # Create and return FAISS vector store
+    vector_store = FAISS.from_documents(documents, embed_model)
+    
+    SystemLogger.info("Course vector store created successfully", {
+        'total_documents': len(documents),
+        'processed_successfully': processed_count,
+        'processing_errors': error_count,
+        'embedding_model': EMBEDDING_MODEL_NAME
+    })
+    
+    return vector_store
+
+def _load_course_vector_store():
+    """
+    Load the course FAISS vector store, rebuilding it only when the catalog changed.
+    
+    The persisted store is keyed by the version of the shared course catalog
+    and the embedding model name, so restarts and additional workers load the
+    store from disk instead of re-embedding every module summary. Course rows
+    come from the catalog rather than a separate MySQL read.
+    """
+    SystemLogger.debug("Loading course vector store from shared course catalog")
+    
+    from langchain.schema import Document
+    from langchain_community.vectorstores import FAISS
+    from utils.vector_store_cache import compute_fingerprint, load_or_build_faiss
+    
+    embed_model = get_embed_model()
+    
+    try:
+        catalog = get_course_catalog()
         
-        SystemLogger.debug("Creating FAISS vector store from documents")
+        def _build_from_catalog():
+            SystemLogger.debug("Building course vector store from shared course catalog")
+            return _build_course_vector_store(list(catalog.iter_rows()))
         
-        # Create and return FAISS vector store
-        vector_store = FAISS.from_documents(documents, EMBED_MODEL)
+        catalog_version = catalog.version
+        if catalog_version is None:
+            SystemLogger.info("Course catalog version unknown - Building course vector store without cache", {
+                'cache_dir': COURSE_INDEX_CACHE_DIR
+            })
+            return _build_from_catalog()
         
-        SystemLogger.info("Course vector store created successfully", {
-            'total_documents': len(documents),
-            'processed_successfully': processed_count,
-            'processing_errors': error_count,
-            'embedding_model': EMBEDDING_MODEL_NAME
+        fingerprint = compute_fingerprint([catalog_version, EMBEDDING_MODEL_NAME])
+        SystemLogger.debug("Resolved course catalog version", {
+            'catalog_version': catalog_version, 'fingerprint': fingerprint
         })
         
-        return vector_store
+        return load_or_build_faiss(
+            cache_dir=COURSE_INDEX_CACHE_DIR,
+            fingerprint=fingerprint,
+            embed_model=embed_model,
+            build_fn=_build_from_catalog,
+            label="course vector store"
+        )
     
-    except (DatabaseConnectionError, VectorStoreError) as e:
+    except (DatabaseConnectionError, DatabaseQueryError, VectorStoreError) as e:
         SystemLogger.error(
             "Database or vector store error loading course data",
             exception=e,
@@ -482,7 +944,7 @@ def _load_course_vector_store():
         # Create fallback vector store to prevent total system failure
         return FAISS.from_documents([
             Document(page_content="Course data unavailable due to database error", metadata={"source": "db_error_fallback"})
-        ], EMBED_MODEL)
+        ], embed_model)
     except Exception as e:
         SystemLogger.error(
             "Unexpected error loading course vector store - Using fallback",
@@ -492,20 +954,173 @@ def _load_course_vector_store():
         # Create fallback vector store to prevent total system failure
         return FAISS.from_documents([
             Document(page_content="Course data unavailable due to system error", metadata={"source": "system_error_fallback"})
-        ], EMBED_MODEL)
+        ], embed_model)
 
-# Initialize course vector store
-try:
-    SystemLogger.debug("Initializing global course vector store")
-    COURSE_VS = _load_course_vector_store()
-    SystemLogger.info("Course vector store initialized successfully")
-except Exception as e:
-    SystemLogger.error(
-        "Failed to initialize course vector store - System may not function properly",
-        exception=e,
-        context={'initialization_step': 'global_course_vs'}
-    )
-    # Create absolute fallback to prevent import errors
-    COURSE_VS = FAISS.from_documents([
-        Document(page_content="System initialization error", metadata={"source": "init_error_fallback"})
-    ], EMBED_MODEL)
+def get_course_vector_store():
+    """
+    Get the shared course FAISS vector store, loading or building it on first use.
+    
+    Returns
+    -------
+    FAISS
+        Vector store over IMPEL course module summaries (or a single-document
+        fallback store if the catalog could not be loaded)
+        
+    Examples
+    --------
+    >>> course_vs = get_course_vector_store()
+    >>> recs = course_vs.similarity_search("machine learning", k=3)
+    """
+    return _get_or_create('course_vector_store', _load_course_vector_store)
+
+
+def reload_course_vector_store():
+    """
+    Rebuild the shared course vector store for the current catalog and swap it in.
+    
+    The store is loaded from the version-keyed cache (or built) while readers
+    keep using the current one.
+    
+    Returns
+    -------
+    FAISS
+        Newly published course vector store
+    """
+    SystemLogger.info("Reloading shared course vector store")
+    return rebuild_resource('course_vector_store', _load_course_vector_store)
+
+
+def reset_course_vector_store():
+    """Invalidate the shared course vector store so the next access reloads it."""
+    SystemLogger.info("Invalidating shared course vector store")
+    reset_resource('course_vector_store')
+
+
+def _load_paper_vector_store():
+    from utils.data_loaders import load_research_paper_index
+    return load_research_paper_index(PAPERS_DIR, get_embed_model())
+
+
+def get_paper_vector_store():
+    """
+    Get the shared research paper FAISS vector store, loading it on first use.
+    
+    Returns
+    -------
+    FAISS
+        Vector store over chunked research papers in PAPERS_DIR
+        
+    Raises
+    ------
+    FileProcessingError
+        If the papers directory cannot be read or contains no loadable PDFs
+    VectorStoreError
+        If the index cannot be built
+    """
+    return _get_or_create('paper_vector_store', _load_paper_vector_store)
+
+
+def reload_paper_vector_store():
+    """
+    Rebuild the shared research paper vector store from PAPERS_DIR and swap it in.
+    
+    The new store is built (or loaded from the on-disk cache if the PDFs are
+    unchanged) while readers keep using the current one.
+    
+    Returns
+    -------
+    FAISS
+        Newly published research paper vector store
+        
+    Raises
+    ------
+    FileProcessingError
+        If the papers directory cannot be read or contains no loadable PDFs
+    VectorStoreError
+        If the index cannot be built
+    """
+    SystemLogger.info("Reloading shared research paper vector store", {'papers_dir': PAPERS_DIR})
+    return rebuild_resource('paper_vector_store', _load_paper_vector_store)
+
+
+def _create_co_enrollment_index():
+    from database.co_enrollment import CoEnrollmentIndex
+    return CoEnrollmentIndex(CO_ENROLLMENT_DIR, COLLABORATIVE_MODEL_REFRESH_SECONDS)
+
+
+def get_co_enrollment_index():
+    """
+    Get the shared co-enrollment model handle.
+    
+    The model itself is built offline by ``scripts/build_co_enrollment.py``
+    and loaded from CO_ENROLLMENT_DIR on first lookup; newly published
+    versions are picked up every COLLABORATIVE_MODEL_REFRESH_SECONDS.
+    
+    Returns
+    -------
+    CoEnrollmentIndex
+        "Students who took X also took Y" lookups (empty until a model is published)
+    """
+    return _get_or_create('co_enrollment_index', _create_co_enrollment_index)
+
+
+def _create_course_factor_index():
+    from database.course_factors import CourseFactorIndex
+    return CourseFactorIndex(COURSE_FACTORS_DIR, COLLABORATIVE_MODEL_REFRESH_SECONDS)
+
+
+def get_course_factor_index():
+    """
+    Get the shared matrix factorisation model handle.
+    
+    Factors are trained offline by ``scripts/train_course_factors.py`` and
+    memory-mapped from COURSE_FACTORS_DIR on first lookup; versions from
+    later training runs are picked up every COLLABORATIVE_MODEL_REFRESH_SECONDS.
+    
+    Returns
+    -------
+    CourseFactorIndex
+        Top-N course scoring per user (empty until a model is published)
+    """
+    return _get_or_create('course_factor_index', _create_course_factor_index)
+
+
+def reset_database_connections():
+    """
+    Close and forget the shared MySQL and Neo4j connectors.
+    
+    Used around ``fork()``: the parent closes its sockets before forking and
+    each worker process then opens its own connections on first use instead
+    of sharing inherited ones.
+    """
+    for name in ('mysql_connector', 'neo4j_connector'):
+        connector = _resources.get(name)
+        reset_resource(name)
+        if connector is None:
+            continue
+        try:
+            connector.close()
+        except Exception as e:
+            SystemLogger.error(
+                f"Failed to close shared connector: {name}",
+                exception=e,
+                context={'connector': name},
+                fail_fast=False
+            )
+    SystemLogger.debug("Shared database connectors reset")
+
+
+# Backwards-compatible lazy access to the former module-level resources
+_LEGACY_RESOURCE_ACCESSORS = {
+    'EMBED_MODEL': get_embed_model,
+    'SPLITTER': get_splitter,
+    'COURSE_VS': get_course_vector_store,
+    'langsmith_client': get_langsmith_client,
+}
+
+
+def __getattr__(name):
+    accessor = _LEGACY_RESOURCE_ACCESSORS.get(name)
+    if accessor is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return accessor()
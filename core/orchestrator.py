@@ -1,7 +1,10 @@
 # LangGraph Workflow with LangSmith Integration
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 import cohere
-from langgraph.graph import StateGraph
+from langgraph.graph import StateGraph, END
 from langsmith import traceable
 try:
     # Import wait_for_all_tracers to ensure traces are submitted before process exit
@@ -9,17 +12,22 @@ try:
     LANGSMITH_WAIT_AVAILABLE = True
 except ImportError:
     LANGSMITH_WAIT_AVAILABLE = False
-from core.config import cohere_api_key, COHERE_GENERATE_MODEL, get_neo4j_connection
+from core.config import (
+    cohere_api_key, COHERE_GENERATE_MODEL, get_neo4j_connection,
+    validate_api_keys, get_langsmith_client, get_course_catalog, reload_course_vector_store,
+    reload_paper_vector_store, close_cohere_client, PAPERS_DIR, PAPER_WATCH_INTERVAL_SECONDS
+)
 from agents.database_agent import DatabaseAgent
 from agents.collaborative_agent import CollaborativeAgent
 from agents.content_agent import ContentAgent
 from utils.logger import SystemLogger
+from utils.paper_watcher import PaperCorpusWatcher
 from utils.exceptions import (
     DatabaseConnectionError, APIRequestError, AgentExecutionError, 
     ConfigurationError, WorkflowError
 )
 
-# LangSmith tracing is configured automatically via environment variables in config.py
+# LangSmith tracing is configured via get_langsmith_client() when the orchestrator is built
 # All LangChain/LangGraph operations will be automatically traced
 
 
@@ -40,6 +48,26 @@ def _finalize_langsmith_traces():
         SystemLogger.debug("LangSmith wait_for_all_tracers not available - traces may be incomplete")
 
 
+def _format_startup_timings(timings, critical_path, total_seconds):
+    """Render component startup timings as a fixed-width table."""
+    lines = [f"{'component':<22}{'start s':>9}{'duration s':>12}  critical path"]
+    for timing in sorted(timings, key=lambda t: t['seconds'], reverse=True):
+        marker = "  <--" if timing['component'] == critical_path else ""
+        lines.append(
+            f"{timing['component']:<22}{timing['started_at']:>9.3f}{timing['seconds']:>12.3f}{marker}"
+        )
+    lines.append(f"{'total (wall clock)':<22}{0.0:>9.3f}{total_seconds:>12.3f}")
+    return "\n".join(lines)
+
+
+# Agent node that handles each routable intent in the compiled workflow
+_AGENT_NODES_BY_INTENT = {
+    "recommendation": "generate_recs",
+    "database_lookup": "run_database_agent",
+    "content_analysis": "run_content_agent",
+}
+
+
 class RecommendationSystem:
     """
     Orchestrates different AI agents based on user query intent classification.
@@ -51,8 +79,9 @@ class RecommendationSystem:
     
     Attributes
     ----------
-    workflow : StateGraph
-        LangGraph workflow for state management
+    workflow : CompiledGraph
+        Compiled LangGraph workflow that classifies intent and routes to the
+        matching agent branch, built once and reused for every request
     neo4j : Neo4jConnector
         Neo4j database connection for user interactions
     cohere_client : cohere.Client
@@ -63,6 +92,8 @@ class RecommendationSystem:
         Agent for collaborative filtering recommendations
     content_agent : ContentAgent
         Agent for content-based analysis and web search
+    startup_timings : list of dict
+        Per-component initialization timings recorded during construction
         
     Raises
     ------
@@ -76,10 +107,15 @@ class RecommendationSystem:
 
     def __init__(self):
         SystemLogger.info("Initializing RecommendationSystem orchestrator")
+        # Requests inside handle_user_query, so close() can wait for them to drain
+        self._active_requests = 0
+        self._requests_idle = threading.Condition()
 
         try:
-            # LangSmith tracing is already validated and configured in config.py
-            SystemLogger.debug("LangSmith tracing already configured via config.py")
+            # Validate API keys and enable LangSmith tracing before any traced call
+            SystemLogger.debug("Validating API keys and configuring LangSmith tracing")
+            validate_api_keys()
+            get_langsmith_client()
 
             # Validate API key before proceeding
             if not cohere_api_key or not cohere_api_key.strip():
@@ -89,14 +125,18 @@ class RecommendationSystem:
                 )
                 raise ConfigurationError("Cohere API key not configured")
 
-            # Initialize workflow graph
-            SystemLogger.debug("Initializing LangGraph StateGraph")
-            self.workflow = StateGraph(dict)
-
-            # Initialize database connections
-            SystemLogger.debug("Acquiring Neo4j connection for orchestrator")
-            self.neo4j = get_neo4j_connection()
+            # Initialize independent components concurrently; each one blocks on
+            # its own network round-trips or model/index loading
+            SystemLogger.debug("Initializing orchestrator components concurrently")
+            components = self._initialize_components({
+                'neo4j_connection': get_neo4j_connection,
+                'cohere_client': lambda: cohere.Client(cohere_api_key),
+                'database_agent': DatabaseAgent,
+                'collaborative_agent': CollaborativeAgent,
+                'content_agent': lambda: ContentAgent(cohere_key=cohere_api_key),
+            })
 
+            self.neo4j = components['neo4j_connection']
             if not self.neo4j:
                 SystemLogger.error(
                     "Neo4j connection not available for RecommendationSystem",
@@ -104,15 +144,14 @@ class RecommendationSystem:
                 )
                 raise DatabaseConnectionError("Neo4j connection not available")
 
-            # Initialize Cohere client
-            SystemLogger.debug("Initializing Cohere client for orchestrator")
-            self.cohere_client = cohere.Client(cohere_api_key)
+            self.cohere_client = components['cohere_client']
+            self.database_agent = components['database_agent']
+            self.collaborative_agent = components['collaborative_agent']
+            self.content_agent = components['content_agent']
 
-            # Initialize agents
-            SystemLogger.debug("Initializing agent components")
-            self.database_agent = DatabaseAgent()
-            self.collaborative_agent = CollaborativeAgent()
-            self.content_agent = ContentAgent(cohere_key=cohere_api_key)
+            # Compile the routing workflow once; every request reuses it
+            SystemLogger.debug("Compiling LangGraph routing workflow")
+            self.workflow = self._build_workflow()
 
             SystemLogger.info("RecommendationSystem orchestrator initialized successfully", {
                 'neo4j_connected': self.neo4j is not None,
@@ -135,6 +174,73 @@ class RecommendationSystem:
             )
             raise AgentExecutionError(f"Failed to initialize RecommendationSystem: {e}")
 
+    def _initialize_components(self, factories):
+        """
+        Build independent orchestrator components in a thread pool.
+        
+        Every factory runs in its own worker thread. The method waits for all
+        of them, records per-component timings in ``self.startup_timings`` and
+        logs a timing table that marks the component on the critical path.
+        If any factory fails, the first failure (in declaration order) is
+        re-raised once the others have finished.
+        
+        Parameters
+        ----------
+        factories : dict of str to callable
+            Component name mapped to a zero-argument factory
+            
+        Returns
+        -------
+        dict of str to object
+            Component name mapped to the built component
+        """
+        startup_start = time.perf_counter()
+        timings = {}
+
+        def _timed(name, factory):
+            started_at = time.perf_counter() - startup_start
+            try:
+                return factory()
+            finally:
+                finished_at = time.perf_counter() - startup_start
+                timings[name] = {
+                    'component': name,
+                    'started_at': started_at,
+                    'finished_at': finished_at,
+                    'seconds': finished_at - started_at
+                }
+
+        with ThreadPoolExecutor(max_workers=len(factories), thread_name_prefix="orchestrator-init") as executor:
+            futures = {
+                name: executor.submit(_timed, name, factory)
+                for name, factory in factories.items()
+            }
+            wait(futures.values())
+
+        total_seconds = time.perf_counter() - startup_start
+        self.startup_timings = [timings[name] for name in factories if name in timings]
+        critical_path = max(self.startup_timings, key=lambda t: t['finished_at'])['component'] if self.startup_timings else None
+
+        SystemLogger.info("Orchestrator component startup timings\n" + _format_startup_timings(
+            self.startup_timings, critical_path, total_seconds
+        ), {
+            'total_seconds': round(total_seconds, 3),
+            'critical_path': critical_path,
+            'sequential_seconds': round(sum(t['seconds'] for t in self.startup_timings), 3)
+        })
+
+        components = {}
+        for name, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                SystemLogger.error(
+                    f"Orchestrator component failed to initialize: {name}",
+                    exception=error,
+                    context={'component': name, 'seconds': round(timings.get(name, {}).get('seconds', 0), 3)}
+                )
+            components[name] = future.result()
+        return components
+
     @traceable(run_type="llm", name="intent_classification")
     def classify_intent(self, query):
         """
@@ -329,6 +435,7 @@ Only reply with one of the following words: "database_lookup", "recommendation",
                 raise WorkflowError(f"Missing required state fields: {missing_fields}")
 
             user_context = {
+                "user_id": state.get("user_id"),
                 "education": state["education"],
                 "age_group": state["age_group"],
                 "profession": state["profession"]
@@ -591,86 +698,82 @@ Only reply with one of the following words: "database_lookup", "recommendation",
             )
             raise WorkflowError(f"Result storage failed: {e}")
 
-    @traceable(run_type="chain", name="build_collaborative_workflow")
-    def build_workflow(self):
-        """Build collaborative recommendation workflow."""
-        SystemLogger.debug("Building collaborative recommendation workflow")
-
-        try:
-            graph = StateGraph(dict)
-            graph.add_node("collect_data", self.collect_user_data)
-            graph.add_node("generate_recs", self.generate_recommendations)
-            graph.add_node("store_result", self.store_result)
-
-            graph.set_entry_point("collect_data")
-            graph.add_edge("collect_data", "generate_recs")
-            graph.add_edge("generate_recs", "store_result")
+    def classify_intent_node(self, state):
+        """Workflow node that classifies the query and records the intent in state."""
+        state["intent"] = self.classify_intent(state["query"])
+        return state
 
-            compiled_workflow = graph.compile()
-            SystemLogger.debug("Collaborative recommendation workflow built successfully")
-            return compiled_workflow
+    @staticmethod
+    def _route_after_classification(state):
+        """Route classified queries into data collection; everything else ends the run."""
+        if state.get("intent") in _AGENT_NODES_BY_INTENT:
+            return "collect_data"
+        return END
 
-        except Exception as e:
-            SystemLogger.error(
-                "Error building collaborative recommendation workflow",
-                exception=e,
-                context={'workflow_type': 'collaborative_recommendation'}
-            )
-            raise WorkflowError(f"Failed to build collaborative workflow: {e}")
+    @staticmethod
+    def _route_to_agent(state):
+        """Pick the agent branch for the classified intent."""
+        return _AGENT_NODES_BY_INTENT[state["intent"]]
 
-    @traceable(run_type="chain", name="build_database_lookup_workflow")
-    def build_database_lookup_workflow(self):
-        """Build database lookup workflow."""
-        SystemLogger.debug("Building database lookup workflow")
+    def _build_workflow(self):
+        """
+        Build and compile the single routing workflow.
+        
+        Intent classification is the entry node. Relevant queries flow through
+        user data collection and are then routed by a conditional edge to the
+        collaborative, database lookup or content analysis agent before the
+        result is stored. Irrelevant queries end right after classification.
+        
+        Returns
+        -------
+        CompiledGraph
+            Compiled LangGraph application reused for every request
+            
+        Raises
+        ------
+        WorkflowError
+            If the graph cannot be built or compiled
+        """
+        SystemLogger.debug("Building routing workflow")
 
         try:
             graph = StateGraph(dict)
+            graph.add_node("classify_intent", self.classify_intent_node)
             graph.add_node("collect_data", self.collect_user_data)
+            graph.add_node("generate_recs", self.generate_recommendations)
             graph.add_node("run_database_agent", self.run_database_agent)
-            graph.add_node("store_result", self.store_result)
-
-            graph.set_entry_point("collect_data")
-            graph.add_edge("collect_data", "run_database_agent")
-            graph.add_edge("run_database_agent", "store_result")
-
-            compiled_workflow = graph.compile()
-            SystemLogger.debug("Database lookup workflow built successfully")
-            return compiled_workflow
-
-        except Exception as e:
-            SystemLogger.error(
-                "Error building database lookup workflow",
-                exception=e,
-                context={'workflow_type': 'database_lookup'}
-            )
-            raise WorkflowError(f"Failed to build database lookup workflow: {e}")
-
-    @traceable(run_type="chain", name="build_content_analysis_workflow")
-    def build_content_workflow(self):
-        """Build content analysis workflow."""
-        SystemLogger.debug("Building content analysis workflow")
-
-        try:
-            graph = StateGraph(dict)
-            graph.add_node("collect_data", self.collect_user_data)
             graph.add_node("run_content_agent", self.run_content_agent)
             graph.add_node("store_result", self.store_result)
 
-            graph.set_entry_point("collect_data")
-            graph.add_edge("collect_data", "run_content_agent")
-            graph.add_edge("run_content_agent", "store_result")
+            graph.set_entry_point("classify_intent")
+            graph.add_conditional_edges(
+                "classify_intent",
+                self._route_after_classification,
+                {"collect_data": "collect_data", END: END}
+            )
+            graph.add_conditional_edges(
+                "collect_data",
+                self._route_to_agent,
+                {node: node for node in _AGENT_NODES_BY_INTENT.values()}
+            )
+            for agent_node in _AGENT_NODES_BY_INTENT.values():
+                graph.add_edge(agent_node, "store_result")
+            graph.add_edge("store_result", END)
 
             compiled_workflow = graph.compile()
-            SystemLogger.debug("Content analysis workflow built successfully")
+            SystemLogger.debug("Routing workflow built successfully", {
+                'agent_branches': list(_AGENT_NODES_BY_INTENT.values())
+            })
             return compiled_workflow
 
         except Exception as e:
             SystemLogger.error(
-                "Error building content analysis workflow",
+                "Error building routing workflow",
                 exception=e,
-                context={'workflow_type': 'content_analysis'}
+                context={'workflow_type': 'intent_routing'},
+                fail_fast=False
             )
-            raise WorkflowError(f"Failed to build content workflow: {e}")
+            raise WorkflowError(f"Failed to build routing workflow: {e}")
 
     @traceable(run_type="chain", name="handle_user_query_workflow")
     def handle_user_query(self, user_id, education, age_group, profession, query, uploaded_files=None):
@@ -730,6 +833,8 @@ Only reply with one of the following words: "database_lookup", "recommendation",
             'uploaded_files_count': len(uploaded_files) if uploaded_files else 0
         })
 
+        with self._requests_idle:
+            self._active_requests += 1
         try:
             # Input validation
             if not user_id or not user_id.strip():
@@ -754,10 +859,6 @@ Only reply with one of the following words: "database_lookup", "recommendation",
                 )
                 raise WorkflowError(f"Missing required fields: {missing_fields}")
 
-            # Classify intent
-            SystemLogger.debug("Classifying query intent")
-            intent = self.classify_intent(query)
-
             # Build state
             state = {
                 "user_id": user_id,
@@ -768,99 +869,18 @@ Only reply with one of the following words: "database_lookup", "recommendation",
                 "uploaded_files": uploaded_files or []
             }
 
-            SystemLogger.info(f"Processing query with intent: {intent}", {
+            # Classify, route and run the matching agent branch in one pass
+            SystemLogger.debug("Invoking compiled routing workflow")
+            final_state = self.workflow.invoke(state)
+            intent = final_state.get("intent")
+
+            SystemLogger.info(f"Processed query with intent: {intent}", {
                 'user_id': user_id,
                 'intent': intent,
                 'workflow_type': intent
             })
 
-            # Route to appropriate workflow
-            if intent == "recommendation":
-                try:
-                    SystemLogger.debug("Building and invoking collaborative recommendation workflow")
-                    app = self.build_workflow()
-                    final_state = app.invoke(state)
-
-                    response = final_state.get("response")
-                    similar_courses = final_state.get("similar_user_courses")
-
-                    if not response:
-                        SystemLogger.error("Collaborative workflow returned empty response")
-                        raise WorkflowError("Empty response from collaborative workflow")
-
-                    SystemLogger.info("Collaborative recommendation workflow completed successfully", {
-                        'user_id': user_id,
-                        'response_length': len(response)
-                    })
-
-                    return response, similar_courses
-
-                except Exception as workflow_error:
-                    SystemLogger.error(
-                        "Error in collaborative recommendation workflow",
-                        exception=workflow_error,
-                        context={'user_id': user_id, 'intent': intent}
-                    )
-                    raise WorkflowError(f"Collaborative workflow failed: {workflow_error}")
-
-            elif intent == "database_lookup":
-                try:
-                    SystemLogger.debug("Building and invoking database lookup workflow")
-                    app = self.build_database_lookup_workflow()
-                    final_state = app.invoke(state)
-
-                    response = final_state.get("response")
-                    similar_courses = final_state.get("similar_user_courses")
-
-                    if not response:
-                        SystemLogger.error("Database lookup workflow returned empty response")
-                        raise WorkflowError("Empty response from database lookup workflow")
-
-                    SystemLogger.info("Database lookup workflow completed successfully", {
-                        'user_id': user_id,
-                        'response_length': len(response)
-                    })
-
-                    return response, similar_courses
-
-                except Exception as workflow_error:
-                    SystemLogger.error(
-                        "Error in database lookup workflow",
-                        exception=workflow_error,
-                        context={'user_id': user_id, 'intent': intent}
-                    )
-                    raise WorkflowError(f"Database lookup workflow failed: {workflow_error}")
-
-            elif intent == "content_analysis":
-                try:
-                    SystemLogger.debug("Building and invoking content analysis workflow")
-                    app = self.build_content_workflow()
-                    final_state = app.invoke(state)
-
-                    response = final_state.get("response")
-                    similar_courses = final_state.get("similar_user_courses", "")
-
-                    if not response:
-                        SystemLogger.error("Content analysis workflow returned empty response")
-                        raise WorkflowError("Empty response from content analysis workflow")
-
-                    SystemLogger.info("Content analysis workflow completed successfully", {
-                        'user_id': user_id,
-                        'response_length': len(response),
-                        'uploaded_files_processed': len(uploaded_files) if uploaded_files else 0
-                    })
-
-                    return response, similar_courses
-
-                except Exception as workflow_error:
-                    SystemLogger.error(
-                        "Error in content analysis workflow",
-                        exception=workflow_error,
-                        context={'user_id': user_id, 'intent': intent}
-                    )
-                    raise WorkflowError(f"Content analysis workflow failed: {workflow_error}")
-
-            elif intent == "irrelevant":
+            if intent == "irrelevant":
                 SystemLogger.info("Query classified as irrelevant - returning standard message", {
                     'user_id': user_id,
                     'query_preview': query[:50]
@@ -871,16 +891,37 @@ Only reply with one of the following words: "database_lookup", "recommendation",
                     None
                 )
 
-            else:
+            if intent not in _AGENT_NODES_BY_INTENT:
                 SystemLogger.error(
                     f"Unknown intent classification: {intent}",
-                    context={'user_id': user_id, 'intent': intent, 'query': query}
+                    context={'user_id': user_id, 'intent': intent, 'query': query},
+                    fail_fast=False
                 )
                 return (
                     "Sorry, I couldn't understand your request. Please try again.",
                     None
                 )
 
+            response = final_state.get("response")
+            similar_courses = final_state.get("similar_user_courses", "")
+
+            if not response:
+                SystemLogger.error(
+                    f"Workflow returned empty response for intent: {intent}",
+                    context={'user_id': user_id, 'intent': intent},
+                    fail_fast=False
+                )
+                raise WorkflowError(f"Empty response from {intent} workflow")
+
+            SystemLogger.info("Routing workflow completed successfully", {
+                'user_id': user_id,
+                'intent': intent,
+                'response_length': len(response),
+                'uploaded_files_processed': len(uploaded_files) if uploaded_files else 0
+            })
+
+            return response, similar_courses
+
         except (WorkflowError, APIRequestError, AgentExecutionError) as e:
             SystemLogger.error(
                 "Workflow/API/Agent error handling user query",
@@ -901,3 +942,202 @@ Only reply with one of the following words: "database_lookup", "recommendation",
         finally:
             # Ensure all traces are submitted to LangSmith before completing
             _finalize_langsmith_traces()
+            with self._requests_idle:
+                self._active_requests -= 1
+                self._requests_idle.notify_all()
+
+    def close(self, timeout=None):
+        """
+        Wait for running requests to finish, then close the instance's API clients.
+        
+        Process-wide resources (database connectors, course catalog, vector
+        stores) are shared with other instances and stay open.
+        
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for running requests; None waits indefinitely
+        """
+        with self._requests_idle:
+            drained = self._requests_idle.wait_for(lambda: self._active_requests == 0, timeout)
+        if not drained:
+            SystemLogger.info("Closing RecommendationSystem with requests still running", {
+                'active_requests': self._active_requests
+            })
+        
+        try:
+            close_cohere_client(self.cohere_client)
+            for agent in (self.database_agent, self.collaborative_agent, self.content_agent):
+                agent.close()
+        except Exception as e:
+            SystemLogger.error(
+                "Failed to close RecommendationSystem clients",
+                exception=e,
+                context={'active_requests': self._active_requests},
+                fail_fast=False
+            )
+            return
+        SystemLogger.info("RecommendationSystem instance closed")
+
+
+# Process-wide orchestrator lifecycle
+_recommendation_system = None
+_recommendation_system_lock = threading.Lock()
+_paper_reload_lock = threading.Lock()
+_paper_watcher = None
+
+
+def get_recommendation_system():
+    """
+    Get the process-wide RecommendationSystem, building it on first use.
+    
+    The orchestrator owns the agents, their database connections, the course
+    catalog and the research paper index, so it is built once per process and
+    shared by every request. Construction is serialised with a lock so that
+    concurrent first requests never build more than one instance.
+    
+    Returns
+    -------
+    RecommendationSystem
+        Shared, fully initialized orchestrator instance
+        
+    Raises
+    ------
+    ConfigurationError
+        If required API keys are not configured
+    DatabaseConnectionError
+        If database connections cannot be established
+    AgentExecutionError
+        If agent initialization fails
+        
+    Examples
+    --------
+    >>> system = get_recommendation_system()
+    >>> response, courses = system.handle_user_query(...)
+    """
+    global _recommendation_system
+    
+    system = _recommendation_system
+    if system is not None:
+        return system
+    
+    with _recommendation_system_lock:
+        if _recommendation_system is None:
+            SystemLogger.info("Building shared RecommendationSystem instance")
+            start_time = time.perf_counter()
+            _recommendation_system = RecommendationSystem()
+            SystemLogger.info("Shared RecommendationSystem instance ready", {
+                'startup_seconds': round(time.perf_counter() - start_time, 3)
+            })
+            _start_paper_watcher()
+        return _recommendation_system
+
+
+def reload_recommendation_system():
+    """
+    Rebuild the shared RecommendationSystem and swap it in atomically.
+    
+    The course vector store and the replacement are fully built before they
+    are published, so requests already running keep using the previous
+    instance and store, and new requests only ever see a warm orchestrator.
+    The previous instance is closed on a background thread once its running
+    requests have finished. If the rebuild fails the previous instance stays
+    in service. The research paper watcher is stopped before the swap
+    and restarted afterwards, so exactly one watcher runs and it never
+    reloads the paper index into an instance that is being replaced.
+    
+    Returns
+    -------
+    RecommendationSystem
+        Newly built orchestrator instance
+        
+    Raises
+    ------
+    ConfigurationError, DatabaseConnectionError, AgentExecutionError
+        If the replacement instance cannot be initialized
+    """
+    global _recommendation_system
+    
+    SystemLogger.info("Reloading shared RecommendationSystem instance", {
+        'previous_instance_available': _recommendation_system is not None
+    })
+    
+    with _recommendation_system_lock:
+        start_time = time.perf_counter()
+        # Pick up catalog changes; the store reloads from disk if the catalog is unchanged
+        get_course_catalog().refresh()
+        reload_course_vector_store()
+        replacement = RecommendationSystem()
+        _stop_paper_watcher()
+        previous, _recommendation_system = _recommendation_system, replacement
+        _start_paper_watcher()
+    
+    if previous is not None:
+        threading.Thread(target=previous.close, name="recommendation-system-close", daemon=True).start()
+        
+    SystemLogger.info("Shared RecommendationSystem instance reloaded", {
+        'reload_seconds': round(time.perf_counter() - start_time, 3)
+    })
+    return replacement
+
+
+def is_recommendation_system_ready():
+    """Return True once the shared RecommendationSystem has been built."""
+    return _recommendation_system is not None
+
+
+def reload_paper_index():
+    """
+    Rebuild the research paper index and swap it into the live ContentAgent.
+    
+    Admin entry point for picking up added, changed or removed PDFs without a
+    restart; the background watcher calls it too. The index is rebuilt off the
+    request path and requests already running finish on the previous one.
+    Concurrent calls are serialised.
+    
+    Returns
+    -------
+    FAISS
+        Newly published research paper vector store
+        
+    Raises
+    ------
+    FileProcessingError, VectorStoreError
+        If the new index cannot be built; the previous index stays in service
+    """
+    with _paper_reload_lock:
+        start_time = time.perf_counter()
+        paper_index = reload_paper_vector_store()
+        
+        system = _recommendation_system
+        if system is not None:
+            system.content_agent.set_paper_index(paper_index)
+        
+        SystemLogger.info("Research paper index reloaded", {
+            'reload_seconds': round(time.perf_counter() - start_time, 3),
+            'paper_chunks_indexed': paper_index.index.ntotal,
+            'content_agent_updated': system is not None
+        })
+        return paper_index
+
+
+def _start_paper_watcher():
+    """Start the papers directory watcher once per process if enabled."""
+    global _paper_watcher
+    
+    if PAPER_WATCH_INTERVAL_SECONDS <= 0 or _paper_watcher is not None:
+        return
+    
+    _paper_watcher = PaperCorpusWatcher(PAPERS_DIR, PAPER_WATCH_INTERVAL_SECONDS, reload_paper_index)
+    _paper_watcher.start()
+
+
+def _stop_paper_watcher():
+    """Stop the papers directory watcher if one is running."""
+    global _paper_watcher
+    
+    if _paper_watcher is None:
+        return
+    
+    _paper_watcher.stop()
+    _paper_watcher = None
@@ -0,0 +1,428 @@
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+import faiss
+import numpy as np
+from database.user_vector_cache import UserVectorCache
+from utils.artifact_store import current_version_dir, publish_version
+from utils.logger import SystemLogger
+
+INDEX_FILENAME = "index.faiss"
+METADATA_FILENAME = "metadata.json"
+# IVF needs roughly this many training points per list for stable centroids
+IVF_POINTS_PER_LIST = 39
+# Retrain IVF centroids once the index has grown this much past its training set
+IVF_RETRAIN_GROWTH = 4
+# Rebuild once superseded profile rows make up this share of the index
+TOMBSTONE_REBUILD_FRACTION = 0.25
+# Bumped whenever the persisted row metadata changes shape
+METADATA_FORMAT = 2
+# Rows reconstructed per lock acquisition by read_rows, so searches are never held up for long
+READ_CHUNK_ROWS = 4096
+
+AnnIndexParams = namedtuple('AnnIndexParams', [
+    'index_type',          # 'hnsw' or 'ivf'
+    'hnsw_m',              # HNSW graph degree (build-time)
+    'hnsw_ef_construction',# HNSW build beam width (build-time)
+    'hnsw_ef_search',      # HNSW query beam width (query-time recall knob)
+    'ivf_nlist',           # IVF inverted lists (build-time upper bound)
+    'ivf_nprobe',          # IVF lists probed per query (query-time recall knob)
+])
+
+
+def build_faiss_index(dimension, params, training_vectors=None):
+    """
+    Create an empty inner-product FAISS index for unit-norm vectors.
+
+    Parameters
+    ----------
+    dimension : int
+        Vector dimension
+    params : AnnIndexParams
+        Index type and tuning parameters
+    training_vectors : np.ndarray, optional
+        float32 rows used to train IVF centroids; the number of lists is
+        capped so every list gets enough training points
+
+    Returns
+    -------
+    faiss.Index
+        Trained, empty index ready for ``add``
+    """
+    if params.index_type == 'hnsw':
+        index = faiss.IndexHNSWFlat(dimension, params.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = params.hnsw_ef_construction
+        index.hnsw.efSearch = params.hnsw_ef_search
+        return index
+
+    n_train = 0 if training_vectors is None else training_vectors.shape[0]
+    nlist = max(1, min(params.ivf_nlist, n_train // IVF_POINTS_PER_LIST))
+    quantizer = faiss.IndexFlatIP(dimension)
+    index = faiss.IndexIVFFlat(quantizer, dimension, nlist, faiss.METRIC_INNER_PRODUCT)
+    # Lets rows be reconstructed by id (HNSW-Flat supports that natively)
+    index.make_direct_map()
+    if n_train:
+        index.train(training_vectors)
+    index.nprobe = min(params.ivf_nprobe, nlist)
+    return index
+
+
+def apply_search_params(index, params):
+    """Apply query-time recall parameters to an existing index."""
+    if params.index_type == 'hnsw':
+        index.hnsw.efSearch = params.hnsw_ef_search
+    else:
+        index.nprobe = min(params.ivf_nprobe, index.nlist)
+
+
+class AnnUserVectorIndex(UserVectorCache):
+    """
+    Approximate nearest-neighbour index over user profile vectors.
+
+    Same synchronisation with Neo4j as ``UserVectorCache`` (upserts from
+    ``store_interaction``, watermark reconciliation and reload on count
+    mismatch on the sync thread), but rows live in a FAISS HNSW or IVF-Flat index so lookups
+    stay sub-linear as users grow into the hundreds of thousands.
+
+    FAISS graph indexes cannot update a vector in place, so a profile update
+    adds a new FAISS row and tombstones the old one; searches skip
+    tombstoned rows, and the index is rebuilt from Neo4j once they exceed
+    ``TOMBSTONE_REBUILD_FRACTION`` of it. Rebuilds run on the sync thread;
+    searches use the current index until the new one is swapped in.
+
+    The index and its row metadata are persisted to ``index_dir`` at most
+    every ``persist_seconds`` after changes, as a new version published
+    atomically by a background thread. On start the latest version is loaded
+    and only profiles updated since are read from Neo4j.
+
+    Parameters
+    ----------
+    driver : neo4j.Driver
+        Driver used for reconciliation reads
+    refresh_seconds : float
+        Seconds between reconciliations
+    index_dir : str
+        Directory holding persisted index versions
+    params : AnnIndexParams
+        Index type and tuning parameters
+    persist_seconds : float
+        Minimum seconds between persists (0 persists after every change)
+    embedding_model : str
+        Model whose profile vectors are indexed
+    untagged_model : str
+        Model assumed for profiles stored before the model was recorded
+
+    Notes
+    -----
+    FAISS indexes are not safe for concurrent add and search, so searches
+    take the lock too; HNSW and IVF lookups are short enough for that.
+    Serialising the index for a persist runs outside the lock, concurrently
+    with searches; vectors added meanwhile are buffered and added once it
+    finishes, so those updates become searchable slightly later.
+    Query-time parameters (efSearch, nprobe) apply to a persisted index
+    directly; changing build-time parameters discards it and rebuilds.
+    """
+
+    label = "User vector ANN index"
+
+    def __init__(self, driver, refresh_seconds, index_dir, params, persist_seconds,
+                 embedding_model, untagged_model):
+        self._index_dir = index_dir
+        self._params = params
+        self._persist_seconds = persist_seconds
+        self._index = None
+        self._trained_on = 0
+        # FAISS row -> cache row, and cache row -> its live FAISS row
+        self._row_of_id = []
+        self._live_ids = []
+        self._dirty = False
+        self._persisted_at = None
+        # Index being serialised by persist(), and vectors waiting to be added to it
+        self._serializing = None
+        self._pending = []
+        self._persist_thread = None
+        super().__init__(driver, refresh_seconds, embedding_model, untagged_model)
+        self._restore()
+
+    # Storage hooks
+
+    def _build_storage(self, dimension, unit_matrix):
+        if dimension is None or unit_matrix is None:
+            return None, 0
+        index = build_faiss_index(dimension, self._params, unit_matrix)
+        index.add(unit_matrix)
+        return index, unit_matrix.shape[0]
+
+    def _install_storage(self, storage):
+        self._index, self._trained_on = storage
+        self._pending = []
+        size = 0 if self._index is None else self._index.ntotal
+        self._row_of_id = list(range(size))
+        self._live_ids = list(range(size))
+        self._dirty = True
+
+    def _add_to_index(self, unit_vector):
+        vector = unit_vector.reshape(1, -1)
+        if self._index is None:
+            self._index = build_faiss_index(self._dimension, self._params, vector)
+            self._trained_on = 1
+        faiss_id = self._ntotal()
+        if self._serializing is self._index:
+            # FAISS cannot add while persist() serialises this index; added once it finishes
+            self._pending.append(vector)
+        else:
+            self._index.add(vector)
+        self._dirty = True
+        return faiss_id
+
+    def _ntotal(self):
+        """FAISS rows assigned so far, including ones waiting to be added."""
+        return (0 if self._index is None else self._index.ntotal) + len(self._pending)
+
+    def _append_row(self, unit_vector):
+        self._live_ids.append(self._add_to_index(unit_vector))
+        self._row_of_id.append(self._size)
+
+    def _replace_row(self, row, unit_vector):
+        self._live_ids[row] = self._add_to_index(unit_vector)
+        self._row_of_id.append(row)
+
+    def _remove_row(self, row):
+        # The row's last FAISS vector becomes a tombstone like a superseded one
+        self._live_ids[row] = None
+        self._dirty = True
+
+    def _read_rows(self, rows, generation):
+        vectors = np.zeros((len(rows), self._dimension or 0), dtype=np.float32)
+        for start in range(0, len(rows), READ_CHUNK_ROWS):
+            chunk = rows[start:start + READ_CHUNK_ROWS]
+            with self._lock:
+                if self._generation != generation:
+                    return None
+                faiss_ids = np.array(
+                    [-1 if self._live_ids[row] is None else self._live_ids[row] for row in chunk], dtype=np.int64
+                )
+                ntotal = self._index.ntotal
+                # Rows removed since live_rows stay zero
+                present = np.flatnonzero((faiss_ids >= 0) & (faiss_ids < ntotal))
+                if len(present):
+                    vectors[start + present] = self._index.reconstruct_batch(faiss_ids[present])
+                for offset in np.flatnonzero(faiss_ids >= ntotal):
+                    vectors[start + offset] = self._pending[faiss_ids[offset] - ntotal]
+        return vectors
+
+    def _search(self, query_vector, top_n):
+        with self._lock:
+            if self._index is None or self._size == 0:
+                return []
+            ntotal = self._index.ntotal
+            if ntotal == 0:
+                return []
+            k = min(ntotal, 2 * top_n)
+            while True:
+                scores, ids = self._index.search(query_vector.reshape(1, -1), k)
+                # Keep only each user's live row; tombstoned rows are superseded profiles
+                hits = [
+                    (self._row_of_id[faiss_id], score)
+                    for faiss_id, score in zip(ids[0], scores[0])
+                    if faiss_id >= 0 and self._live_ids[self._row_of_id[faiss_id]] == faiss_id
+                ]
+                if len(hits) >= top_n or k >= ntotal:
+                    break
+                k = min(ntotal, 4 * k)
+            user_ids, queries = self._user_ids, self._queries
+
+        return [
+            {"user_id": user_ids[row], "query": queries[row], "score": float(score)}
+            for row, score in hits[:top_n]
+        ]
+
+    def _storage_stats(self):
+        ntotal = self._ntotal()
+        dimension = self._dimension or 0
+        vector_bytes = ntotal * dimension * 4
+        if self._params.index_type == 'hnsw':
+            # Level-0 links dominate: 2*M neighbour ids (int32) per vector
+            link_bytes = ntotal * 2 * self._params.hnsw_m * 4
+        else:
+            link_bytes = ntotal * 8  # stored ids
+        return {
+            'index_type': self._params.index_type,
+            'index_vectors': ntotal,
+            'tombstones': ntotal - (self._size - self._removed),
+            'approx_index_bytes': vector_bytes + link_bytes,
+            'trained_on': self._trained_on if self._params.index_type == 'ivf' else None,
+            'persist_age_seconds': (
+                None if self._persisted_at is None
+                else round(time.monotonic() - self._persisted_at, 3)
+            ),
+        }
+
+    def _needs_full_reload(self):
+        ntotal = self._ntotal()
+        if ntotal - (self._size - self._removed) > TOMBSTONE_REBUILD_FRACTION * ntotal:
+            return True
+        return (
+            self._params.index_type == 'ivf'
+            and self._trained_on < self._params.ivf_nlist * IVF_POINTS_PER_LIST
+            and self._size >= IVF_RETRAIN_GROWTH * max(self._trained_on, IVF_POINTS_PER_LIST)
+        )
+
+    def _after_sync(self):
+        # Only start the persist, so a slow write never delays the next reconciliation
+        if not self._dirty:
+            return
+        if self._persisted_at is not None and time.monotonic() - self._persisted_at < self._persist_seconds:
+            return
+        with self._lock:
+            if self._persist_thread is not None and self._persist_thread.is_alive():
+                return
+            self._persist_thread = threading.Thread(
+                target=self._persist_in_background, name="ann-index-persist", daemon=True
+            )
+            self._persist_thread.start()
+
+    def _persist_in_background(self):
+        try:
+            self.persist()
+        except Exception as e:
+            SystemLogger.error(
+                "Failed to persist user vector ANN index - Continuing with in-memory index",
+                exception=e,
+                context={'index_dir': self._index_dir},
+                fail_fast=False
+            )
+
+    # Persistence
+
+    def persist(self):
+        """
+        Write the index and its row metadata as a new published version.
+
+        Only the metadata snapshot is taken under the lock; the index is
+        serialised and written outside it while searches continue.
+        """
+        with self._lock:
+            if self._index is None or self._serializing is not None:
+                return
+            index = self._index
+            self._serializing = index
+            metadata = {
+                'format': METADATA_FORMAT,
+                'params': self._params._asdict(),
+                'embedding_model': self._embedding_model,
+                'dimension': self._dimension,
+                'trained_on': self._trained_on,
+                'watermark': self._watermark,
+                'user_ids': list(self._user_ids),
+                'queries': list(self._queries),
+                'rows_by_key': dict(self._rows_by_key),
+                'versions': dict(self._versions),
+                'row_of_id': list(self._row_of_id),
+            }
+            # Changes made from here on mark the index dirty again
+            self._dirty = False
+
+        start_time = time.perf_counter()
+        try:
+            try:
+                index_bytes = faiss.serialize_index(index)
+            finally:
+                with self._lock:
+                    if self._index is index and self._pending:
+                        index.add(np.vstack(self._pending))
+                        self._pending = []
+                    self._serializing = None
+
+            def _write(staging_dir):
+                index_bytes.tofile(os.path.join(staging_dir, INDEX_FILENAME))
+                with open(os.path.join(staging_dir, METADATA_FILENAME), "w") as fh:
+                    json.dump(metadata, fh)
+
+            version_dir = publish_version(self._index_dir, _write)
+        except Exception:
+            # Not published, so the next sync retries
+            with self._lock:
+                self._dirty = True
+            raise
+        self._persisted_at = time.monotonic()
+        SystemLogger.info("User vector ANN index persisted", {
+            'version_dir': version_dir,
+            'index_vectors': len(metadata['user_ids']),
+            'persist_seconds': round(time.perf_counter() - start_time, 3)
+        })
+
+    def _restore(self):
+        version_dir = current_version_dir(self._index_dir)
+        if version_dir is None:
+            return
+
+        try:
+            with open(os.path.join(version_dir, METADATA_FILENAME)) as fh:
+                metadata = json.load(fh)
+
+            if metadata.get('format') != METADATA_FORMAT:
+                SystemLogger.info("Persisted ANN index uses an older layout - Rebuilding", {
+                    'version_dir': version_dir, 'format': metadata.get('format')
+                })
+                return
+
+            if metadata.get('embedding_model') != self._embedding_model:
+                SystemLogger.info("Persisted ANN index holds another embedding model - Rebuilding", {
+                    'persisted': metadata.get('embedding_model'), 'configured': self._embedding_model
+                })
+                return
+
+            saved = AnnIndexParams(**metadata['params'])
+            build_keys = ('index_type', 'hnsw_m', 'hnsw_ef_construction', 'ivf_nlist')
+            if any(getattr(saved, key) != getattr(self._params, key) for key in build_keys):
+                SystemLogger.info("Persisted ANN index was built with different parameters - Rebuilding", {
+                    'persisted': metadata['params'], 'configured': self._params._asdict()
+                })
+                return
+
+            index = faiss.read_index(os.path.join(version_dir, INDEX_FILENAME))
+            apply_search_params(index, self._params)
+            if self._params.index_type == 'ivf' and index.direct_map.type == faiss.DirectMap.NoMap:
+                index.make_direct_map()
+        except Exception as e:
+            SystemLogger.error(
+                "Persisted ANN index could not be loaded - Rebuilding from Neo4j",
+                exception=e,
+                context={'version_dir': version_dir},
+                fail_fast=False
+            )
+            return
+
+        with self._lock:
+            self._generation += 1
+            self._index = index
+            self._dimension = metadata['dimension']
+            self._trained_on = metadata['trained_on']
+            self._watermark = metadata['watermark']
+            self._user_ids = metadata['user_ids']
+            self._queries = metadata['queries']
+            self._rows_by_key = metadata['rows_by_key']
+            self._versions = metadata['versions']
+            self._row_of_id = metadata['row_of_id']
+            self._size = len(self._user_ids)
+            # The last FAISS row written for each cache row is its live one,
+            # unless the row was tombstoned (None user_id)
+            self._live_ids = [None] * self._size
+            for faiss_id, row in enumerate(self._row_of_id):
+                if self._user_ids[row] is not None:
+                    self._live_ids[row] = faiss_id
+            self._removed = sum(1 for user_id in self._user_ids if user_id is None)
+            self._dirty = False
+            self._persisted_at = time.monotonic()
+            # Loaded, but stale: the first sync reconciles writes made since the persist
+            self._reconciled_at = 0.0
+            self._loaded = True
+            self._loaded_event.set()
+
+        SystemLogger.info("User vector ANN index restored from disk", {
+            'version_dir': version_dir, 'index_vectors': index.ntotal
+        })
@@ -0,0 +1,253 @@
+import json
+import os
+import time
+
+import numpy as np
+from utils.artifact_store import PublishedArtifact
+
+METADATA_FILENAME = "metadata.json"
+# Per-course neighbour lists in CSR layout: course i's neighbours are
+# indices[indptr[i]:indptr[i + 1]], best first
+ARRAY_NAMES = ("enrollments", "indptr", "indices", "scores", "counts")
+# Users per block when accumulating course co-occurrence counts
+USER_BLOCK_SIZE = 4096
+
+
+def build_co_enrollment(enrollments, min_support=2, top_n=20):
+    """
+    Build a course-to-course co-enrollment model from enrollment pairs.
+
+    Two courses are co-enrolled when the same user is enrolled in both. Each
+    pair is scored by cosine similarity over the courses' enrolled-user sets,
+    ``shared / sqrt(enrolled_a * enrolled_b)``, so popular courses do not
+    dominate every list. Counts are accumulated as a dense course x course
+    matrix, block by block over users, which suits catalogs of up to a few
+    thousand courses.
+
+    Parameters
+    ----------
+    enrollments : iterable of tuple
+        (user_id, course_name) pairs, e.g. every ``ENROLLED_IN`` edge;
+        duplicates and pairs with a missing value are ignored
+    min_support : int, optional
+        Minimum number of shared users for a pair to be kept, by default 2
+    top_n : int, optional
+        Neighbours kept per course, by default 20
+
+    Returns
+    -------
+    CoEnrollmentModel
+        Model holding the top ``top_n`` co-enrolled courses of every course
+    """
+    users, courses = {}, {}
+    pairs = set()
+    for user_id, course_name in enrollments:
+        if user_id is None or course_name is None:
+            continue
+        pairs.add((users.setdefault(user_id, len(users)), courses.setdefault(course_name, len(courses))))
+
+    course_names = list(courses)
+    n_courses = len(course_names)
+    co_counts = np.zeros((n_courses, n_courses), dtype=np.float32)
+    if pairs:
+        user_rows, course_cols = np.array(sorted(pairs), dtype=np.int64).T
+        block_starts = np.searchsorted(user_rows, np.arange(0, len(users) + USER_BLOCK_SIZE, USER_BLOCK_SIZE))
+        for block, (start, stop) in enumerate(zip(block_starts[:-1], block_starts[1:])):
+            if start == stop:
+                continue
+            # One-hot enrollments of this block of users; X^T X adds their co-occurrences
+            block_matrix = np.zeros((USER_BLOCK_SIZE, n_courses), dtype=np.float32)
+            block_matrix[user_rows[start:stop] - block * USER_BLOCK_SIZE, course_cols[start:stop]] = 1.0
+            co_counts += block_matrix.T @ block_matrix
+
+    enrolled = np.diag(co_counts).copy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = co_counts / np.sqrt(np.outer(enrolled, enrolled))
+    scores[~np.isfinite(scores)] = 0.0
+    np.fill_diagonal(scores, 0.0)
+    scores[co_counts < min_support] = 0.0
+
+    indptr = np.zeros(n_courses + 1, dtype=np.int64)
+    indices, kept_scores = [], []
+    for course in range(n_courses):
+        candidates = np.flatnonzero(scores[course] > 0)
+        if len(candidates) > top_n:
+            candidates = candidates[np.argpartition(-scores[course, candidates], top_n - 1)[:top_n]]
+        candidates = candidates[np.argsort(-scores[course, candidates], kind='stable')]
+        indices.append(candidates)
+        kept_scores.append(scores[course, candidates])
+        indptr[course + 1] = indptr[course] + len(candidates)
+
+    indices = np.concatenate(indices).astype(np.int32) if n_courses else np.zeros(0, dtype=np.int32)
+    rows = np.repeat(np.arange(n_courses), np.diff(indptr))
+    return CoEnrollmentModel(
+        course_names,
+        enrollments=enrolled.astype(np.int32),
+        indptr=indptr,
+        indices=indices,
+        scores=np.concatenate(kept_scores).astype(np.float32) if n_courses else np.zeros(0, dtype=np.float32),
+        counts=co_counts[rows, indices].astype(np.int32),
+        metadata={
+            'users': len(users),
+            'enrollments': len(pairs),
+            'min_support': min_support,
+            'top_n': top_n,
+            'built_at': int(time.time()),
+        }
+    )
+
+
+class CoEnrollmentModel:
+    """
+    Immutable "students who took X also took Y" lists for every course.
+
+    Neighbour lists are precomputed offline by ``build_co_enrollment`` and
+    expanded into per-course tuples on load, so a lookup is a dictionary
+    access and costs microseconds.
+
+    Parameters
+    ----------
+    course_names : list of str
+        Course name of each row
+    enrollments : np.ndarray
+        Number of users enrolled in each course
+    indptr, indices, scores, counts : np.ndarray
+        CSR neighbour lists: neighbour rows, cosine scores and shared-user
+        counts of course ``i`` are at ``indptr[i]:indptr[i + 1]``
+    metadata : dict, optional
+        Build parameters and corpus sizes
+    """
+
+    def __init__(self, course_names, enrollments, indptr, indices, scores, counts, metadata=None):
+        self.course_names = list(course_names)
+        self.metadata = dict(metadata or {})
+        self._arrays = {
+            'enrollments': enrollments, 'indptr': indptr, 'indices': indices,
+            'scores': scores, 'counts': counts,
+        }
+        self._neighbours = {}
+        for row, name in enumerate(self.course_names):
+            start, stop = int(indptr[row]), int(indptr[row + 1])
+            self._neighbours[name] = tuple(
+                (self.course_names[int(i)], float(s), int(c))
+                for i, s, c in zip(indices[start:stop], scores[start:stop], counts[start:stop])
+            )
+
+    def also_took(self, course_name, top_n=5):
+        """
+        Return the courses most often taken together with ``course_name``.
+
+        Parameters
+        ----------
+        course_name : str
+            Course to look up
+        top_n : int, optional
+            Number of results, by default 5
+
+        Returns
+        -------
+        list of dict
+            ``course``, cosine ``score`` and ``shared_students`` per result,
+            best first; empty for unknown courses
+        """
+        return [
+            {"course": name, "score": score, "shared_students": count}
+            for name, score, count in self._neighbours.get(course_name, ())[:top_n]
+        ]
+
+    def also_took_any(self, course_names, top_n=5):
+        """
+        Return courses co-enrolled with any of ``course_names``, excluding them.
+
+        Scores of a candidate are summed over the seed courses it is
+        co-enrolled with, so courses shared by several seeds rank first.
+
+        Parameters
+        ----------
+        course_names : iterable of str
+            Seed courses, e.g. the courses similar users enrolled in
+        top_n : int, optional
+            Number of results, by default 5
+
+        Returns
+        -------
+        list of dict
+            ``course``, summed ``score`` and total ``shared_students`` per
+            result, best first
+        """
+        seeds = set(course_names)
+        totals = {}
+        for seed in seeds:
+            for name, score, count in self._neighbours.get(seed, ()):
+                if name in seeds:
+                    continue
+                total = totals.setdefault(name, [0.0, 0])
+                total[0] += score
+                total[1] += count
+        ranked = sorted(totals.items(), key=lambda item: (-item[1][0], item[0]))[:top_n]
+        return [
+            {"course": name, "score": score, "shared_students": count}
+            for name, (score, count) in ranked
+        ]
+
+    def stats(self):
+        """Report course, neighbour and build metadata counts."""
+        return dict(
+            self.metadata,
+            courses=len(self.course_names),
+            neighbour_pairs=int(len(self._arrays['indices'])),
+        )
+
+    def save(self, directory):
+        """Write the model as ``.npy`` arrays and a metadata file into ``directory``."""
+        for name in ARRAY_NAMES:
+            np.save(os.path.join(directory, f"{name}.npy"), self._arrays[name])
+        with open(os.path.join(directory, METADATA_FILENAME), "w") as fh:
+            json.dump(dict(self.metadata, course_names=self.course_names), fh)
+
+    @classmethod
+    def load(cls, directory):
+        """Read a model written by ``save``."""
+        with open(os.path.join(directory, METADATA_FILENAME)) as fh:
+            metadata = json.load(fh)
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy")) for name in ARRAY_NAMES}
+        return cls(metadata.pop('course_names'), metadata=metadata, **arrays)
+
+
+class CoEnrollmentIndex:
+    """
+    Serving-side handle on the published co-enrollment model.
+
+    Loads the version published under ``model_dir`` on first use and picks
+    up newer versions every ``refresh_seconds`` without blocking lookups.
+    Without a published model every lookup returns an empty list.
+
+    Parameters
+    ----------
+    model_dir : str
+        Directory the build job publishes versions to
+    refresh_seconds : float
+        Seconds between checks for a newly published version
+    """
+
+    def __init__(self, model_dir, refresh_seconds):
+        self._artifact = PublishedArtifact(model_dir, refresh_seconds, CoEnrollmentModel.load, "Co-enrollment model")
+
+    def model(self):
+        """Return the current ``CoEnrollmentModel``, or None if none is published."""
+        return self._artifact.get()
+
+    def also_took(self, course_name, top_n=5):
+        """``CoEnrollmentModel.also_took`` on the current model."""
+        model = self.model()
+        return model.also_took(course_name, top_n) if model is not None else []
+
+    def also_took_any(self, course_names, top_n=5):
+        """``CoEnrollmentModel.also_took_any`` on the current model."""
+        model = self.model()
+        return model.also_took_any(course_names, top_n) if model is not None else []
+
+    def stats(self):
+        """Report the loaded version and its model statistics."""
+        model = self._artifact.get()
+        return dict(model.stats() if model is not None else {}, version_dir=self._artifact.version_dir)
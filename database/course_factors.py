@@ -0,0 +1,344 @@
+import json
+import os
+import re
+
+import numpy as np
+from utils.artifact_store import PublishedArtifact
+
+METADATA_FILENAME = "metadata.json"
+# user_indptr/user_items list each user's training courses (CSR), excluded from their recommendations
+ARRAY_NAMES = ("user_factors", "course_factors", "gramian", "user_indptr", "user_items")
+# Course headings the recommendation prompts ask the LLM to produce
+COURSE_HEADING = re.compile(r"\*\*Course:\s*(.+?)\s*\*\*")
+
+
+def courses_in_response(response, course_names):
+    """
+    Return the catalog courses a stored recommendation response presented.
+
+    Parameters
+    ----------
+    response : str
+        ``Interaction.response`` text
+    course_names : set of str
+        Known course names; headings naming other courses are ignored
+
+    Returns
+    -------
+    list of str
+        Distinct course names in order of appearance
+    """
+    found = []
+    for name in COURSE_HEADING.findall(response or ""):
+        if name in course_names and name not in found:
+            found.append(name)
+    return found
+
+
+def build_feedback_matrix(enrollments, recommendations=(), recommendation_weight=0.25):
+    """
+    Combine enrollments and recommended courses into a user x course feedback matrix.
+
+    Parameters
+    ----------
+    enrollments : iterable of tuple
+        (user_id, course_name) ``ENROLLED_IN`` pairs; each counts 1
+    recommendations : iterable of tuple, optional
+        (user_id, course_name) pairs of courses shown to a user in past
+        interactions; each occurrence counts ``recommendation_weight``
+    recommendation_weight : float, optional
+        Feedback of one recommendation relative to an enrollment, by default 0.25
+
+    Returns
+    -------
+    tuple
+        (user_ids, course_names, indptr, indices, values): CSR rows per user,
+        column indices into ``course_names`` and summed feedback
+    """
+    users, courses = {}, {}
+    feedback = {}
+    for pairs, weight in ((enrollments, 1.0), (recommendations, recommendation_weight)):
+        for user_id, course_name in pairs:
+            if user_id is None or course_name is None:
+                continue
+            key = (users.setdefault(user_id, len(users)), courses.setdefault(course_name, len(courses)))
+            feedback[key] = feedback.get(key, 0.0) + weight
+
+    keys = sorted(feedback)
+    rows = np.array([k[0] for k in keys], dtype=np.int64)
+    indices = np.array([k[1] for k in keys], dtype=np.int32)
+    values = np.array([feedback[k] for k in keys], dtype=np.float32)
+    indptr = np.zeros(len(users) + 1, dtype=np.int64)
+    np.add.at(indptr, rows + 1, 1)
+    return list(users), list(courses), np.cumsum(indptr), indices, values
+
+
+def _transpose(indptr, indices, values, n_columns):
+    order = np.argsort(indices, kind='stable')
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    t_indptr = np.zeros(n_columns + 1, dtype=np.int64)
+    np.add.at(t_indptr, indices.astype(np.int64) + 1, 1)
+    return np.cumsum(t_indptr), rows[order].astype(np.int32), values[order]
+
+
+def _solve_side(indptr, indices, values, fixed, regularization, alpha):
+    """One half-sweep of implicit ALS: re-solve every row against the fixed factors."""
+    n_factors = fixed.shape[1]
+    gramian = fixed.T @ fixed
+    ridge = regularization * np.eye(n_factors)
+    solved = np.zeros((len(indptr) - 1, n_factors), dtype=np.float64)
+    for row in range(len(indptr) - 1):
+        start, stop = indptr[row], indptr[row + 1]
+        if start == stop:
+            continue
+        factors = fixed[indices[start:stop]]
+        confidence = 1.0 + alpha * values[start:stop]
+        # (Y^T C_u Y + lambda I) x_u = Y^T C_u p_u, with C_u = I off the observed items
+        system = gramian + (factors.T * (confidence - 1.0)) @ factors + ridge
+        solved[row] = np.linalg.solve(system, factors.T @ confidence)
+    return solved
+
+
+def train_implicit_als(indptr, indices, values, n_courses, factors=32, regularization=0.05, alpha=20.0,
+                       iterations=15, seed=0, initial_users=None, initial_courses=None):
+    """
+    Factorise implicit feedback with alternating least squares (Hu, Koren and Volinsky).
+
+    Every user-course pair is a preference of 1 for observed feedback and 0
+    otherwise, weighted by confidence ``1 + alpha * feedback``.
+
+    Parameters
+    ----------
+    indptr, indices, values : np.ndarray
+        User x course feedback in CSR layout (see ``build_feedback_matrix``)
+    n_courses : int
+        Number of course columns
+    factors : int, optional
+        Latent dimension, by default 32
+    regularization : float, optional
+        L2 penalty on factors, by default 0.05
+    alpha : float, optional
+        Confidence gained per unit of feedback, by default 20.0
+    iterations : int, optional
+        Alternating sweeps, by default 15
+    seed : int, optional
+        Seed of the random initialisation, by default 0
+    initial_users, initial_courses : np.ndarray, optional
+        Starting factors (e.g. from the previous model) instead of random ones
+
+    Returns
+    -------
+    tuple
+        (user factors, course factors) as float32 arrays
+    """
+    rng = np.random.default_rng(seed)
+    n_users = len(indptr) - 1
+    user_factors = (initial_users if initial_users is not None
+                    else rng.normal(scale=0.01, size=(n_users, factors))).astype(np.float64)
+    course_factors = (initial_courses if initial_courses is not None
+                      else rng.normal(scale=0.01, size=(n_courses, factors))).astype(np.float64)
+    t_indptr, t_indices, t_values = _transpose(indptr, indices, values, n_courses)
+
+    for _ in range(iterations):
+        user_factors = _solve_side(indptr, indices, values, course_factors, regularization, alpha)
+        course_factors = _solve_side(t_indptr, t_indices, t_values, user_factors, regularization, alpha)
+    return user_factors.astype(np.float32), course_factors.astype(np.float32)
+
+
+def save_course_factors(directory, user_ids, course_names, user_factors, course_factors,
+                        indptr, indices, metadata):
+    """Write a trained model as ``.npy`` arrays and a metadata file into ``directory``."""
+    arrays = {
+        'user_factors': user_factors,
+        'course_factors': course_factors,
+        'gramian': (course_factors.astype(np.float64).T @ course_factors).astype(np.float32),
+        'user_indptr': indptr,
+        'user_items': indices,
+    }
+    for name in ARRAY_NAMES:
+        np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(arrays[name]))
+    with open(os.path.join(directory, METADATA_FILENAME), "w") as fh:
+        json.dump(dict(metadata, user_ids=list(user_ids), course_names=list(course_names)), fh)
+
+
+class CourseFactorModel:
+    """
+    Read-only matrix factorisation model for top-N course scoring.
+
+    Factor arrays are memory-mapped, so loading a version costs little more
+    than reading its metadata and processes serving the same version share
+    the page cache. Scoring a user is one (courses x factors) matrix-vector
+    product.
+
+    Parameters
+    ----------
+    directory : str
+        Version directory written by ``save_course_factors``
+    """
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, METADATA_FILENAME)) as fh:
+            metadata = json.load(fh)
+        self.course_names = metadata.pop('course_names')
+        self._user_rows = {user_id: row for row, user_id in enumerate(metadata.pop('user_ids'))}
+        self._course_rows = {name: row for row, name in enumerate(self.course_names)}
+        self.metadata = metadata
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r') for name in ARRAY_NAMES}
+        self._user_factors = arrays['user_factors']
+        self._course_factors = arrays['course_factors']
+        self._gramian = np.asarray(arrays['gramian'], dtype=np.float64)
+        self._user_indptr = arrays['user_indptr']
+        self._user_items = arrays['user_items']
+
+    def has_user(self, user_id):
+        """Whether ``user_id`` was in the training data."""
+        return user_id in self._user_rows
+
+    def recommend(self, user_id, top_n=5):
+        """
+        Return the best-scoring courses for a trained user, excluding their own.
+
+        Parameters
+        ----------
+        user_id : str
+            Id of the user
+        top_n : int, optional
+            Number of results, by default 5
+
+        Returns
+        -------
+        list of dict
+            ``course`` and ``score`` per result, best first; empty for
+            users not in the model
+        """
+        row = self._user_rows.get(user_id)
+        if row is None:
+            return []
+        known = self._user_items[self._user_indptr[row]:self._user_indptr[row + 1]]
+        return self._top_courses(self._user_factors[row], top_n, known)
+
+    def recommend_for_courses(self, course_names, top_n=5):
+        """
+        Fold in an unseen user from courses they are known to like and score all courses.
+
+        Solves the ALS user equation against the fixed course factors, so
+        users who joined after training get recommendations without
+        retraining.
+
+        Parameters
+        ----------
+        course_names : iterable of str
+            Courses the user enrolled in or is close to; unknown names are ignored
+        top_n : int, optional
+            Number of results, by default 5
+
+        Returns
+        -------
+        list of dict
+            ``course`` and ``score`` per result, best first, excluding the
+            input courses
+        """
+        rows = np.array(sorted({self._course_rows[n] for n in course_names if n in self._course_rows}),
+                        dtype=np.int64)
+        if len(rows) == 0:
+            return []
+        factors = np.asarray(self._course_factors[rows], dtype=np.float64)
+        confidence = 1.0 + self.metadata['alpha']
+        system = (self._gramian + (confidence - 1.0) * factors.T @ factors
+                  + self.metadata['regularization'] * np.eye(factors.shape[1]))
+        user_factor = np.linalg.solve(system, confidence * factors.sum(axis=0))
+        return self._top_courses(user_factor, top_n, rows)
+
+    def stats(self):
+        """Report model sizes and training parameters."""
+        return dict(self.metadata, users=len(self._user_rows), courses=len(self.course_names))
+
+    def _top_courses(self, user_factor, top_n, exclude):
+        scores = np.asarray(self._course_factors @ np.asarray(user_factor, dtype=np.float32), dtype=np.float32)
+        scores[np.asarray(exclude, dtype=np.int64)] = -np.inf
+        top_n = min(top_n, int(np.isfinite(scores).sum()))
+        if top_n <= 0:
+            return []
+        top = np.argpartition(-scores, top_n - 1)[:top_n]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [{"course": self.course_names[i], "score": float(scores[i])} for i in top]
+
+
+class CourseFactorIndex:
+    """
+    Serving-side handle on the published course factor model.
+
+    Loads the version published under ``model_dir`` on first use and picks
+    up versions from later training runs every ``refresh_seconds`` without
+    blocking lookups. Without a published model every lookup returns an
+    empty list.
+
+    Parameters
+    ----------
+    model_dir : str
+        Directory the trainer publishes versions to
+    refresh_seconds : float
+        Seconds between checks for a newly published version
+    """
+
+    def __init__(self, model_dir, refresh_seconds):
+        self._artifact = PublishedArtifact(model_dir, refresh_seconds, CourseFactorModel, "Course factor model")
+
+    def model(self):
+        """Return the current ``CourseFactorModel``, or None if none is published."""
+        return self._artifact.get()
+
+    def recommend(self, user_id, fallback_courses=(), top_n=5):
+        """
+        Score courses for ``user_id``, folding the user in from ``fallback_courses`` if untrained.
+
+        Returns
+        -------
+        list of dict
+            ``course`` and ``score`` per result, best first
+        """
+        model = self.model()
+        if model is None:
+            return []
+        if model.has_user(user_id):
+            return model.recommend(user_id, top_n)
+        return model.recommend_for_courses(fallback_courses, top_n)
+
+    def stats(self):
+        """Report the loaded version and its model statistics."""
+        model = self._artifact.get()
+        return dict(model.stats() if model is not None else {}, version_dir=self._artifact.version_dir)
+
+
+def load_warm_start(version_dir, user_ids, course_names, factors, seed=0):
+    """
+    Initial factors for retraining, reusing rows of a previously published model.
+
+    Users and courses present in the previous version start from their
+    trained factors, so a retrain converges in a few sweeps; new ones start
+    random.
+
+    Returns
+    -------
+    tuple or None
+        (initial user factors, initial course factors), or None if the
+        previous model is missing or has another latent dimension
+    """
+    if version_dir is None:
+        return None
+    previous = CourseFactorModel(version_dir)
+    if previous._course_factors.shape[1] != factors:
+        return None
+
+    rng = np.random.default_rng(seed)
+    initial = []
+    for ids, rows_by_id, trained in ((user_ids, previous._user_rows, previous._user_factors),
+                                     (course_names, previous._course_rows, previous._course_factors)):
+        matrix = rng.normal(scale=0.01, size=(len(ids), factors))
+        for row, key in enumerate(ids):
+            previous_row = rows_by_id.get(key)
+            if previous_row is not None:
+                matrix[row] = trained[previous_row]
+        initial.append(matrix)
+    return tuple(initial)
+
@@ -93,6 +93,14 @@ class MySQLConnector:
         connection = None
         SystemLogger.debug("Acquiring MySQL connection from pool")
         
+        if self.pool is None:
+            SystemLogger.error(
+                "MySQL connector is closed - Acquire a new connector from the shared registry",
+                context={'host': self.config['host'], 'database': self.config['database']},
+                fail_fast=False
+            )
+            raise DatabaseConnectionError("MySQL connector is closed")
+        
         try:
             connection = self.pool.get_connection()
             SystemLogger.debug("MySQL connection acquired successfully")
@@ -111,6 +119,18 @@ class MySQLConnector:
                 connection.close()
                 SystemLogger.debug("MySQL connection returned to pool")
     
+    def close(self):
+        """
+        Drop the connection pool so no pooled connection is shared across a fork.
+        
+        ``MySQLConnectionPool`` has no public close; its idle connections are
+        closed when the pool is garbage collected. A closed connector refuses
+        new connections; the shared registry builds a fresh connector (and
+        pool) in each worker.
+        """
+        SystemLogger.debug("Closing MySQL connection pool")
+        self.pool = None
+    
     def execute_query(self, query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
         """
         Execute a SELECT query and return results.
@@ -243,6 +263,47 @@ class MySQLConnector:
                 context={'view_name': 'course_modules_view'}
             )
     
+    def get_catalog_version(self) -> str:
+        """
+        Compute a cheap version string for the course catalog.
+        
+        Aggregates row counts, a checksum over course/module ids and their
+        ``updated_at`` timestamps, and the latest modification time in a
+        single query, so callers can detect inserts, updates and deletes
+        without pulling the catalog itself.
+        
+        Returns
+        -------
+        str
+            Version string that changes whenever the catalog changes
+            
+        Raises
+        ------
+        DatabaseQueryError
+            If the version query fails
+        """
+        SystemLogger.debug("Computing course catalog version from MySQL")
+        
+        query = """
+        SELECT 
+            COUNT(*) AS module_count,
+            COUNT(DISTINCT c.id) AS course_count,
+            COALESCE(SUM(CRC32(CONCAT_WS(':', c.id, m.id, c.updated_at, m.updated_at))), 0) AS checksum,
+            MAX(GREATEST(c.updated_at, m.updated_at)) AS last_updated
+        FROM courses c
+        JOIN modules m ON c.id = m.course_id
+        """
+        
+        rows = self.execute_query(query)
+        if not rows:
+            raise DatabaseQueryError("Catalog version query returned no rows")
+        
+        row = rows[0]
+        version = f"{row['course_count']}:{row['module_count']}:{row['checksum']}:{row['last_updated']}"
+        
+        SystemLogger.debug("Course catalog version computed", {'catalog_version': version})
+        return version
+    
     def search_courses(self, search_term: str) -> List[Dict[str, Any]]:
         """
         Search courses and modules by keyword.
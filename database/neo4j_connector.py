@@ -1,12 +1,40 @@
 import cohere
+import numpy as np
 from neo4j import GraphDatabase
 from neo4j.exceptions import ServiceUnavailable, AuthError, ClientError, TransientError
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
-from core.config import neo4j_uri, neo4j_user, neo4j_password, cohere_api_key, COHERE_EMBED_MODEL
+from utils.vector_math import stack_vectors, normalize_rows, normalize_vector, top_k_cosine, fold_vector
+from core.config import (
+    neo4j_uri, neo4j_user, neo4j_password, cohere_api_key, COHERE_EMBED_MODEL,
+    SIMILARITY_BACKEND, USER_VECTOR_CACHE_REFRESH_SECONDS, USER_VECTOR_DIMENSIONS, USER_PROFILE_DECAY,
+    USER_ANN_INDEX_DIR, ANN_INDEX_TYPE, ANN_HNSW_M, ANN_HNSW_EF_CONSTRUCTION, ANN_HNSW_EF_SEARCH,
+    ANN_IVF_NLIST, ANN_IVF_NPROBE, ANN_PERSIST_SECONDS,
+    USER_EMBEDDING_CACHE_SIZE, USER_EMBEDDING_CACHE_DB,
+    USER_VECTOR_BACKEND, USER_VECTOR_MODEL, UNTAGGED_USER_VECTOR_MODEL, VECTOR_STORAGE_ENCODING,
+    EDUCATION_LEVELS, AGE_GROUPS, PROFESSION_TYPES,
+    COHORT_SEARCH, COHORT_REFRESH_SECONDS, COHORT_TOP_USERS, COHORT_TOP_COURSES,
+    get_embed_model
+)
+from database.user_cohorts import UserCohorts
+from database.user_vector_cache import UserVectorCache
+from database.vector_codec import encode_vector, decode_vector, LOSSLESS_ENCODINGS
+from utils.embedding_cache import EmbeddingCache
 from utils.logger import SystemLogger
 from utils.exceptions import DatabaseConnectionError, DatabaseQueryError, APIRequestError
 
+USER_PROFILE_VECTOR_INDEX = "user_profile_vector"
+# Constraints and range indexes ensured at startup: (kind, name, label, property)
+SCHEMA_OBJECTS = [
+    ("constraint", "user_id_unique", "User", "id"),
+    ("index", "interaction_query", "Interaction", "query"),
+    ("index", "course_name", "Course", "name"),
+    ("index", "user_profile_updated_at", "User", "profile_updated_at"),
+]
+# Cohere accepts at most this many texts per embed call
+COHERE_EMBED_BATCH_SIZE = 96
+# Vector index candidates fetched per requested neighbour, so the profile_model filter
+# applied after the index lookup still leaves top_n users when models are mixed
+VECTOR_INDEX_OVERFETCH = 4
+
 # Initialize Cohere client with error handling
 try:
     co = cohere.Client(cohere_api_key)
@@ -32,15 +60,35 @@ class Neo4jConnector:
     ----------
     driver : neo4j.GraphDatabase.driver
         Neo4j database driver for graph operations
+    similarity_backend : str
+        Effective similarity backend: ``cache``, ``scan``, ``neo4j_index`` or ``ann``
+    user_vector_cache : UserVectorCache or None
+        Resident user profile vectors for similarity search (``cache`` and
+        ``ann`` backends, and fallback for ``neo4j_index``)
+    embedding_cache : EmbeddingCache
+        Memoised Cohere embeddings keyed by model and profile text
+    schema_status : dict
+        Constraints and indexes found, created or failed by ``ensure_schema``
+    user_cohorts : UserCohorts or None
+        Per-cohort centroids, top users and top courses refreshed on a
+        background thread (None when ``COHORT_SEARCH`` is ``off`` or the
+        ``scan`` backend keeps no resident vectors)
         
     Methods
     -------
+    ensure_schema()
+        Create the ``User.id`` constraint and lookup indexes if missing
     get_user_vector(education, age_group, profession, query)
-        Generate user embedding vector using Cohere API
-    get_similar_users(user_vector)
-        Find similar users based on vector similarity
+        Generate unit-norm user embedding vector with Cohere or the local
+        model (``USER_VECTOR_BACKEND``), memoised per profile text
+    get_user_vectors(profiles)
+        Embed many user profiles in batched embedding calls
+    get_similar_users(user_vector, cohort=None)
+        Find distinct similar users by profile vector similarity
+    get_collaborative_context(user_vector, cohort=None)
+        Similar users, their prior responses and enrolled courses in one read
     store_interaction(user_id, education, age_group, profession, user_query, response, user_vector)
-        Store user interaction and profile in graph database
+        Store user interaction and fold its vector into the user's profile vector
     get_enrolled_courses_from_similar_users(user_ids)
         Retrieve course enrollments from similar users
         
@@ -74,6 +122,23 @@ class Neo4jConnector:
             SystemLogger.info("Neo4j connection established successfully", {
                 'uri': neo4j_uri, 'database': 'default'
             })
+            
+            self.schema_status = self.ensure_schema()
+            self.embedding_cache = EmbeddingCache(USER_EMBEDDING_CACHE_SIZE, USER_EMBEDDING_CACHE_DB)
+            self.similarity_backend = SIMILARITY_BACKEND
+            self.user_vector_cache = self._create_user_vector_cache()
+            if self.user_vector_cache is not None:
+                # Loads and reconciles off the request path, which only reads the resident rows
+                self.user_vector_cache.start()
+            self.user_cohorts = self._create_user_cohorts()
+            if SIMILARITY_BACKEND == 'neo4j_index' and VECTOR_STORAGE_ENCODING != 'list':
+                # Vector indexes only cover list properties, not encoded bytes
+                SystemLogger.info("Neo4j vector index needs list-encoded vectors - Using in-process similarity", {
+                    'vector_storage_encoding': VECTOR_STORAGE_ENCODING
+                })
+                self.similarity_backend = 'cache'
+            elif SIMILARITY_BACKEND == 'neo4j_index' and not self._ensure_vector_index():
+                self.similarity_backend = 'cache'
         except AuthError as e:
             SystemLogger.error(
                 "Neo4j authentication failed - Check username and password",
@@ -96,6 +161,163 @@ class Neo4jConnector:
             )
             raise DatabaseConnectionError(f"Neo4j connection failed: {e}")
 
+    def _create_user_vector_cache(self):
+        """Build the in-process similarity structure for the configured backend."""
+        if SIMILARITY_BACKEND == 'scan':
+            return None
+        
+        if SIMILARITY_BACKEND == 'ann':
+            # Imported here so FAISS is only loaded when the ANN backend is used
+            from database.ann_index import AnnUserVectorIndex, AnnIndexParams
+            params = AnnIndexParams(
+                index_type=ANN_INDEX_TYPE,
+                hnsw_m=ANN_HNSW_M,
+                hnsw_ef_construction=ANN_HNSW_EF_CONSTRUCTION,
+                hnsw_ef_search=ANN_HNSW_EF_SEARCH,
+                ivf_nlist=ANN_IVF_NLIST,
+                ivf_nprobe=ANN_IVF_NPROBE
+            )
+            return AnnUserVectorIndex(
+                self.driver, USER_VECTOR_CACHE_REFRESH_SECONDS, USER_ANN_INDEX_DIR,
+                params, ANN_PERSIST_SECONDS, USER_VECTOR_MODEL, UNTAGGED_USER_VECTOR_MODEL
+            )
+        
+        # The cache only loads on first use, so keeping it as the index fallback is free
+        return UserVectorCache(
+            self.driver, USER_VECTOR_CACHE_REFRESH_SECONDS, USER_VECTOR_MODEL, UNTAGGED_USER_VECTOR_MODEL
+        )
+
+    def ensure_schema(self):
+        """
+        Create the ``SCHEMA_OBJECTS`` constraints and range indexes that are missing.
+        
+        The ``User.id`` uniqueness constraint backs the MERGE in
+        ``store_interaction`` and the ``u.id IN $user_ids`` lookups; the
+        ``Interaction.query`` and ``Course.name`` indexes back response and
+        course lookups, which are otherwise label scans, and the
+        ``User.profile_updated_at`` index backs the user vector cache's delta
+        reads. An equivalent object
+        under another name counts as existing. Failures (for example duplicate
+        user ids blocking the constraint) are logged and leave the lookup
+        unindexed.
+        
+        Returns
+        -------
+        dict
+            ``existing``, ``created`` and ``failed`` lists of schema object names
+        """
+        status = {'existing': [], 'created': [], 'failed': []}
+        with self.driver.session() as session:
+            for kind, name, label, prop in SCHEMA_OBJECTS:
+                try:
+                    existing = self._find_schema_object(session, kind, label, prop)
+                    if existing:
+                        status['existing'].append(existing)
+                        continue
+                    if kind == 'constraint':
+                        statement = (f"CREATE CONSTRAINT {name} IF NOT EXISTS "
+                                     f"FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE")
+                    else:
+                        statement = f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON (n.{prop})"
+                    session.run(statement).consume()
+                    status['created'].append(name)
+                except Exception as e:
+                    SystemLogger.error(
+                        f"Failed to create Neo4j {kind} - Lookups on {label}.{prop} stay unindexed",
+                        exception=e,
+                        context={'name': name, 'cypher_error_code': getattr(e, 'code', 'unknown')},
+                        fail_fast=False
+                    )
+                    status['failed'].append(name)
+        
+        SystemLogger.info("Neo4j schema ensured", status)
+        return status
+
+    @staticmethod
+    def _find_schema_object(session, kind, label, prop):
+        """Name of a uniqueness constraint or range index on ``label.prop``, or None."""
+        if kind == 'constraint':
+            query = """
+                SHOW CONSTRAINTS YIELD name, type, labelsOrTypes, properties
+                WHERE type IN ['UNIQUENESS', 'NODE_PROPERTY_UNIQUENESS', 'NODE_KEY']
+                  AND labelsOrTypes = [$label] AND properties = [$prop]
+                RETURN name LIMIT 1
+            """
+        else:
+            query = """
+                SHOW INDEXES YIELD name, type, labelsOrTypes, properties
+                WHERE type = 'RANGE' AND labelsOrTypes = [$label] AND properties = [$prop]
+                RETURN name LIMIT 1
+            """
+        record = session.run(query, label=label, prop=prop).single()
+        return record["name"] if record else None
+
+    def _ensure_vector_index(self):
+        """
+        Create the cosine vector index on User.profile_vector if it is missing.
+        
+        Returns
+        -------
+        bool
+            True if the index exists and is online; False if the server does
+            not support vector indexes or the index could not be created
+        """
+        SystemLogger.debug("Ensuring Neo4j vector index on User.profile_vector", {
+            'index': USER_PROFILE_VECTOR_INDEX, 'dimensions': USER_VECTOR_DIMENSIONS
+        })
+        
+        # OPTIONS does not accept parameters; the dimension is a validated int
+        create_statement = (
+            f"CREATE VECTOR INDEX {USER_PROFILE_VECTOR_INDEX} IF NOT EXISTS "
+            "FOR (u:User) ON (u.profile_vector) "
+            "OPTIONS {indexConfig: {"
+            f"`vector.dimensions`: {int(USER_VECTOR_DIMENSIONS)}, "
+            "`vector.similarity_function`: 'cosine'}}"
+        )
+        
+        try:
+            with self.driver.session() as session:
+                exists = session.run(
+                    "SHOW INDEXES YIELD name WHERE name = $name RETURN count(*) AS n",
+                    name=USER_PROFILE_VECTOR_INDEX
+                ).single()["n"] > 0
+                if not exists:
+                    try:
+                        session.run(create_statement).consume()
+                    except ClientError:
+                        # Servers before CREATE VECTOR INDEX syntax (5.11-5.14) only have the procedure
+                        session.run(
+                            "CALL db.index.vector.createNodeIndex($name, 'User', 'profile_vector', $dimensions, 'cosine')",
+                            name=USER_PROFILE_VECTOR_INDEX, dimensions=int(USER_VECTOR_DIMENSIONS)
+                        ).consume()
+                session.run(
+                    "CALL db.awaitIndex($name, 300)", name=USER_PROFILE_VECTOR_INDEX
+                ).consume()
+            SystemLogger.info("Neo4j vector index ready for user similarity", {
+                'index': USER_PROFILE_VECTOR_INDEX, 'dimensions': USER_VECTOR_DIMENSIONS
+            })
+            return True
+        except Exception as e:
+            SystemLogger.error(
+                "Neo4j vector index unavailable - Server may predate vector indexes; falling back to in-process similarity",
+                exception=e,
+                context={
+                    'index': USER_PROFILE_VECTOR_INDEX,
+                    'cypher_error_code': getattr(e, 'code', 'unknown')
+                },
+                fail_fast=False
+            )
+            return False
+
+    def close(self):
+        """Stop the cohort and user vector sync threads and close the Neo4j driver and its connection pool."""
+        SystemLogger.debug("Closing Neo4j driver")
+        if self.user_cohorts is not None:
+            self.user_cohorts.stop()
+        if self.user_vector_cache is not None:
+            self.user_vector_cache.stop()
+        self.driver.close()
+
     def store_interaction(self, user_id, education, age_group, profession, user_query, response, user_vector):
         SystemLogger.debug("Storing user interaction in Neo4j", {
             'user_id': user_id, 'education': education, 'age_group': age_group, 'profession': profession
@@ -103,8 +325,10 @@ class Neo4jConnector:
         
         try:
             with self.driver.session() as session:
-                session.execute_write(
-                    self._create_interaction, user_id, education, age_group, profession, user_query, response, user_vector
+                profile = session.execute_write(
+                    self._create_interaction, user_id, education, age_group, profession, user_query, response,
+                    user_vector, USER_PROFILE_DECAY, USER_VECTOR_MODEL, UNTAGGED_USER_VECTOR_MODEL,
+                    VECTOR_STORAGE_ENCODING
                 )
             SystemLogger.info("User interaction stored successfully in Neo4j", {
                 'user_id': user_id, 'query_preview': user_query[:100] if user_query else 'N/A'
@@ -134,27 +358,102 @@ class Neo4jConnector:
                 context={'user_id': user_id, 'education': education, 'age_group': age_group}
             )
             raise DatabaseQueryError(f"Failed to store interaction: {e}")
+        
+        if self.user_vector_cache is not None:
+            self.user_vector_cache.upsert(
+                profile["element_id"], user_id, user_query, profile["profile_vector"], profile["updated_at"],
+                normalized=profile["normalized"]
+            )
 
     @staticmethod
-    def _create_interaction(tx, user_id, education, age_group, profession, user_query, response, user_vector):
-        tx.run("""
+    def _create_interaction(tx, user_id, education, age_group, profession, user_query, response, user_vector,
+                            decay, model, untagged_model, encoding):
+        # Incrementing profile_count first takes the User write lock, so concurrent writes
+        # for the same user fold their vectors in one after another instead of racing.
+        # A profile stored without a count (count 1 after the increment) reports how many
+        # interactions it was built from instead
+        user = tx.run("""
             MERGE (u:User {id: $user_id})
             SET u.education = $education,
                 u.age_group = $age_group,
-                u.profession = $profession
+                u.profession = $profession,
+                u.profile_count = coalesce(u.profile_count, 0) + 1
+            RETURN elementId(u) AS element_id, u.profile_count AS profile_count,
+                   u.profile_vector AS profile_vector,
+                   coalesce(u.profile_model, $untagged_model) AS profile_model,
+                   CASE WHEN u.profile_count = 1 AND u.profile_vector IS NOT NULL THEN COUNT {
+                       MATCH (u)-[:MADE]->(i:Interaction)
+                       WHERE i.user_vector IS NOT NULL AND coalesce(i.embedding_model, $untagged_model) = $model
+                   } END AS folded_interactions
+        """, user_id=user_id,
+             education=education,
+             age_group=age_group,
+             profession=profession,
+             model=model,
+             untagged_model=untagged_model).single()
+        
+        # Stored unit-norm so similarity scoring never recomputes candidate norms. Lossy
+        # encodings break the unit norm, so only lossless ones are flagged as normalised
+        unit_vector = normalize_vector(user_vector)
+        vector = np.asarray(unit_vector if unit_vector is not None else user_vector, dtype=np.float64)
+        lossless = encoding in LOSSLESS_ENCODINGS
+        
+        # Folded here rather than in Cypher so encoded (byte) profiles can be updated too;
+        # a vector from another embedding model restarts the profile instead of mixing spaces.
+        # The profile is renormalised after each fold, so it tracks the mean direction.
+        profile = decode_vector(user["profile_vector"])
+        if profile is None or user["profile_model"] != model or len(profile) != len(vector):
+            # A restarted profile is a running mean from this interaction on
+            profile_vector, profile_count = vector, 1
+        else:
+            profile_count = user["profile_count"]
+            if user["folded_interactions"] is not None:
+                # Uncounted profiles keep the weight of their history (at least one interaction)
+                profile_count = max(user["folded_interactions"], 1) + 1
+            profile_vector = fold_vector(
+                np.asarray(profile, dtype=np.float64), vector, profile_count, decay
+            )
+        unit_profile = normalize_vector(profile_vector)
+        profile_normalized = unit_profile is not None
+        if profile_normalized:
+            profile_vector = unit_profile
+        
+        result = tx.run("""
+            MATCH (u:User) WHERE elementId(u) = $element_id
             CREATE (i:Interaction {
                 query: $user_query,
                 response: $response,
-                user_vector: $user_vector
+                user_vector: $user_vector,
+                vector_encoding: $encoding,
+                vector_normalized: $vector_normalized,
+                embedding_model: $model,
+                created_at: timestamp()
             })
             MERGE (u)-[:MADE]->(i)
-        """, user_id=user_id,
-             education=education,
-             age_group=age_group,
-             profession=profession,
+            SET u.profile_vector = $profile_vector,
+                u.profile_count = $profile_count,
+                u.vector_encoding = $encoding,
+                u.vector_normalized = $profile_normalized,
+                u.profile_model = $model,
+                u.last_query = $user_query,
+                u.profile_updated_at = i.created_at
+            RETURN u.profile_updated_at AS updated_at
+        """, element_id=user["element_id"],
              user_query=user_query,
              response=response,
-             user_vector=user_vector)
+             user_vector=encode_vector(vector, encoding),
+             profile_vector=encode_vector(profile_vector, encoding),
+             profile_count=profile_count,
+             encoding=encoding,
+             vector_normalized=unit_vector is not None and lossless,
+             profile_normalized=profile_normalized and lossless,
+             model=model)
+        return {
+            "element_id": user["element_id"],
+            "profile_vector": profile_vector.tolist(),
+            "normalized": profile_normalized,
+            "updated_at": result.single()["updated_at"],
+        }
 
     def get_all_user_vectors(self):
      with self.driver.session() as session:
@@ -163,48 +462,55 @@ class Neo4jConnector:
     @staticmethod
     def _get_all_user_vectors(tx):
       query = """
-        MATCH (u:User)-[:MADE]->(i:Interaction)
-        WHERE i.user_vector IS NOT NULL
-        RETURN u.id AS user_id, i.query AS query, i.user_vector AS user_vector
+        MATCH (u:User)
+        WHERE u.profile_vector IS NOT NULL
+          AND coalesce(u.profile_model, $untagged_model) = $model
+        RETURN u.id AS user_id, u.last_query AS query, u.profile_vector AS user_vector,
+               coalesce(u.vector_normalized, false) AND coalesce(u.vector_encoding, 'list') IN $lossless_encodings AS normalized
     """
-      result = tx.run(query)
+      result = tx.run(query, model=USER_VECTOR_MODEL, untagged_model=UNTAGGED_USER_VECTOR_MODEL,
+                      lossless_encodings=list(LOSSLESS_ENCODINGS))
       return [
         {
             "user_id": record["user_id"],
             "query": record["query"],
-            "user_vector": record["user_vector"]
+            "user_vector": decode_vector(record["user_vector"]),
+            "normalized": record["normalized"]
         }
         for record in result
       ]
     def get_user_vector(self, education, age_group, profession, user_query):
-        SystemLogger.debug("Generating user vector with Cohere", {
-            'education': education, 'age_group': age_group, 'profession': profession
+        SystemLogger.debug("Generating user vector", {
+            'education': education, 'age_group': age_group, 'profession': profession,
+            'backend': USER_VECTOR_BACKEND
         })
         
-        profile_text = (
-            f"User with {education} education, aged {age_group}, "
-            f"working at {profession} level. Recently asked: '{user_query}'"
-        )
+        profile_text = self._profile_text(education, age_group, profession, user_query)
+        
+        cached = self.embedding_cache.get(USER_VECTOR_MODEL, profile_text)
+        if cached is not None:
+            SystemLogger.debug("User vector served from embedding cache", {
+                'vector_dimension': len(cached), 'model': USER_VECTOR_MODEL
+            })
+            return cached
         
         try:
-            response = co.embed(
-                texts=[profile_text],
-                model=cohere_model,
-                input_type="clustering"
-            )
+            embeddings = self._embed_texts([profile_text])
             
-            if not response.embeddings or not response.embeddings[0]:
+            if not embeddings or not embeddings[0]:
                 SystemLogger.error(
-                    "Cohere API returned empty embeddings - Check input text and model availability",
-                    context={'profile_text': profile_text, 'model': cohere_model}
+                    "Embedding backend returned empty embeddings - Check input text and model availability",
+                    context={'profile_text': profile_text, 'model': USER_VECTOR_MODEL}
                 )
-                raise APIRequestError("Cohere returned empty embeddings")
+                raise APIRequestError("Embedding backend returned empty embeddings")
             
             SystemLogger.debug("User vector generated successfully", {
-                'vector_dimension': len(response.embeddings[0]),
-                'model': cohere_model
+                'vector_dimension': len(embeddings[0]),
+                'model': USER_VECTOR_MODEL
             })
-            return response.embeddings[0]
+            user_vector = self._unit_list(embeddings[0])
+            self.embedding_cache.put(USER_VECTOR_MODEL, profile_text, user_vector)
+            return user_vector
             
         except cohere.errors.CohereAPIError as e:
             SystemLogger.error(
@@ -219,71 +525,522 @@ class Neo4jConnector:
             raise APIRequestError(f"Cohere API error: {e}")
         except Exception as e:
             SystemLogger.error(
-                "Unexpected error generating user vector with Cohere",
+                "Unexpected error generating user vector",
                 exception=e,
-                context={'profile_text': profile_text, 'model': cohere_model}
+                context={'profile_text': profile_text, 'model': USER_VECTOR_MODEL, 'backend': USER_VECTOR_BACKEND}
             )
             raise APIRequestError(f"Failed to generate user vector: {e}")
 
-    def get_similar_users(self, user_vector, top_n=5):
+    def get_user_vectors(self, profiles):
+        """
+        Embed many user profiles with as few embedding calls as possible.
+        
+        Cached profiles are served from the embedding cache; the rest are
+        de-duplicated and sent ``COHERE_EMBED_BATCH_SIZE`` texts per call. A
+        failed call or an invalid profile only fails its own items.
+        
+        Parameters
+        ----------
+        profiles : list of dict
+            Each with ``education``, ``age_group``, ``profession`` and ``query``
+        
+        Returns
+        -------
+        list of dict
+            One entry per input profile, in input order, with ``vector``
+            (list of float, or None on failure) and ``error`` (str or None)
+        """
+        results = [None] * len(profiles)
+        # Profile text -> input positions waiting for it
+        pending = {}
+        
+        for position, profile in enumerate(profiles):
+            try:
+                profile_text = self._profile_text(
+                    profile["education"], profile["age_group"], profile["profession"], profile["query"]
+                )
+            except (KeyError, TypeError) as e:
+                results[position] = {"vector": None, "error": f"Invalid profile: missing {e}"}
+                continue
+            
+            cached = self.embedding_cache.get(USER_VECTOR_MODEL, profile_text)
+            if cached is not None:
+                results[position] = {"vector": cached, "error": None}
+            else:
+                pending.setdefault(profile_text, []).append(position)
+        
+        texts = list(pending)
+        failed_calls = 0
+        for start in range(0, len(texts), COHERE_EMBED_BATCH_SIZE):
+            batch = texts[start:start + COHERE_EMBED_BATCH_SIZE]
+            try:
+                embeddings = list(self._embed_texts(batch) or [])
+                if len(embeddings) != len(batch):
+                    raise APIRequestError(
+                        f"Embedding backend returned {len(embeddings)} embeddings for {len(batch)} texts"
+                    )
+            except Exception as e:
+                failed_calls += 1
+                SystemLogger.error(
+                    "Batch embedding call failed - Reporting its profiles as failed",
+                    exception=e,
+                    context={
+                        'batch_size': len(batch),
+                        'model': USER_VECTOR_MODEL,
+                        'api_error_code': getattr(e, 'status_code', 'unknown')
+                    },
+                    fail_fast=False
+                )
+                for profile_text in batch:
+                    for position in pending[profile_text]:
+                        results[position] = {"vector": None, "error": f"Embedding error: {e}"}
+                continue
+            
+            for profile_text, embedding in zip(batch, embeddings):
+                if embedding:
+                    embedding = self._unit_list(embedding)
+                    self.embedding_cache.put(USER_VECTOR_MODEL, profile_text, embedding)
+                    outcome = {"vector": embedding, "error": None}
+                else:
+                    outcome = {"vector": None, "error": "Embedding backend returned an empty embedding"}
+                for position in pending[profile_text]:
+                    results[position] = dict(outcome)
+        
+        SystemLogger.info("Batch user vector generation completed", {
+            'profiles': len(profiles),
+            'embedded_texts': len(texts),
+            'api_calls': -(-len(texts) // COHERE_EMBED_BATCH_SIZE),
+            'failed_calls': failed_calls,
+            'failed_profiles': sum(1 for r in results if r["error"] is not None),
+            'model': USER_VECTOR_MODEL
+        })
+        return results
+
+    @staticmethod
+    def _unit_list(embedding):
+        """L2-normalise an embedding once here, so stored vectors and queries are unit-norm."""
+        unit_vector = normalize_vector(embedding)
+        return embedding if unit_vector is None else unit_vector.tolist()
+
+    @staticmethod
+    def _embed_texts(texts):
+        """Embed profile texts with the configured user vector backend."""
+        if USER_VECTOR_BACKEND == 'local':
+            # Same in-process model as the FAISS stores; no network round-trip
+            return get_embed_model().embed_documents(texts)
+        return co.embed(texts=texts, model=cohere_model, input_type="clustering").embeddings
+
+    @staticmethod
+    def _profile_text(education, age_group, profession, user_query):
+        return (
+            f"User with {education} education, aged {age_group}, "
+            f"working at {profession} level. Recently asked: '{user_query}'"
+        )
+
+    def get_similar_users(self, user_vector, top_n=5, cohort=None):
         SystemLogger.debug("Computing user similarity vectors", {
             'top_n': top_n, 'input_vector_dimension': len(user_vector) if user_vector else 0
         })
         
         try:
-            all_users = self.get_all_user_vectors()
-            if not all_users:
-                SystemLogger.info("No existing user vectors found in Neo4j database")
-                return []
-                
-            SystemLogger.debug(f"Retrieved user vectors for similarity computation", {
-                'total_users': len(all_users)
-            })
+            return self._find_similar_users(user_vector, top_n, cohort)
             
-            similarities = []
-            failed_computations = 0
+        except Exception as e:
+            SystemLogger.error(
+                "Failed to compute user similarities - Error in vector computation or database query",
+                exception=e,
+                context={'top_n': top_n, 'vector_provided': user_vector is not None}
+            )
+            raise DatabaseQueryError(f"Failed to compute user similarities: {e}")
 
-            for user in all_users:
-                try:
-                    if not user.get("user_vector"):
-                        SystemLogger.debug(f"Skipping user with empty vector", {'user_id': user.get('user_id')})
-                        continue
-                        
-                    similarity = cosine_similarity([user_vector], [user["user_vector"]])
-                    similarities.append({
-                        "user_id": user["user_id"],
-                        "query": user["query"],
-                        "score": similarity[0][0]
-                    })
-                except Exception as e:
-                    failed_computations += 1
-                    SystemLogger.debug(f"Failed to compute similarity for user", {
-                        'user_id': user.get('user_id'), 'error': str(e)
-                    })
-
-            if failed_computations > 0:
-                SystemLogger.info(f"Some similarity computations failed", {
-                    'failed_count': failed_computations, 'successful_count': len(similarities)
-                })
+    def _find_similar_users(self, user_vector, top_n, cohort, use_index=True):
+        """
+        Rank similar users, narrowing to or falling back on ``cohort`` per ``COHORT_SEARCH``.
 
-            similarities.sort(key=lambda x: x["score"], reverse=True)
-            result = similarities[:top_n]
-            
-            SystemLogger.info("User similarity computation completed", {
-                'total_computed': len(similarities),
-                'returned_count': len(result),
-                'top_score': result[0]['score'] if result else 0
-            })
-            
+        In ``narrow`` mode the cohort's precomputed users are searched first
+        and the full search only runs when they yield nothing. In ``fallback``
+        mode the full search runs first and the cohort answers when it finds
+        no one or fails.
+        """
+        if COHORT_SEARCH == 'narrow':
+            result = self._cohort_similar_users(user_vector, cohort, top_n)
+            if result:
+                return result
+
+        try:
+            result = None
+            if use_index and self.similarity_backend == 'neo4j_index':
+                result = self._index_similar_users(user_vector, top_n)
+            if result is None:
+                result = self._in_process_similar_users(user_vector, top_n)
+        except Exception as e:
+            result = self._cohort_similar_users(user_vector, cohort, top_n) if COHORT_SEARCH == 'fallback' else []
+            if not result:
+                raise
+            SystemLogger.error(
+                "User similarity search failed - Answering from the user's cohort",
+                exception=e,
+                context={'cohort': list(cohort), 'returned_count': len(result)},
+                fail_fast=False
+            )
             return result
+
+        if not result and COHORT_SEARCH == 'fallback':
+            result = self._cohort_similar_users(user_vector, cohort, top_n)
+        return result
+
+    def _create_user_cohorts(self):
+        """Build the cohort neighbourhoods on the resident vector cache, or None if disabled."""
+        if COHORT_SEARCH == 'off':
+            return None
+        if self.user_vector_cache is None:
+            SystemLogger.info("User cohorts need a resident user vector cache - Cohort search disabled", {
+                'similarity_backend': SIMILARITY_BACKEND, 'cohort_search': COHORT_SEARCH
+            })
+            return None
+        user_cohorts = UserCohorts(
+            self.driver, self.user_vector_cache, COHORT_REFRESH_SECONDS,
+            (EDUCATION_LEVELS, AGE_GROUPS, PROFESSION_TYPES), COHORT_TOP_USERS, COHORT_TOP_COURSES
+        )
+        # Cohorts are rebuilt off the request path, which only reads the last published snapshot
+        user_cohorts.start()
+        return user_cohorts
+
+    def _cohort_similar_users(self, user_vector, cohort, top_n):
+        """Search the precomputed users of ``cohort``; empty without a cohort or if the lookup fails."""
+        if cohort is None or self.user_cohorts is None:
+            return []
+        try:
+            result = self.user_cohorts.top_k(user_vector, cohort, top_n)
+        except Exception as e:
+            SystemLogger.error(
+                "User cohort lookup failed - Continuing without cohort results",
+                exception=e,
+                context={'cohort': list(cohort)},
+                fail_fast=False
+            )
+            return []
+
+        SystemLogger.info("User similarity computation completed", {
+            'backend': 'cohort', 'cohort': list(cohort), 'returned_count': len(result),
+            'top_score': result[0]["score"] if result else None
+        })
+        return result
+
+    def _in_process_similar_users(self, user_vector, top_n):
+        """Rank users with the in-process cache or ANN index, or by scanning every profile."""
+        if self.user_vector_cache is None:
+            return self._scan_similar_users(user_vector, top_n)
+
+        result = self.user_vector_cache.top_k(user_vector, top_n)
+        SystemLogger.info("User similarity computation completed", dict(
+            self.user_vector_cache.stats(),
+            backend='ann' if self.similarity_backend == 'ann' else 'cache',
+            returned_count=len(result),
+            top_score=result[0]['score'] if result else 0
+        ))
+        return result
+
+    def _index_similar_users(self, user_vector, top_n):
+        """Ask the Neo4j vector index for the top-k user profiles; None if the query fails."""
+        try:
+            with self.driver.session() as session:
+                result = session.execute_read(
+                    self._query_vector_index, [float(x) for x in user_vector], top_n
+                )
+        except Exception as e:
+            SystemLogger.error(
+                "Neo4j vector index query failed - Falling back to in-process similarity",
+                exception=e,
+                context={
+                    'index': USER_PROFILE_VECTOR_INDEX,
+                    'cypher_error_code': getattr(e, 'code', 'unknown'),
+                    'vector_dimension': len(user_vector) if user_vector else 0
+                },
+                fail_fast=False
+            )
+            return None
+        
+        SystemLogger.info("User similarity computation completed", {
+            'backend': 'neo4j_index',
+            'returned_count': len(result),
+            'top_score': result[0]['score'] if result else 0
+        })
+        return result
+
+    @staticmethod
+    def _query_vector_index(tx, user_vector, top_n):
+        records = tx.run("""
+            CALL db.index.vector.queryNodes($index, $candidates, $user_vector)
+            YIELD node, score
+            WHERE coalesce(node.profile_model, $untagged_model) = $model
+            RETURN node.id AS user_id, node.last_query AS query, score
+            ORDER BY score DESC
+            LIMIT $top_n
+        """, index=USER_PROFILE_VECTOR_INDEX, candidates=top_n * VECTOR_INDEX_OVERFETCH, top_n=top_n,
+             user_vector=user_vector, model=USER_VECTOR_MODEL, untagged_model=UNTAGGED_USER_VECTOR_MODEL)
+        # Neo4j rescales cosine similarity to [0, 1]; report raw cosine like the other backends
+        return [
+            {"user_id": r["user_id"], "query": r["query"], "score": 2.0 * r["score"] - 1.0}
+            for r in records
+        ]
+
+    def _scan_similar_users(self, user_vector, top_n):
+        """Score every stored user profile vector, read from Neo4j for this request."""
+        all_users = self.get_all_user_vectors()
+        if not all_users:
+            SystemLogger.info("No existing user vectors found in Neo4j database")
+            return []
             
+        SystemLogger.debug(f"Retrieved user vectors for similarity computation", {
+            'total_users': len(all_users)
+        })
+        
+        query_vector = normalize_vector(user_vector)
+        if query_vector is None:
+            SystemLogger.info("Query vector is empty or degenerate - No similar users computed", {
+                'vector_provided': user_vector is not None
+            })
+            return []
+        
+        # One contiguous float32 matrix; malformed, empty or zero rows are masked out
+        matrix, valid_indices = stack_vectors(
+            [user.get("user_vector") for user in all_users], query_vector.shape[0]
+        )
+        skipped = len(all_users) - len(valid_indices)
+        if skipped > 0:
+            SystemLogger.info("Skipped unusable user vectors", {
+                'skipped_count': skipped, 'usable_count': len(valid_indices)
+            })
+        
+        # Vectors stored unit-norm skip the per-candidate norm; scoring is then a plain dot product
+        unit_rows = np.fromiter(
+            (bool(all_users[i].get("normalized")) for i in valid_indices), dtype=bool, count=len(valid_indices)
+        )
+        top_rows, top_scores = top_k_cosine(query_vector, normalize_rows(matrix, unit_rows), top_n)
+        result = []
+        for row, score in zip(top_rows, top_scores):
+            user = all_users[valid_indices[row]]
+            result.append({
+                "user_id": user["user_id"],
+                "query": user["query"],
+                "score": float(score)
+            })
+        
+        SystemLogger.info("User similarity computation completed", {
+            'backend': 'scan',
+            'total_computed': len(valid_indices),
+            'returned_count': len(result),
+            'top_score': result[0]['score'] if result else 0
+        })
+        
+        return result
+
+    def get_collaborative_context(self, user_vector, top_n=5, cohort=None):
+        """
+        Fetch similar users, the responses to the top user's query and the
+        users' enrolled courses in one read transaction.
+
+        Replaces ``get_similar_users`` followed by ``get_recommendations_for_user``
+        and ``get_enrolled_courses_from_similar_users``, which cost a session and
+        a Bolt round-trip each. With the ``neo4j_index`` backend the vector index
+        lookup runs in the same Cypher statement; otherwise neighbours are ranked
+        in process and only their ids and the top query are sent to Neo4j.
+
+        Parameters
+        ----------
+        user_vector : list of float
+            Embedding of the current user
+        top_n : int, optional
+            Number of similar users, by default 5
+        cohort : tuple of str, optional
+            (education, age_group, profession) of the user, used to narrow
+            or back up the search as configured by ``COHORT_SEARCH``
+
+        Returns
+        -------
+        dict
+            ``similar_users`` (as returned by ``get_similar_users``),
+            ``responses`` stored for the most similar user's query and distinct
+            ``courses`` the similar users enrolled in
+        """
+        SystemLogger.debug("Fetching collaborative context", {
+            'top_n': top_n, 'input_vector_dimension': len(user_vector) if user_vector else 0
+        })
+
+        try:
+            # Narrowing searches the cohort before any index lookup
+            index_tried = self.similarity_backend == 'neo4j_index' and COHORT_SEARCH != 'narrow'
+            context = self._index_collaborative_context(user_vector, top_n) if index_tried else None
+            if context is not None and not context["similar_users"] and COHORT_SEARCH == 'fallback' and cohort is not None:
+                # Let the cohort answer instead of an empty index result
+                context = None
+
+            if context is None:
+                similar_users = self._find_similar_users(user_vector, top_n, cohort, use_index=not index_tried)
+                context = {"similar_users": similar_users, "responses": [], "courses": []}
+                if similar_users:
+                    user_ids = [user["user_id"] for user in similar_users if user.get("user_id")]
+                    with self.driver.session() as session:
+                        context["responses"], context["courses"] = session.execute_read(
+                            self._read_neighbour_context, user_ids, similar_users[0].get("query") or None
+                        )
+
+            return context
+
         except Exception as e:
             SystemLogger.error(
-                "Failed to compute user similarities - Error in vector computation or database query",
+                "Failed to fetch collaborative context - Error in vector computation or database query",
                 exception=e,
                 context={'top_n': top_n, 'vector_provided': user_vector is not None}
             )
-            raise DatabaseQueryError(f"Failed to compute user similarities: {e}")
+            raise DatabaseQueryError(f"Failed to fetch collaborative context: {e}")
+
+    def _index_collaborative_context(self, user_vector, top_n):
+        """Run the vector index lookup and neighbour reads as one statement; None if it fails."""
+        try:
+            with self.driver.session() as session:
+                context = session.execute_read(
+                    self._query_collaborative_context, [float(x) for x in user_vector], top_n
+                )
+        except Exception as e:
+            SystemLogger.error(
+                "Neo4j vector index query failed - Falling back to in-process similarity",
+                exception=e,
+                context={
+                    'index': USER_PROFILE_VECTOR_INDEX,
+                    'cypher_error_code': getattr(e, 'code', 'unknown'),
+                    'vector_dimension': len(user_vector) if user_vector else 0
+                },
+                fail_fast=False
+            )
+            return None
+
+        similar_users = context["similar_users"]
+        SystemLogger.info("User similarity computation completed", {
+            'backend': 'neo4j_index',
+            'returned_count': len(similar_users),
+            'top_score': similar_users[0]['score'] if similar_users else 0
+        })
+        return context
+
+    @staticmethod
+    def _query_collaborative_context(tx, user_vector, top_n):
+        record = tx.run("""
+            CALL db.index.vector.queryNodes($index, $candidates, $user_vector)
+            YIELD node, score
+            WHERE coalesce(node.profile_model, $untagged_model) = $model
+            WITH node, score ORDER BY score DESC LIMIT $top_n
+            WITH collect({user_id: node.id, query: node.last_query, score: score}) AS neighbours
+            WITH neighbours,
+                 CASE WHEN size(neighbours) > 0 AND neighbours[0].query <> '' THEN neighbours[0].query END AS top_query
+            CALL {
+                WITH top_query
+                MATCH (i:Interaction {query: top_query})
+                RETURN collect(i.response) AS responses
+            }
+            CALL {
+                WITH neighbours
+                MATCH (u:User)-[:ENROLLED_IN]->(c:Course)
+                WHERE u.id IN [n IN neighbours | n.user_id]
+                RETURN collect(DISTINCT c.name) AS courses
+            }
+            RETURN neighbours, responses, courses
+        """, index=USER_PROFILE_VECTOR_INDEX, candidates=top_n * VECTOR_INDEX_OVERFETCH, top_n=top_n,
+             user_vector=user_vector, model=USER_VECTOR_MODEL, untagged_model=UNTAGGED_USER_VECTOR_MODEL).single()
+        # Neo4j rescales cosine similarity to [0, 1]; report raw cosine like the other backends
+        return {
+            "similar_users": [
+                {"user_id": n["user_id"], "query": n["query"], "score": 2.0 * n["score"] - 1.0}
+                for n in record["neighbours"]
+            ],
+            "responses": record["responses"],
+            "courses": record["courses"],
+        }
+
+    @staticmethod
+    def _read_neighbour_context(tx, user_ids, query):
+        record = tx.run("""
+            CALL {
+                MATCH (i:Interaction {query: $query})
+                RETURN collect(i.response) AS responses
+            }
+            CALL {
+                MATCH (u:User)-[:ENROLLED_IN]->(c:Course)
+                WHERE u.id IN $user_ids
+                RETURN collect(DISTINCT c.name) AS courses
+            }
+            RETURN responses, courses
+        """, user_ids=user_ids, query=query).single()
+        return record["responses"], record["courses"]
+
+    def get_cohort_courses(self, cohort):
+        """
+        Return the most-enrolled courses of a user cohort.
+
+        Reads the last refreshed cohort snapshot only, so it costs no query.
+
+        Parameters
+        ----------
+        cohort : tuple of str
+            (education, age_group, profession)
+
+        Returns
+        -------
+        list of str
+            Course names, most enrolled first; empty without cohorts, before
+            the first refresh or if the lookup fails
+        """
+        if cohort is None or self.user_cohorts is None:
+            return []
+        try:
+            entry = self.user_cohorts.get(cohort)
+        except Exception as e:
+            SystemLogger.error(
+                "User cohort lookup failed - Continuing without cohort courses",
+                exception=e,
+                context={'cohort': list(cohort)},
+                fail_fast=False
+            )
+            return []
+        return [course["course"] for course in entry["courses"]] if entry is not None else []
+
+    def get_cohort_stats(self):
+        """
+        Report precomputed user cohort sizes and refresh lag.
+
+        Returns
+        -------
+        dict or None
+            Statistics, or None when ``COHORT_SEARCH`` is ``off``
+        """
+        if self.user_cohorts is None:
+            return None
+        return self.user_cohorts.stats()
+
+    def get_similarity_cache_stats(self):
+        """
+        Report user vector cache or ANN index metrics (rows, memory, refresh lag).
+        
+        Returns
+        -------
+        dict or None
+            Statistics, or None when no in-process similarity structure is in use
+        """
+        if self.user_vector_cache is None:
+            return None
+        return self.user_vector_cache.stats()
+
+    def get_embedding_cache_stats(self):
+        """
+        Report user embedding cache hits, misses and size.
+        
+        Returns
+        -------
+        dict
+            Statistics from ``EmbeddingCache.stats``
+        """
+        return self.embedding_cache.stats()
 
     def get_recommendations_for_user(self, query):
         with self.driver.session() as session:
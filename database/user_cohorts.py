@@ -0,0 +1,237 @@
+import itertools
+import threading
+import time
+
+import numpy as np
+from utils.logger import SystemLogger
+from utils.vector_math import normalize_vector, top_k_cosine
+
+# Attempts per refresh when the vector cache reloads (renumbering its rows) mid-build
+REFRESH_ATTEMPTS = 3
+
+
+class UserCohorts:
+    """
+    Precomputed neighbourhoods of the user cohorts defined by profile options.
+
+    A cohort is one (education, age group, profession) combination. For each
+    cohort this keeps the normalised centroid of its members' profile
+    vectors, the ``top_users`` members closest to that centroid (with their
+    unit vectors, so searching a cohort is a small matrix-vector product) and
+    its ``top_courses`` most-enrolled courses.
+
+    Profile vectors come from the resident ``vector_cache``; Neo4j is only
+    read for the profile options and enrollments. After ``start`` a daemon
+    thread recomputes the cohorts immediately and then every
+    ``refresh_seconds``, off the request path; lookups only read the last
+    published snapshot and find nothing before the first one. A failing
+    refresh is logged and the previous snapshot kept.
+
+    Parameters
+    ----------
+    driver : neo4j.Driver
+        Driver used for refresh reads
+    vector_cache : UserVectorCache
+        Resident user profile vectors the cohorts are built from
+    refresh_seconds : float
+        Seconds between recomputations (must be positive)
+    cohort_options : tuple of sequence
+        Education levels, age groups and profession types; their product
+        defines the cohorts
+    top_users : int
+        Candidate users kept per cohort
+    top_courses : int
+        Courses kept per cohort
+    """
+
+    def __init__(self, driver, vector_cache, refresh_seconds, cohort_options, top_users, top_courses):
+        self._driver = driver
+        self._vector_cache = vector_cache
+        self._refresh_seconds = refresh_seconds
+        self._cohort_options = tuple(tuple(options) for options in cohort_options)
+        self._top_users = top_users
+        self._top_courses = top_courses
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._cohorts = None
+        self._refreshed_at = 0.0
+        self._refreshes = 0
+        self._last_refresh_seconds = None
+
+    def start(self):
+        """Start refreshing on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="user-cohort-refresh", daemon=True)
+        self._thread.start()
+        SystemLogger.info("User cohort refresh started", {'refresh_seconds': self._refresh_seconds})
+
+    def stop(self):
+        """Stop refreshing and wait for the thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get(self, cohort):
+        """
+        Return the precomputed neighbourhood of ``cohort``.
+
+        Parameters
+        ----------
+        cohort : tuple of str
+            (education, age_group, profession)
+
+        Returns
+        -------
+        dict or None
+            ``members`` (users with a usable profile), ``centroid`` (unit
+            array or None), ``user_ids`` and ``queries`` of the top users,
+            best first, and ``courses`` as ``course``/``students`` dicts;
+            None for combinations outside the configured options or before
+            the first refresh
+        """
+        cohorts = self._cohorts
+        return None if cohorts is None else cohorts.get(tuple(cohort))
+
+    def top_k(self, user_vector, cohort, top_n):
+        """
+        Return the users of ``cohort`` most similar to ``user_vector``.
+
+        Only the cohort's precomputed top users are searched.
+
+        Parameters
+        ----------
+        user_vector : list of float
+            Query embedding
+        cohort : tuple of str
+            (education, age_group, profession)
+        top_n : int
+            Number of results
+
+        Returns
+        -------
+        list of dict
+            ``user_id``, ``query`` and cosine ``score`` per result, best first
+        """
+        entry = self.get(cohort)
+        query_vector = normalize_vector(user_vector)
+        if entry is None or query_vector is None or query_vector.shape[0] != entry["matrix"].shape[1]:
+            return []
+
+        rows, scores = top_k_cosine(query_vector, entry["matrix"], top_n)
+        return [
+            {"user_id": entry["user_ids"][row], "query": entry["queries"][row], "score": float(score)}
+            for row, score in zip(rows, scores)
+        ]
+
+    def stats(self):
+        """Report cohort sizes and refresh timings."""
+        cohorts = self._cohorts or {}
+        return {
+            'cohorts': len(cohorts),
+            'populated_cohorts': sum(1 for entry in cohorts.values() if entry["members"]),
+            'candidate_users': sum(len(entry["user_ids"]) for entry in cohorts.values()),
+            'refresh_lag_seconds': (
+                round(time.monotonic() - self._refreshed_at, 3) if self._cohorts is not None else None
+            ),
+            'refreshes': self._refreshes,
+            'last_refresh_seconds': self._last_refresh_seconds,
+        }
+
+    def _run(self):
+        # The first refresh needs the vector cache's first load
+        while not self._vector_cache.wait_until_loaded(timeout=1.0):
+            if self._stop_event.is_set():
+                return
+        while not self._stop_event.is_set():
+            try:
+                self._refresh()
+            except Exception as e:
+                SystemLogger.error(
+                    "User cohort refresh failed - Keeping previous cohorts",
+                    exception=e,
+                    context={'refreshes': self._refreshes},
+                    fail_fast=False
+                )
+            self._stop_event.wait(self._refresh_seconds)
+
+    def _refresh(self):
+        start_time = time.perf_counter()
+        educations, age_groups, professions = self._cohort_options
+        with self._driver.session() as session:
+            profiles, enrollments = session.execute_read(self._read_cohorts, educations, age_groups, professions)
+
+        courses = {}
+        for record in enrollments:
+            cohort = (record["education"], record["age_group"], record["profession"])
+            courses.setdefault(cohort, []).append({"course": record["course"], "students": record["students"]})
+
+        for attempt in range(1, REFRESH_ATTEMPTS + 1):
+            built = self._build_cohorts(profiles, courses)
+            if built is not None:
+                break
+            SystemLogger.info("User vector cache reloaded during cohort refresh - Retrying", {'attempt': attempt})
+        else:
+            SystemLogger.info("User vector cache kept reloading during cohort refresh - Keeping previous cohorts", {
+                'attempts': REFRESH_ATTEMPTS
+            })
+            return
+
+        cohorts, cached_profiles = built
+        self._cohorts = cohorts
+        self._refreshed_at = time.monotonic()
+        self._refreshes += 1
+        self._last_refresh_seconds = round(time.perf_counter() - start_time, 3)
+        SystemLogger.info("User cohorts refreshed", dict(self.stats(), profiles=cached_profiles))
+
+    def _build_cohorts(self, profiles, courses):
+        """Build every cohort from the cached vectors; None if the cache was reloaded meanwhile."""
+        generation, cache_rows, user_ids, queries = self._vector_cache.live_rows()
+        position_of = {user_id: position for position, user_id in enumerate(user_ids)}
+        members = {}
+        for profile in profiles:
+            position = position_of.get(profile["user_id"])
+            if position is not None:
+                members.setdefault((profile["education"], profile["age_group"], profile["profession"]), []).append(position)
+
+        cohorts = {}
+        for cohort in itertools.product(*self._cohort_options):
+            positions = np.array(members.get(cohort, []), dtype=np.int64)
+            cohort_matrix = self._vector_cache.read_rows(generation, cache_rows[positions])
+            if cohort_matrix is None:
+                return None
+            # Rows removed from the cache since live_rows() come back as zeros
+            present = np.flatnonzero(cohort_matrix.any(axis=1))
+            positions, cohort_matrix = positions[present], cohort_matrix[present]
+            centroid = normalize_vector(cohort_matrix.mean(axis=0)) if len(positions) else None
+            if centroid is not None:
+                top_rows, _ = top_k_cosine(centroid.astype(np.float32), cohort_matrix, self._top_users)
+            else:
+                top_rows = np.empty(0, dtype=np.int64)
+            cohorts[cohort] = {
+                "members": len(positions),
+                "centroid": centroid,
+                "matrix": np.ascontiguousarray(cohort_matrix[top_rows]),
+                "user_ids": [user_ids[positions[r]] for r in top_rows],
+                "queries": [queries[positions[r]] for r in top_rows],
+                "courses": courses.get(cohort, [])[:self._top_courses],
+            }
+        return cohorts, len(user_ids)
+
+    @staticmethod
+    def _read_cohorts(tx, educations, age_groups, professions):
+        profiles = [record.data() for record in tx.run("""
+            MATCH (u:User)
+            WHERE u.profile_vector IS NOT NULL
+              AND u.education IN $educations AND u.age_group IN $age_groups AND u.profession IN $professions
+            RETURN u.id AS user_id, u.education AS education, u.age_group AS age_group, u.profession AS profession
+        """, educations=educations, age_groups=age_groups, professions=professions)]
+        enrollments = [record.data() for record in tx.run("""
+            MATCH (u:User)-[:ENROLLED_IN]->(c:Course)
+            WHERE u.education IN $educations AND u.age_group IN $age_groups AND u.profession IN $professions
+            RETURN u.education AS education, u.age_group AS age_group, u.profession AS profession,
+                   c.name AS course, count(DISTINCT u) AS students
+            ORDER BY students DESC, course
+        """, educations=educations, age_groups=age_groups, professions=professions)]
+        return profiles, enrollments
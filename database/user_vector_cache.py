@@ -0,0 +1,481 @@
+import threading
+import time
+
+import numpy as np
+from database.vector_codec import decode_vector, LOSSLESS_ENCODINGS
+from utils.logger import SystemLogger
+from utils.vector_math import infer_dimension, normalize_vector, stack_vectors, normalize_rows, top_k_cosine
+
+# Re-read profiles updated this long before the watermark, so writes from
+# other workers that committed late (with an older timestamp) are not missed
+RECONCILE_OVERLAP_MS = 5000
+INITIAL_CAPACITY = 1024
+
+
+class UserVectorCache:
+    """
+    Process-resident matrix of user profile vectors for user similarity search.
+
+    Holds every usable ``User.profile_vector`` as a unit-norm float32 row
+    together with its ``user_id`` and ``last_query`` columns, one row per
+    user, so similarity lookups are a matrix-vector product instead of a full
+    graph scan over Bolt and never return the same user twice.
+
+    After ``start`` a daemon thread loads every profile and then, every
+    ``refresh_seconds``, reconciles with Neo4j off the request path: it reads
+    profiles updated since the high-water mark of ``User.profile_updated_at``
+    (an index seek) and compares the profile count with the profiles seen.
+    A mismatch (deleted users, or new profiles without a timestamp) triggers
+    a full reload on that thread while lookups keep using the current rows.
+    Lookups only read the rows and find nothing before the first load.
+    Profiles updated by this process are applied by ``upsert`` right after
+    the write commits. A profile whose new vector is zero or
+    cannot be decoded is tombstoned, so its stale row is never returned.
+
+    Only profiles built by ``embedding_model`` are loaded, so vectors from
+    different embedding models are never compared with each other. Profiles
+    flagged ``vector_normalized`` and stored in a lossless encoding are loaded
+    without recomputing their norms.
+
+    Parameters
+    ----------
+    driver : neo4j.Driver
+        Driver used for reconciliation reads
+    refresh_seconds : float
+        Seconds between reconciliations (must be positive)
+    embedding_model : str
+        Model whose profile vectors are searched (``User.profile_model``)
+    untagged_model : str
+        Model assumed for profiles stored before the model was recorded
+
+    Notes
+    -----
+    Synchronisation with Neo4j lives here; how rows are stored and searched is
+    confined to the ``_build_storage``, ``_install_storage``, ``_append_row``,
+    ``_replace_row``, ``_remove_row``, ``_search``, ``_read_rows`` and ``_storage_stats`` hooks so other index
+    structures can reuse it. Lookups read a snapshot of the matrix taken under
+    the lock and compute outside it. Appends never touch rows a snapshot can
+    see; a profile update overwrites its row in place, so a concurrent lookup
+    may score that one user against a partly written row.
+    """
+
+    label = "User vector cache"
+
+    def __init__(self, driver, refresh_seconds, embedding_model, untagged_model):
+        self._driver = driver
+        self._refresh_seconds = refresh_seconds
+        self._embedding_model = embedding_model
+        self._untagged_model = untagged_model
+        self._lock = threading.Lock()
+        # Serialises loads and reconciliations (the sync thread, or a direct sync() call)
+        self._sync_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Set to run the next sync before refresh_seconds have passed
+        self._wake_event = threading.Event()
+        self._loaded_event = threading.Event()
+        self._thread = None
+        self._loaded = False
+        self._generation = 0
+        self._reset_state()
+        self._install_storage(self._build_storage(None, None))
+
+        self._upserts = 0
+        self._delta_rows = 0
+        self._full_reloads = 0
+        self._last_full_load_seconds = None
+
+    def _reset_state(self, dimension=None):
+        # Bumped whenever rows are renumbered, so row positions read earlier can be detected as stale
+        self._generation += 1
+        self._dimension = dimension
+        self._size = 0
+        # Tombstoned rows keep their position with a None user_id until the next full load
+        self._removed = 0
+        self._user_ids = []
+        self._queries = []
+        # Row of every profile seen (None if unusable), for upserts and the count check
+        self._rows_by_key = {}
+        self._versions = {}
+        self._watermark = None
+        self._reconciled_at = 0.0
+
+    def start(self):
+        """Start loading and reconciling on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="user-vector-sync", daemon=True)
+        self._thread.start()
+        SystemLogger.info(f"{self.label} sync started", {'refresh_seconds': self._refresh_seconds})
+
+    def stop(self):
+        """Stop syncing and wait for the thread to exit."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sync(self):
+        """Load every profile if not loaded yet, otherwise reconcile with Neo4j; what the sync thread runs."""
+        with self._sync_lock:
+            if not self._loaded:
+                self._full_load()
+            else:
+                self._reconcile()
+
+    def wait_until_loaded(self, timeout=None):
+        """Block until the rows have been loaded; returns False if ``timeout`` passed first."""
+        return self._loaded_event.wait(timeout)
+
+    def upsert(self, element_id, user_id, query, profile_vector, updated_at, normalized=False):
+        """
+        Add or replace a user profile written by this process.
+
+        Parameters
+        ----------
+        element_id : str
+            Neo4j element id of the User node
+        user_id : str
+            Id of the user
+        query : str
+            The user's most recent query
+        profile_vector : list of float
+            Updated profile vector
+        updated_at : int
+            ``User.profile_updated_at`` of the write, in epoch milliseconds
+        normalized : bool, optional
+            Whether ``profile_vector`` is already unit-norm, by default False
+        """
+        with self._lock:
+            if not self._loaded:
+                # Picked up by the first full load or the reconciliation after it
+                return
+            unit_vector = normalize_vector(profile_vector, assume_unit=normalized)
+            if self._upsert_row(element_id, user_id, query, unit_vector, updated_at):
+                self._upserts += 1
+
+    def top_k(self, user_vector, top_n):
+        """
+        Return the users whose profiles are most similar to ``user_vector``.
+
+        Parameters
+        ----------
+        user_vector : list of float
+            Query embedding
+        top_n : int
+            Number of results
+
+        Returns
+        -------
+        list of dict
+            ``user_id``, ``query`` (the user's latest) and cosine ``score``
+            per result, best first, one entry per user
+        """
+        if not self._loaded:
+            SystemLogger.debug(f"{self.label} not loaded yet - No similar users")
+            return []
+
+        query_vector = normalize_vector(user_vector)
+        if query_vector is None or query_vector.shape[0] != self._dimension:
+            SystemLogger.info(f"Query vector unusable for {self.label.lower()} search", {
+                'vector_dimension': None if query_vector is None else query_vector.shape[0],
+                'cache_dimension': self._dimension
+            })
+            return []
+
+        return self._search(query_vector, top_n)
+
+    def live_rows(self):
+        """
+        List the rows currently holding a profile (none before the first load).
+
+        Returns
+        -------
+        tuple
+            (generation, row positions as an int64 array, user_ids, queries);
+            pass ``generation`` and (a subset of) the rows to ``read_rows``
+        """
+        with self._lock:
+            rows = [row for row in range(self._size) if self._user_ids[row] is not None]
+            return (
+                self._generation,
+                np.array(rows, dtype=np.int64),
+                [self._user_ids[row] for row in rows],
+                [self._queries[row] for row in rows],
+            )
+
+    def read_rows(self, generation, rows):
+        """
+        Copy the unit vectors of ``rows`` listed by ``live_rows``.
+
+        Parameters
+        ----------
+        generation : int
+            Generation returned by ``live_rows``
+        rows : np.ndarray
+            Row positions returned by ``live_rows``
+
+        Returns
+        -------
+        np.ndarray or None
+            float32 array of shape (len(rows), dimension), with zero rows for
+            profiles removed since; None if the cache was reloaded since
+            ``live_rows`` and the positions are stale
+        """
+        return self._read_rows(np.asarray(rows, dtype=np.int64), generation)
+
+    def stats(self):
+        """
+        Report size, memory use and refresh lag.
+
+        Returns
+        -------
+        dict
+            Row counts, storage bytes, seconds since the last reconciliation
+            and upsert/reload counters
+        """
+        with self._lock:
+            stats = {
+                'rows': self._size - self._removed,
+                'removed_rows': self._removed,
+                'profiles_seen': len(self._rows_by_key),
+                'dimension': self._dimension,
+                'embedding_model': self._embedding_model,
+                'refresh_lag_seconds': (
+                    round(time.monotonic() - self._reconciled_at, 3) if self._loaded else None
+                ),
+                'upserts': self._upserts,
+                'reconciled_rows': self._delta_rows,
+                'full_reloads': self._full_reloads,
+                'last_full_load_seconds': self._last_full_load_seconds,
+            }
+            stats.update(self._storage_stats())
+            return stats
+
+    def invalidate(self):
+        """Drop all cached rows and have the sync thread reload them now."""
+        with self._lock:
+            self._loaded = False
+            self._loaded_event.clear()
+            self._reset_state()
+            self._install_storage(self._build_storage(None, None))
+        self._wake_event.set()
+
+    # Storage hooks (called with self._lock held, except _build_storage and _search)
+
+    def _build_storage(self, dimension, unit_matrix):
+        """Build storage holding ``unit_matrix`` (None for empty); runs without the lock."""
+        size = 0 if unit_matrix is None else unit_matrix.shape[0]
+        matrix = np.empty((max(INITIAL_CAPACITY, 2 * size), dimension or 0), dtype=np.float32)
+        if size:
+            matrix[:size] = unit_matrix
+        return matrix
+
+    def _install_storage(self, storage):
+        """Replace all stored rows with storage from ``_build_storage``."""
+        self._matrix = storage
+
+    def _append_row(self, unit_vector):
+        """Store one more row at position ``self._size``."""
+        if self._matrix.shape[1] != self._dimension:
+            self._matrix = np.empty((INITIAL_CAPACITY, self._dimension), dtype=np.float32)
+        if self._size == self._matrix.shape[0]:
+            # Grow into a new array; snapshots keep referencing the old one
+            grown = np.empty((2 * self._size, self._dimension), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+        self._matrix[self._size] = unit_vector
+
+    def _replace_row(self, row, unit_vector):
+        """Overwrite the stored vector of an existing row."""
+        self._matrix[row] = unit_vector
+
+    def _remove_row(self, row):
+        """Exclude a row from searches; its user_id is already None."""
+        self._matrix[row] = 0.0
+
+    def _read_rows(self, rows, generation):
+        """Copy stored vectors of ``rows`` (None if ``generation`` is stale); runs without the lock."""
+        with self._lock:
+            if self._generation != generation:
+                return None
+            matrix = self._matrix
+        return matrix[rows]
+
+    def _search(self, query_vector, top_n):
+        with self._lock:
+            matrix = self._matrix[:self._size]
+            user_ids, queries = self._user_ids, self._queries
+            removed = self._removed
+
+        # Over-fetch by the tombstone count so removed rows never shorten the result
+        rows, scores = top_k_cosine(query_vector, matrix, top_n + removed)
+        return [
+            {"user_id": user_ids[row], "query": queries[row], "score": float(score)}
+            for row, score in zip(rows, scores)
+            if user_ids[row] is not None
+        ][:top_n]
+
+    def _storage_stats(self):
+        return {
+            'capacity': self._matrix.shape[0],
+            'matrix_bytes': int(self._matrix.nbytes),
+        }
+
+    def _needs_full_reload(self):
+        """Whether the stored rows should be rebuilt from Neo4j at the next reconciliation."""
+        return False
+
+    def _after_sync(self):
+        """Called (without the lock) after every full load or reconciliation."""
+
+    # Synchronisation with Neo4j
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                SystemLogger.error(
+                    f"{self.label} sync with Neo4j failed - Keeping current rows",
+                    exception=e,
+                    context={'loaded': self._loaded, 'rows': self._size - self._removed},
+                    fail_fast=False
+                )
+            self._wake_event.wait(self._refresh_seconds)
+            self._wake_event.clear()
+
+    def _full_load(self):
+        start_time = time.perf_counter()
+        with self._driver.session() as session:
+            records = session.execute_read(
+                self._read_profiles, None, self._embedding_model, self._untagged_model
+            )
+
+        vectors = [decode_vector(r["profile_vector"]) for r in records]
+        dimension = infer_dimension(vectors)
+
+        matrix, valid = stack_vectors(vectors, dimension or 0)
+        unit_rows = np.fromiter((bool(records[i]["normalized"]) for i in valid), dtype=bool, count=len(valid))
+        storage = self._build_storage(dimension, normalize_rows(matrix, unit_rows) if len(valid) else None)
+        with self._lock:
+            self._reset_state(dimension)
+            self._install_storage(storage)
+            self._size = len(valid)
+            self._user_ids = [records[i]["user_id"] for i in valid]
+            self._queries = [records[i]["query"] for i in valid]
+            self._rows_by_key = {r["element_id"]: None for r in records}
+            self._rows_by_key.update((records[i]["element_id"], row) for row, i in enumerate(valid))
+            self._versions = {r["element_id"]: r["updated_at"] for r in records}
+            self._watermark = max((r["updated_at"] for r in records if r["updated_at"] is not None), default=None)
+            self._reconciled_at = time.monotonic()
+            self._loaded = True
+            self._loaded_event.set()
+            self._full_reloads += 1
+            self._last_full_load_seconds = round(time.perf_counter() - start_time, 3)
+
+        SystemLogger.info(f"{self.label} loaded", self.stats())
+        self._after_sync()
+
+    def _reconcile(self):
+        # Without a watermark (no timestamped profiles yet) read every timestamped row
+        since = 0 if self._watermark is None else self._watermark - RECONCILE_OVERLAP_MS
+        with self._driver.session() as session:
+            records, total = session.execute_read(
+                self._read_delta, since, self._embedding_model, self._untagged_model
+            )
+
+        changed = 0
+        with self._lock:
+            for record in records:
+                if self._upsert_row(record["element_id"], record["user_id"], record["query"],
+                                    normalize_vector(decode_vector(record["profile_vector"]),
+                                                     assume_unit=bool(record["normalized"])),
+                                    record["updated_at"]):
+                    changed += 1
+                if record["updated_at"] is not None and (
+                        self._watermark is None or record["updated_at"] > self._watermark):
+                    self._watermark = record["updated_at"]
+            self._delta_rows += changed
+            consistent = total == len(self._rows_by_key)
+            rebuild = self._needs_full_reload()
+            self._reconciled_at = time.monotonic()
+
+        if not consistent or rebuild:
+            # Runs on the sync thread; lookups keep using the current rows until the new ones are swapped in
+            SystemLogger.info(f"{self.label} out of sync with Neo4j - Reloading", {
+                'profiles_in_graph': total,
+                'profiles_seen': len(self._rows_by_key),
+                'rebuild_requested': rebuild
+            })
+            self._full_load()
+            return
+
+        SystemLogger.debug(f"{self.label} reconciled", dict(self.stats(), changed_rows=changed))
+        self._after_sync()
+
+    def _upsert_row(self, element_id, user_id, query, unit_vector, updated_at):
+        """Add or replace one user's row under self._lock; returns True if a row changed."""
+        seen = element_id in self._rows_by_key
+        if seen:
+            known = self._versions.get(element_id)
+            # Reconciliation re-reads an overlap window; skip profiles already applied
+            if updated_at is None or (known is not None and updated_at <= known):
+                return False
+        self._versions[element_id] = updated_at
+
+        row = self._rows_by_key.get(element_id)
+        if unit_vector is None or (self._dimension is not None and unit_vector.shape[0] != self._dimension):
+            self._rows_by_key.setdefault(element_id, None)
+            if row is None or self._user_ids[row] is None:
+                return False
+            # The previous vector is superseded; keep it out of results
+            self._user_ids[row] = None
+            self._queries[row] = None
+            self._removed += 1
+            self._remove_row(row)
+            return True
+        if self._dimension is None:
+            self._dimension = unit_vector.shape[0]
+
+        if row is not None:
+            if self._user_ids[row] is None:
+                self._removed -= 1
+            self._replace_row(row, unit_vector)
+            self._user_ids[row] = user_id
+            self._queries[row] = query
+            return True
+
+        self._append_row(unit_vector)
+        self._rows_by_key[element_id] = self._size
+        self._user_ids.append(user_id)
+        self._queries.append(query)
+        self._size += 1
+        return True
+
+    @staticmethod
+    def _read_profiles(tx, since, model, untagged_model):
+        # A plain comparison, so deltas are a seek on the User.profile_updated_at range index
+        since_filter = "" if since is None else "AND u.profile_updated_at >= $since"
+        result = tx.run(f"""
+            MATCH (u:User)
+            WHERE u.profile_vector IS NOT NULL
+              AND coalesce(u.profile_model, $untagged_model) = $model
+              {since_filter}
+            RETURN elementId(u) AS element_id, u.id AS user_id, u.last_query AS query,
+                   u.profile_vector AS profile_vector, u.profile_updated_at AS updated_at,
+                   coalesce(u.vector_normalized, false) AND coalesce(u.vector_encoding, 'list') IN $lossless_encodings AS normalized
+        """, since=since, model=model, untagged_model=untagged_model,
+             lossless_encodings=list(LOSSLESS_ENCODINGS))
+        return [record.data() for record in result]
+
+    @staticmethod
+    def _read_delta(tx, since, model, untagged_model):
+        records = UserVectorCache._read_profiles(tx, since, model, untagged_model)
+        total = tx.run("""
+            MATCH (u:User)
+            WHERE u.profile_vector IS NOT NULL
+              AND coalesce(u.profile_model, $untagged_model) = $model
+            RETURN count(u) AS total
+        """, model=model, untagged_model=untagged_model).single()["total"]
+        return records, total
@@ -0,0 +1,68 @@
+import struct
+
+import numpy as np
+
+# First byte of an encoded vector; the rest is the little-endian payload
+_FLOAT16_TAG = b'h'
+# int8 payload is preceded by its float32 scale: value = code * scale
+_INT8_TAG = b'q'
+_SCALE = struct.Struct('<f')
+# Encodings that store values exactly; only these keep a unit vector unit-norm,
+# so ``vector_normalized`` is only set (and trusted) for them
+LOSSLESS_ENCODINGS = ('list',)
+
+
+def encode_vector(vector, encoding):
+    """
+    Encode an embedding for storage as a Neo4j property.
+
+    Parameters
+    ----------
+    vector : sequence of float
+        Embedding to store
+    encoding : str
+        ``list`` keeps a list of floats (8 bytes per value in the store),
+        ``float16`` packs half-precision bytes (2 bytes per value) and
+        ``int8`` packs symmetric scalar-quantised bytes with a per-vector
+        scale (1 byte per value)
+
+    Returns
+    -------
+    list of float or bytes
+        Property value; byte encodings are self-describing, so
+        ``decode_vector`` needs no extra metadata
+    """
+    if encoding == 'list':
+        return [float(x) for x in vector]
+
+    array = np.asarray(vector, dtype=np.float32)
+    if encoding == 'float16':
+        return _FLOAT16_TAG + array.astype('<f2').tobytes()
+    if encoding == 'int8':
+        peak = float(np.max(np.abs(array))) if array.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        codes = np.clip(np.rint(array / scale), -127, 127).astype(np.int8)
+        return _INT8_TAG + _SCALE.pack(scale) + codes.tobytes()
+    raise ValueError(f"Unknown vector encoding: {encoding}")
+
+
+def decode_vector(value):
+    """
+    Decode a stored embedding written by ``encode_vector`` in any encoding.
+
+    Lists (the ``list`` encoding and vectors stored before compact
+    encodings existed) are returned unchanged; byte encodings are returned as
+    float32 arrays. None and unrecognised values decode to None.
+    """
+    if value is None or isinstance(value, (list, tuple, np.ndarray)):
+        return value
+    if not isinstance(value, (bytes, bytearray)) or not value:
+        return None
+
+    tag, payload = bytes(value[:1]), memoryview(value)[1:]
+    if tag == _FLOAT16_TAG:
+        return np.frombuffer(payload, dtype='<f2').astype(np.float32)
+    if tag == _INT8_TAG and len(payload) >= _SCALE.size:
+        (scale,) = _SCALE.unpack(payload[:_SCALE.size])
+        return np.frombuffer(payload[_SCALE.size:], dtype=np.int8).astype(np.float32) * scale
+    return None
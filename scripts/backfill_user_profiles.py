@@ -0,0 +1,197 @@
+"""
+Backfill ``User.profile_vector`` from existing interaction vectors.
+
+Profiles are maintained on every ``store_interaction`` write; users whose
+interactions predate that have no profile and are invisible to user
+similarity until this has run. Each user's interaction vectors are folded in
+``created_at`` order with the same decayed-mean rule as the write path.
+Only interaction vectors of the configured ``USER_VECTOR_MODEL`` are used,
+and users whose profile was built by another model are rebuilt.
+
+A user written to by the application while their batch is in flight is
+skipped (their profile_count changed) and reported; re-run to pick them up.
+Profiles stored before ``profile_updated_at`` was recorded are stamped
+first, so running caches pick them up in their next reconciliation.
+
+Usage
+-----
+    python -m scripts.backfill_user_profiles
+    python -m scripts.backfill_user_profiles --all --batch-size 200
+"""
+import argparse
+import time
+
+import numpy as np
+from neo4j import GraphDatabase
+
+from core.config import (
+    neo4j_uri, neo4j_user, neo4j_password, USER_PROFILE_DECAY,
+    USER_VECTOR_MODEL, UNTAGGED_USER_VECTOR_MODEL, VECTOR_STORAGE_ENCODING
+)
+from database.vector_codec import decode_vector, encode_vector, LOSSLESS_ENCODINGS
+from utils.vector_math import fold_vector, normalize_vector
+
+
+def fold_profile(vectors, decay):
+    """
+    Combine interaction vectors, oldest first, into a profile vector.
+
+    Mirrors ``Neo4jConnector._create_interaction``: each vector is
+    normalised, the newest gets weight ``max(1/n, decay)`` and the profile is
+    renormalised after every fold; a change of vector length restarts the
+    profile from that interaction. Vectors may be stored in any
+    ``vector_codec`` encoding.
+
+    Returns
+    -------
+    tuple
+        (unit-norm profile vector as an array or None, number of vectors folded)
+    """
+    profile = None
+    count = 0
+    for stored in vectors:
+        vector = normalize_vector(decode_vector(stored))
+        if vector is None:
+            continue
+        count += 1
+        vector = vector.astype(np.float64)
+        if profile is None or profile.shape != vector.shape:
+            profile = vector
+            continue
+        folded = normalize_vector(fold_vector(profile, vector, count, decay))
+        if folded is not None:
+            profile = folded.astype(np.float64)
+    return profile, count
+
+
+def stamp_profile_timestamps(tx):
+    return tx.run("""
+        MATCH (u:User)
+        WHERE u.profile_vector IS NOT NULL AND u.profile_updated_at IS NULL
+        SET u.profile_updated_at = timestamp()
+        RETURN count(u) AS stamped
+    """).single()["stamped"]
+
+
+def read_user_ids(tx, include_existing, model, untagged_model):
+    result = tx.run("""
+        MATCH (u:User)
+        WHERE ($include_existing OR u.profile_vector IS NULL
+               OR coalesce(u.profile_model, $untagged_model) <> $model)
+          AND EXISTS {
+              MATCH (u)-[:MADE]->(i:Interaction)
+              WHERE i.user_vector IS NOT NULL AND coalesce(i.embedding_model, $untagged_model) = $model
+          }
+        RETURN u.id AS user_id
+        ORDER BY user_id
+    """, include_existing=include_existing, model=model, untagged_model=untagged_model)
+    return [record["user_id"] for record in result]
+
+
+def read_interactions(tx, user_ids, model, untagged_model):
+    result = tx.run("""
+        MATCH (u:User)-[:MADE]->(i:Interaction)
+        WHERE u.id IN $user_ids AND i.user_vector IS NOT NULL
+          AND coalesce(i.embedding_model, $untagged_model) = $model
+        WITH u, i ORDER BY coalesce(i.created_at, 0), elementId(i)
+        RETURN u.id AS user_id, u.profile_count AS profile_count,
+               collect(i.user_vector) AS vectors, last(collect(i.query)) AS last_query
+    """, user_ids=user_ids, model=model, untagged_model=untagged_model)
+    return [record.data() for record in result]
+
+
+def write_profiles(tx, rows, model, encoding):
+    result = tx.run("""
+        UNWIND $rows AS row
+        MATCH (u:User {id: row.user_id})
+        WHERE coalesce(u.profile_count, -1) = coalesce(row.expected_count, -1)
+        SET u.profile_vector = row.profile_vector,
+            u.vector_encoding = $encoding,
+            u.vector_normalized = $encoding IN $lossless_encodings,
+            u.profile_count = row.profile_count,
+            u.profile_model = $model,
+            u.last_query = row.last_query,
+            u.profile_updated_at = timestamp()
+        RETURN count(u) AS written
+    """, rows=rows, model=model, encoding=encoding, lossless_encodings=list(LOSSLESS_ENCODINGS))
+    return result.single()["written"]
+
+
+def backfill_profiles(driver, include_existing=False, batch_size=500, decay=USER_PROFILE_DECAY,
+                      model=USER_VECTOR_MODEL, untagged_model=UNTAGGED_USER_VECTOR_MODEL):
+    """
+    Build profile vectors for users missing one (or all users) from their interactions.
+
+    Parameters
+    ----------
+    driver : neo4j.Driver
+        Driver for the graph to backfill
+    include_existing : bool, optional
+        Recompute profiles that already use ``model`` too, by default False
+    batch_size : int, optional
+        Users per transaction, by default 500
+    decay : float, optional
+        Weight floor of the newest interaction, by default USER_PROFILE_DECAY
+    model : str, optional
+        Embedding model whose interaction vectors are folded
+    untagged_model : str, optional
+        Model assumed for interactions stored before the model was recorded
+
+    Returns
+    -------
+    tuple
+        (profiles written, profiles skipped after concurrent writes)
+    """
+    written = skipped = 0
+    with driver.session() as session:
+        stamped = session.execute_write(stamp_profile_timestamps)
+        if stamped:
+            print(f"Stamped profile_updated_at on {stamped} existing profiles")
+        user_ids = session.execute_read(read_user_ids, include_existing, model, untagged_model)
+        print(f"{len(user_ids)} user profiles to build (model={model}, decay={decay})")
+
+        for start in range(0, len(user_ids), batch_size):
+            batch = user_ids[start:start + batch_size]
+            rows = []
+            for record in session.execute_read(read_interactions, batch, model, untagged_model):
+                profile_vector, count = fold_profile(record["vectors"], decay)
+                if profile_vector is None:
+                    continue
+                rows.append({
+                    "user_id": record["user_id"],
+                    "expected_count": record["profile_count"],
+                    "profile_vector": encode_vector(profile_vector, VECTOR_STORAGE_ENCODING),
+                    "profile_count": count,
+                    "last_query": record["last_query"],
+                })
+            batch_written = (
+                session.execute_write(write_profiles, rows, model, VECTOR_STORAGE_ENCODING) if rows else 0
+            )
+            written += batch_written
+            skipped += len(rows) - batch_written
+            print(f"  {min(start + batch_size, len(user_ids))}/{len(user_ids)} users processed")
+    return written, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--all", action="store_true",
+                        help="Recompute every profile, not only users without one")
+    parser.add_argument("--batch-size", type=int, default=500, help="Users per transaction")
+    parser.add_argument("--decay", type=float, default=USER_PROFILE_DECAY,
+                        help="Weight floor of the newest interaction (default: USER_PROFILE_DECAY)")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+    try:
+        written, skipped = backfill_profiles(driver, args.all, args.batch_size, args.decay)
+    finally:
+        driver.close()
+
+    print(f"Backfilled {written} profiles in {time.perf_counter() - start_time:.1f}s"
+          + (f"; {skipped} skipped after concurrent writes - re-run to include them" if skipped else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark the user-similarity ANN index against exact search.
+
+Builds the same FAISS indexes the ``ann`` similarity backend uses over
+synthetic unit-norm vectors and reports recall@k against exact inner-product
+search, build time, and p50/p99 single-query latency at each corpus size.
+
+The synthetic corpus is a Gaussian mixture so neighbourhoods are clustered
+like real profile embeddings; queries are perturbed corpus vectors. Note that
+1M x 1024 float32 vectors need about 4 GB for the corpus alone; use
+``--dimension`` or ``--sizes`` to scale down.
+
+Usage
+-----
+    python -m scripts.benchmark_ann
+    python -m scripts.benchmark_ann --sizes 10000 100000 --index-type ivf --nprobe 32
+"""
+import argparse
+import json
+import statistics
+import time
+
+import faiss
+import numpy as np
+
+from database.ann_index import AnnIndexParams, build_faiss_index
+
+
+def synthetic_vectors(n, dimension, rng, clusters=256):
+    """Unit-norm float32 vectors drawn from a Gaussian mixture."""
+    centers = rng.standard_normal((clusters, dimension), dtype=np.float32)
+    vectors = np.empty((n, dimension), dtype=np.float32)
+    chunk = 100_000
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        assignment = rng.integers(0, clusters, size=stop - start)
+        block = centers[assignment] + 0.5 * rng.standard_normal((stop - start, dimension), dtype=np.float32)
+        vectors[start:stop] = block / np.linalg.norm(block, axis=1, keepdims=True)
+    return vectors
+
+
+def make_queries(corpus, n_queries, rng, noise=0.1):
+    picks = corpus[rng.integers(0, corpus.shape[0], size=n_queries)]
+    queries = picks + noise * rng.standard_normal(picks.shape, dtype=np.float32) / np.sqrt(corpus.shape[1])
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def exact_top_k(corpus, queries, k):
+    index = faiss.IndexFlatIP(corpus.shape[1])
+    index.add(corpus)
+    _, ids = index.search(queries, k)
+    return ids
+
+
+def single_query_latencies(index, queries, k):
+    latencies = []
+    for query in queries:
+        start_time = time.perf_counter()
+        index.search(query.reshape(1, -1), k)
+        latencies.append(time.perf_counter() - start_time)
+    return latencies
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def benchmark_size(n, args, params, rng):
+    corpus = synthetic_vectors(n, args.dimension, rng)
+    queries = make_queries(corpus, args.queries, rng)
+    truth = exact_top_k(corpus, queries, args.k)
+
+    exact_index = faiss.IndexFlatIP(args.dimension)
+    exact_index.add(corpus)
+    exact_latencies = single_query_latencies(exact_index, queries[:args.latency_queries], args.k)
+    del exact_index
+
+    start_time = time.perf_counter()
+    index = build_faiss_index(args.dimension, params, corpus)
+    index.add(corpus)
+    build_seconds = time.perf_counter() - start_time
+
+    _, found = index.search(queries, args.k)
+    recall = float(np.mean([
+        len(set(found[i]) & set(truth[i])) / args.k for i in range(len(queries))
+    ]))
+    latencies = single_query_latencies(index, queries[:args.latency_queries], args.k)
+
+    return {
+        "vectors": n,
+        "recall_at_k": round(recall, 4),
+        "build_seconds": round(build_seconds, 2),
+        "ann_p50_ms": round(percentile(latencies, 50) * 1e3, 3),
+        "ann_p99_ms": round(percentile(latencies, 99) * 1e3, 3),
+        "exact_p50_ms": round(percentile(exact_latencies, 50) * 1e3, 3),
+        "exact_p99_ms": round(percentile(exact_latencies, 99) * 1e3, 3),
+        "ann_mean_ms": round(statistics.mean(latencies) * 1e3, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--dimension", type=int, default=1024)
+    parser.add_argument("--index-type", choices=["hnsw", "ivf"], default="hnsw")
+    parser.add_argument("--m", type=int, default=32, help="HNSW graph degree")
+    parser.add_argument("--ef-construction", type=int, default=200)
+    parser.add_argument("--ef-search", type=int, default=64)
+    parser.add_argument("--nlist", type=int, default=1024, help="IVF lists (capped by corpus size)")
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=1000, help="Queries used for recall")
+    parser.add_argument("--latency-queries", type=int, default=1000, help="Queries timed one by one")
+    parser.add_argument("--threads", type=int, default=1, help="FAISS OpenMP threads")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write results to this path")
+    args = parser.parse_args()
+
+    faiss.omp_set_num_threads(args.threads)
+    params = AnnIndexParams(
+        index_type=args.index_type,
+        hnsw_m=args.m,
+        hnsw_ef_construction=args.ef_construction,
+        hnsw_ef_search=args.ef_search,
+        ivf_nlist=args.nlist,
+        ivf_nprobe=args.nprobe,
+    )
+    rng = np.random.default_rng(args.seed)
+
+    print(f"index={args.index_type} dim={args.dimension} k={args.k} params={params._asdict()}")
+    print(f"{'vectors':>10} {'recall@k':>9} {'build s':>9} {'ann p50':>9} {'ann p99':>9} "
+          f"{'exact p50':>10} {'exact p99':>10}")
+
+    results = []
+    for n in args.sizes:
+        row = benchmark_size(n, args, params, rng)
+        results.append(row)
+        print(f"{row['vectors']:>10} {row['recall_at_k']:>9.4f} {row['build_seconds']:>9.2f} "
+              f"{row['ann_p50_ms']:>7.3f}ms {row['ann_p99_ms']:>7.3f}ms "
+              f"{row['exact_p50_ms']:>8.3f}ms {row['exact_p99_ms']:>8.3f}ms")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump({"params": params._asdict(), "dimension": args.dimension,
+                       "k": args.k, "results": results}, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
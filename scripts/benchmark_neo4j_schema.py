@@ -0,0 +1,167 @@
+"""
+Benchmark Neo4j lookup latency with and without the schema indexes.
+
+Grows a synthetic graph of users, interactions and course enrollments to
+each ``--sizes`` interaction count and times the connector's hot lookups:
+the ``User.id`` match behind ``store_interaction``'s MERGE, responses by
+``Interaction.query``, courses by ``Course.name`` and enrolled courses of a
+set of users. Each lookup runs once as the planner chooses (using the
+indexes ``Neo4jConnector.ensure_schema`` creates) and once with a
+``USING SCAN`` hint, which forces the label scan every lookup paid before.
+
+Synthetic nodes carry the ``SchemaBenchmark`` label and ``bench-`` ids and
+are deleted afterwards unless ``--keep`` is given; run against a scratch
+database where possible.
+
+Usage
+-----
+    python -m scripts.benchmark_neo4j_schema
+    python -m scripts.benchmark_neo4j_schema --sizes 1000 10000 100000 --lookups 200 --json schema.json
+"""
+import argparse
+import json
+import random
+import time
+
+from database.neo4j_connector import Neo4jConnector
+
+BENCH_LABEL = "SchemaBenchmark"
+COURSES = 200
+INTERACTIONS_PER_USER = 10
+ENROLLMENTS_PER_USER = 3
+
+# name: (Cypher with a {hint} placeholder, scan hint, parameter builder)
+LOOKUPS = {
+    "user_by_id": (
+        "MATCH (u:User {id: $value}) {hint} RETURN u.id AS id",
+        "USING SCAN u:User",
+        lambda rng, n: {"value": f"bench-user-{rng.randrange(n // INTERACTIONS_PER_USER)}"},
+    ),
+    "interaction_by_query": (
+        "MATCH (i:Interaction {query: $value}) {hint} RETURN i.response AS response",
+        "USING SCAN i:Interaction",
+        lambda rng, n: {"value": f"bench-query-{rng.randrange(n)}"},
+    ),
+    "course_by_name": (
+        "MATCH (c:Course {name: $value}) {hint} RETURN c.name AS name",
+        "USING SCAN c:Course",
+        lambda rng, n: {"value": f"bench-course-{rng.randrange(COURSES)}"},
+    ),
+    "courses_of_users": (
+        "MATCH (u:User)-[:ENROLLED_IN]->(c:Course) {hint} WHERE u.id IN $values RETURN DISTINCT c.name AS course",
+        "USING SCAN u:User",
+        lambda rng, n: {"values": [f"bench-user-{rng.randrange(n // INTERACTIONS_PER_USER)}" for _ in range(5)]},
+    ),
+}
+
+
+def count_interactions(tx):
+    return tx.run(f"MATCH (i:Interaction:{BENCH_LABEL}) RETURN count(i) AS total").single()["total"]
+
+
+def seed_courses(tx):
+    tx.run(f"""
+        UNWIND range(0, $courses - 1) AS n
+        MERGE (c:Course {{name: 'bench-course-' + n}})
+        SET c:{BENCH_LABEL}
+    """, courses=COURSES).consume()
+
+
+def seed_interactions(tx, start, stop):
+    """Create interactions ``start``..``stop - 1`` with their users and enrollments."""
+    tx.run(f"""
+        UNWIND range($start, $stop - 1) AS n
+        MERGE (u:User {{id: 'bench-user-' + (n / $per_user)}})
+        SET u:{BENCH_LABEL}
+        CREATE (u)-[:MADE]->(i:Interaction:{BENCH_LABEL} {{
+            query: 'bench-query-' + n, response: 'bench-response-' + n, created_at: timestamp()
+        }})
+        WITH u, n WHERE n % $per_user = 0
+        UNWIND range(0, $enrollments - 1) AS k
+        MATCH (c:Course {{name: 'bench-course-' + ((n / $per_user * 7 + k * 31) % $courses)}})
+        MERGE (u)-[:ENROLLED_IN]->(c)
+    """, start=start, stop=stop, per_user=INTERACTIONS_PER_USER,
+         enrollments=ENROLLMENTS_PER_USER, courses=COURSES).consume()
+
+
+def delete_benchmark_nodes(session):
+    session.run(f"""
+        MATCH (n:{BENCH_LABEL})
+        CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF 10000 ROWS
+    """).consume()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def time_lookup(session, cypher, params_for, size, lookups, rng):
+    latencies = []
+    for _ in range(lookups):
+        params = params_for(rng, size)
+        start_time = time.perf_counter()
+        session.execute_read(lambda tx: tx.run(cypher, params).consume())
+        latencies.append(time.perf_counter() - start_time)
+    return latencies
+
+
+def benchmark_size(session, size, lookups, rng):
+    row = {"interactions": size}
+    for name, (template, scan_hint, params_for) in LOOKUPS.items():
+        for mode, hint in (("indexed", ""), ("scan", scan_hint)):
+            cypher = template.replace("{hint}", hint)
+            # Warm the plan cache and page cache before timing
+            time_lookup(session, cypher, params_for, size, 5, rng)
+            latencies = time_lookup(session, cypher, params_for, size, lookups, rng)
+            row[f"{name}_{mode}_p50_ms"] = round(percentile(latencies, 50) * 1e3, 3)
+            row[f"{name}_{mode}_p99_ms"] = round(percentile(latencies, 99) * 1e3, 3)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Synthetic interaction counts, ascending")
+    parser.add_argument("--lookups", type=int, default=200, help="Timed lookups per query and mode")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Interactions created per transaction")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic nodes afterwards")
+    parser.add_argument("--json", help="Also write results to this path")
+    args = parser.parse_args()
+
+    connector = Neo4jConnector()
+    print(f"schema: {connector.schema_status}")
+    rng = random.Random(args.seed)
+
+    results = []
+    try:
+        with connector.driver.session() as session:
+            session.run("CALL db.awaitIndexes(300)").consume()
+            session.execute_write(seed_courses)
+            seeded = session.execute_read(count_interactions)
+
+            print(f"{'interactions':>12} {'lookup':>22} {'indexed p50':>12} {'scan p50':>10}")
+            for size in sorted(args.sizes):
+                for start in range(seeded, size, args.batch_size):
+                    session.execute_write(seed_interactions, start, min(start + args.batch_size, size))
+                seeded = max(seeded, size)
+
+                row = benchmark_size(session, size, args.lookups, rng)
+                results.append(row)
+                for name in LOOKUPS:
+                    print(f"{size:>12} {name:>22} {row[f'{name}_indexed_p50_ms']:>10.3f}ms "
+                          f"{row[f'{name}_scan_p50_ms']:>8.3f}ms")
+
+            if not args.keep:
+                delete_benchmark_nodes(session)
+    finally:
+        connector.close()
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump({"schema": connector.schema_status, "lookups": args.lookups, "results": results}, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Build the course-to-course co-enrollment model from ENROLLED_IN edges.
+
+Reads every ``(:User)-[:ENROLLED_IN]->(:Course)`` edge, scores course pairs
+by how many students took both (cosine over enrolled-user sets) and
+publishes the top co-enrolled courses per course as a new version under
+``CO_ENROLLMENT_DIR``. Serving processes pick the new version up within
+``COLLABORATIVE_MODEL_REFRESH_SECONDS``; run this on a schedule (e.g. cron)
+to keep it current.
+
+Usage
+-----
+    python -m scripts.build_co_enrollment
+    python -m scripts.build_co_enrollment --min-support 3 --top-n 50
+"""
+import argparse
+import time
+
+from neo4j import GraphDatabase
+
+from core.config import (
+    neo4j_uri, neo4j_user, neo4j_password,
+    CO_ENROLLMENT_DIR, CO_ENROLLMENT_MIN_SUPPORT, CO_ENROLLMENT_TOP_N
+)
+from database.co_enrollment import build_co_enrollment
+from utils.artifact_store import publish_version
+
+
+def read_enrollments(tx):
+    result = tx.run("""
+        MATCH (u:User)-[:ENROLLED_IN]->(c:Course)
+        RETURN u.id AS user_id, c.name AS course
+    """)
+    return [(record["user_id"], record["course"]) for record in result]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--min-support", type=int, default=CO_ENROLLMENT_MIN_SUPPORT,
+                        help="Shared students needed for a course pair (default: CO_ENROLLMENT_MIN_SUPPORT)")
+    parser.add_argument("--top-n", type=int, default=CO_ENROLLMENT_TOP_N,
+                        help="Co-enrolled courses kept per course (default: CO_ENROLLMENT_TOP_N)")
+    parser.add_argument("--dry-run", action="store_true", help="Build and report without publishing")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+    try:
+        with driver.session() as session:
+            enrollments = session.execute_read(read_enrollments)
+    finally:
+        driver.close()
+    print(f"Read {len(enrollments)} enrollments in {time.perf_counter() - start_time:.1f}s")
+
+    build_start = time.perf_counter()
+    model = build_co_enrollment(enrollments, args.min_support, args.top_n)
+    print(f"Built co-enrollment model in {time.perf_counter() - build_start:.1f}s: {model.stats()}")
+
+    if model.course_names:
+        lookups = 10_000
+        lookup_start = time.perf_counter()
+        for i in range(lookups):
+            model.also_took(model.course_names[i % len(model.course_names)])
+        print(f"Lookup latency: {(time.perf_counter() - lookup_start) / lookups * 1e6:.1f}us")
+
+    if args.dry_run:
+        return
+    version_dir = publish_version(CO_ENROLLMENT_DIR, model.save)
+    print(f"Published {version_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Convert stored interaction and profile vectors to another storage encoding.
+
+Rewrites ``Interaction.user_vector`` and ``User.profile_vector`` from
+whatever encoding they were stored in to ``--encoding`` (default:
+``VECTOR_STORAGE_ENCODING``) and records it in ``vector_encoding``. Reads
+decode every encoding, so the application can keep running while this
+migrates nodes batch by batch; a profile updated mid-batch is skipped and
+picked up by a re-run.
+
+Usage
+-----
+    python -m scripts.migrate_vector_encoding --dry-run
+    python -m scripts.migrate_vector_encoding --encoding float16 --batch-size 2000
+"""
+import argparse
+import time
+
+from neo4j import GraphDatabase
+
+from core.config import (
+    neo4j_uri, neo4j_user, neo4j_password, VECTOR_STORAGE_ENCODING, VECTOR_STORAGE_ENCODINGS
+)
+from database.vector_codec import decode_vector, encode_vector
+
+# (label, vector property, property that changes whenever the vector does).
+# Every conversion has a lossy side, so converted vectors lose their unit-norm flag
+TARGETS = [
+    ("Interaction", "user_vector", "created_at"),
+    ("User", "profile_vector", "profile_updated_at"),
+]
+
+
+def count_pending(tx, label, prop, encoding):
+    return tx.run(f"""
+        MATCH (n:{label})
+        WHERE n.{prop} IS NOT NULL AND coalesce(n.vector_encoding, 'list') <> $encoding
+        RETURN count(n) AS total
+    """, encoding=encoding).single()["total"]
+
+
+def read_pending(tx, label, prop, version_prop, encoding, exclude, limit):
+    result = tx.run(f"""
+        MATCH (n:{label})
+        WHERE n.{prop} IS NOT NULL AND coalesce(n.vector_encoding, 'list') <> $encoding
+          AND NOT elementId(n) IN $exclude
+        RETURN elementId(n) AS element_id, n.{prop} AS vector, n.{version_prop} AS version
+        LIMIT $limit
+    """, encoding=encoding, exclude=exclude, limit=limit)
+    return [record.data() for record in result]
+
+
+def write_encoded(tx, label, prop, version_prop, rows, encoding):
+    return tx.run(f"""
+        UNWIND $rows AS row
+        MATCH (n:{label}) WHERE elementId(n) = row.element_id
+          AND (n.{version_prop} = row.version OR (n.{version_prop} IS NULL AND row.version IS NULL))
+        SET n.{prop} = row.vector,
+            n.vector_encoding = $encoding,
+            n.vector_normalized = false
+        RETURN collect(elementId(n)) AS written
+    """, rows=rows, encoding=encoding).single()["written"]
+
+
+def migrate(session, label, prop, version_prop, encoding, batch_size):
+    total = session.execute_read(count_pending, label, prop, encoding)
+    print(f"{label}.{prop}: {total} vectors to convert to {encoding}")
+
+    written = 0
+    # Undecodable or concurrently updated nodes; excluded so the loop always advances
+    skipped = []
+    while True:
+        records = session.execute_read(
+            read_pending, label, prop, version_prop, encoding, skipped, batch_size
+        )
+        if not records:
+            break
+
+        rows = []
+        for record in records:
+            vector = decode_vector(record["vector"])
+            if vector is None:
+                skipped.append(record["element_id"])
+                continue
+            rows.append({
+                "element_id": record["element_id"],
+                "vector": encode_vector(vector, encoding),
+                "version": record["version"],
+            })
+        if not rows:
+            continue
+
+        batch_written = set(session.execute_write(write_encoded, label, prop, version_prop, rows, encoding))
+        # Rows whose version moved were rewritten by the application; skip them this run
+        skipped.extend(r["element_id"] for r in rows if r["element_id"] not in batch_written)
+        written += len(batch_written)
+        print(f"  {written}/{total} converted")
+
+    return written, len(skipped)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--encoding", choices=VECTOR_STORAGE_ENCODINGS, default=VECTOR_STORAGE_ENCODING)
+    parser.add_argument("--batch-size", type=int, default=1000, help="Nodes per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Only count vectors to convert")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+    try:
+        with driver.session() as session:
+            for label, prop, version_prop in TARGETS:
+                if args.dry_run:
+                    total = session.execute_read(count_pending, label, prop, args.encoding)
+                    print(f"{label}.{prop}: {total} vectors to convert to {args.encoding}")
+                    continue
+                written, skipped = migrate(session, label, prop, version_prop, args.encoding, args.batch_size)
+                print(f"{label}.{prop}: converted {written}"
+                      + (f", skipped {skipped} (re-run to retry)" if skipped else ""))
+    finally:
+        driver.close()
+
+    print(f"Done in {time.perf_counter() - start_time:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
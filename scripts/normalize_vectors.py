@@ -0,0 +1,118 @@
+"""
+L2-normalise stored interaction and profile vectors in place.
+
+Vectors written since write-time normalisation are stored unit-norm with
+``vector_normalized = true``, which lets similarity scoring skip their norm.
+This one-off job does the same for older ``Interaction.user_vector`` and
+``User.profile_vector`` values stored as lists. Byte encodings are lossy,
+so they are left to be normalised when read. A profile updated mid-batch is
+skipped and picked up by a re-run.
+
+Usage
+-----
+    python -m scripts.normalize_vectors --dry-run
+    python -m scripts.normalize_vectors --batch-size 2000
+"""
+import argparse
+import time
+
+from neo4j import GraphDatabase
+
+from core.config import neo4j_uri, neo4j_user, neo4j_password
+from database.vector_codec import decode_vector, encode_vector, LOSSLESS_ENCODINGS
+from scripts.migrate_vector_encoding import TARGETS
+from utils.vector_math import normalize_vector
+
+
+def count_pending(tx, label, prop):
+    return tx.run(f"""
+        MATCH (n:{label})
+        WHERE n.{prop} IS NOT NULL AND NOT coalesce(n.vector_normalized, false)
+          AND coalesce(n.vector_encoding, 'list') IN $lossless_encodings
+        RETURN count(n) AS total
+    """, lossless_encodings=list(LOSSLESS_ENCODINGS)).single()["total"]
+
+
+def read_pending(tx, label, prop, version_prop, exclude, limit):
+    result = tx.run(f"""
+        MATCH (n:{label})
+        WHERE n.{prop} IS NOT NULL AND NOT coalesce(n.vector_normalized, false)
+          AND coalesce(n.vector_encoding, 'list') IN $lossless_encodings
+          AND NOT elementId(n) IN $exclude
+        RETURN elementId(n) AS element_id, n.{prop} AS vector, n.{version_prop} AS version,
+               coalesce(n.vector_encoding, 'list') AS encoding
+        LIMIT $limit
+    """, exclude=exclude, limit=limit, lossless_encodings=list(LOSSLESS_ENCODINGS))
+    return [record.data() for record in result]
+
+
+def write_normalized(tx, label, prop, version_prop, rows):
+    return tx.run(f"""
+        UNWIND $rows AS row
+        MATCH (n:{label}) WHERE elementId(n) = row.element_id
+          AND (n.{version_prop} = row.version OR (n.{version_prop} IS NULL AND row.version IS NULL))
+        SET n.{prop} = row.vector,
+            n.vector_normalized = true
+        RETURN collect(elementId(n)) AS written
+    """, rows=rows).single()["written"]
+
+
+def normalize_label(session, label, prop, version_prop, batch_size):
+    total = session.execute_read(count_pending, label, prop)
+    print(f"{label}.{prop}: {total} vectors to normalise")
+
+    written = 0
+    # Zero or undecodable vectors and concurrently updated nodes; excluded so the loop advances
+    skipped = []
+    while True:
+        records = session.execute_read(read_pending, label, prop, version_prop, skipped, batch_size)
+        if not records:
+            break
+
+        rows = []
+        for record in records:
+            unit_vector = normalize_vector(decode_vector(record["vector"]))
+            if unit_vector is None:
+                skipped.append(record["element_id"])
+                continue
+            rows.append({
+                "element_id": record["element_id"],
+                "vector": encode_vector(unit_vector, record["encoding"]),
+                "version": record["version"],
+            })
+        if not rows:
+            continue
+
+        batch_written = set(session.execute_write(write_normalized, label, prop, version_prop, rows))
+        skipped.extend(r["element_id"] for r in rows if r["element_id"] not in batch_written)
+        written += len(batch_written)
+        print(f"  {written}/{total} normalised")
+
+    return written, len(skipped)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batch-size", type=int, default=1000, help="Nodes per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Only count vectors to normalise")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+    try:
+        with driver.session() as session:
+            for label, prop, version_prop in TARGETS:
+                if args.dry_run:
+                    print(f"{label}.{prop}: {session.execute_read(count_pending, label, prop)} vectors to normalise")
+                    continue
+                written, skipped = normalize_label(session, label, prop, version_prop, args.batch_size)
+                print(f"{label}.{prop}: normalised {written}"
+                      + (f", skipped {skipped} (zero vectors, or re-run to retry)" if skipped else ""))
+    finally:
+        driver.close()
+
+    print(f"Done in {time.perf_counter() - start_time:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Profile cold start of the application and its agents.
+
+Records ``python -X importtime`` output for the main entry modules and the
+wall-clock time of every initialisation phase, in the order app.py pays for
+them, and writes a JSON report that can be compared across commits.
+
+Run against local stand-in databases (e.g. the containers from
+``docker/docker-compose.yml``); connection settings can be overridden on the
+command line so a profiling run never points at shared infrastructure.
+
+By default vector stores are built into an empty temporary cache directory so
+the FAISS phases measure a true cold build; pass ``--cache warm`` to profile
+loading from the configured cache instead.
+
+Usage
+-----
+    python -m scripts.profile_startup
+    python -m scripts.profile_startup --cache warm --mysql-host 127.0.0.1 --output profile.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT_DIR = os.path.join(PROJECT_ROOT, "data", "profiles")
+
+IMPORT_TARGETS = [
+    "core.config",
+    "agents.database_agent",
+    "agents.collaborative_agent",
+    "agents.content_agent",
+    "core.orchestrator",
+    "app.gradio_interface",
+]
+
+# Command-line flag -> environment variable read by core.config
+DATABASE_OVERRIDES = {
+    "mysql_host": "MYSQL_HOST",
+    "mysql_database": "MYSQL_DATABASE",
+    "mysql_user": "MYSQL_USER",
+    "mysql_password": "MYSQL_PASSWORD",
+    "neo4j_uri": "NEO4J_URI",
+    "neo4j_user": "NEO4J_USER",
+    "neo4j_password": "NEO4J_PASSWORD",
+}
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def _git_revision():
+    """Return (commit, dirty) for the working tree, or (None, None) outside git."""
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=PROJECT_ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+        status = subprocess.check_output(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=PROJECT_ROOT, text=True, stderr=subprocess.DEVNULL
+        )
+        return commit, bool(status.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def profile_import(module, env, top_n):
+    """Import ``module`` in a fresh interpreter with -X importtime and summarise it."""
+    start_time = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    wall_seconds = time.perf_counter() - start_time
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append({
+                "module": name,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": len(indent) // 2,
+            })
+
+    target = next((e for e in entries if e["module"] == module), None)
+    report = {
+        "module": module,
+        "ok": result.returncode == 0,
+        "wall_seconds": round(wall_seconds, 3),
+        "cumulative_seconds": round(target["cumulative_us"] / 1e6, 3) if target else None,
+        "modules_imported": len(entries),
+        "slowest": sorted(entries, key=lambda e: e["self_us"], reverse=True)[:top_n],
+    }
+    if result.returncode != 0:
+        error_lines = [l for l in result.stderr.splitlines() if not l.startswith("import time:")]
+        report["error"] = error_lines[-1] if error_lines else f"exit code {result.returncode}"
+    return report
+
+
+class PhaseTimer:
+    """Run named phases in order, stopping at the first failure."""
+
+    def __init__(self):
+        self.phases = []
+        self.failed = False
+
+    def run(self, name, fn):
+        if self.failed:
+            self.phases.append({"phase": name, "status": "skipped", "seconds": None})
+            return None
+
+        start_time = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            self.failed = True
+            self.phases.append({
+                "phase": name,
+                "status": "failed",
+                "seconds": round(time.perf_counter() - start_time, 3),
+                "error": f"{type(e).__name__}: {e}",
+            })
+            return None
+
+        self.phases.append({
+            "phase": name,
+            "status": "ok",
+            "seconds": round(time.perf_counter() - start_time, 3),
+        })
+        return result
+
+    def record(self, name, seconds):
+        """Add a phase measured elsewhere (e.g. inside another phase)."""
+        self.phases.append({"phase": name, "status": "ok", "seconds": round(seconds, 3)})
+
+
+@contextmanager
+def _timed_attribute(owner, attribute, totals, key):
+    """Accumulate time spent in ``owner.attribute`` while the context is active."""
+    original = getattr(owner, attribute)
+
+    def _wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            totals[key] = totals.get(key, 0.0) + time.perf_counter() - start_time
+
+    setattr(owner, attribute, _wrapper)
+    try:
+        yield
+    finally:
+        setattr(owner, attribute, original)
+
+
+def profile_phases():
+    """Time each initialisation phase in this process, in application order."""
+    timer = PhaseTimer()
+
+    config = timer.run("config_import", lambda: __import__("core.config", fromlist=["_"]))
+    timer.run("embedding_model_load", lambda: config.get_embed_model())
+    timer.run("catalog_fetch", lambda: config.get_course_catalog().get_prompt_text())
+    timer.run("course_faiss_build", lambda: config.get_course_vector_store())
+
+    # The paper index loads PDFs inside its build step; split that time out
+    if not timer.failed:
+        import utils.data_loaders as data_loaders
+        inner = {}
+        with _timed_attribute(data_loaders, "load_research_papers", inner, "paper_load"):
+            timer.run("paper_index", lambda: config.get_paper_vector_store())
+        if not timer.failed:
+            index_seconds = timer.phases.pop()["seconds"]
+            paper_load_seconds = inner.get("paper_load", 0.0)
+            timer.record("paper_load", paper_load_seconds)
+            timer.record("paper_faiss_build", index_seconds - paper_load_seconds)
+    else:
+        timer.run("paper_load", lambda: None)
+        timer.run("paper_faiss_build", lambda: None)
+
+    agents = {}
+
+    def _construct(module_name, class_name):
+        module = __import__(module_name, fromlist=[class_name])
+        agents[class_name] = getattr(module, class_name)()
+
+    timer.run("database_agent_init", lambda: _construct("agents.database_agent", "DatabaseAgent"))
+    timer.run("collaborative_agent_init", lambda: _construct("agents.collaborative_agent", "CollaborativeAgent"))
+    timer.run("content_agent_init", lambda: _construct("agents.content_agent", "ContentAgent"))
+
+    orchestrator = timer.run(
+        "orchestrator_init",
+        lambda: __import__("core.orchestrator", fromlist=["_"]).RecommendationSystem()
+    )
+    component_timings = getattr(orchestrator, "startup_timings", None)
+
+    return timer, component_timings
+
+
+def _print_summary(report):
+    print(f"commit: {report['commit']}{' (dirty)' if report['dirty'] else ''}  cache: {report['cache_mode']}")
+    print("\nimport times (fresh interpreter)")
+    for entry in report["imports"]:
+        status = "" if entry["ok"] else f"  FAILED: {entry.get('error')}"
+        print(f"  {entry['module']:<30} {entry['cumulative_seconds'] or 0:>8.3f}s{status}")
+    print("\ninitialisation phases")
+    for phase in report["phases"]:
+        seconds = "-" if phase["seconds"] is None else f"{phase['seconds']:.3f}s"
+        suffix = "" if phase["status"] == "ok" else f"  {phase['status'].upper()} {phase.get('error', '')}"
+        print(f"  {phase['phase']:<30} {seconds:>9}{suffix}")
+    print(f"  {'total':<30} {report['total_seconds']:>8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", default=None,
+                        help="Report path (default: data/profiles/startup-<commit>-<time>.json)")
+    parser.add_argument("--cache", choices=["cold", "warm"], default="cold",
+                        help="cold builds vector stores into an empty temp cache; warm uses VECTOR_CACHE_DIR")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to keep per target")
+    parser.add_argument("--skip-imports", action="store_true", help="Skip the -X importtime runs")
+    for flag, env_name in DATABASE_OVERRIDES.items():
+        parser.add_argument(f"--{flag.replace('_', '-')}", dest=flag, default=None,
+                            help=f"Override {env_name}")
+    args = parser.parse_args()
+
+    for flag, env_name in DATABASE_OVERRIDES.items():
+        value = getattr(args, flag)
+        if value is not None:
+            os.environ[env_name] = value
+
+    temp_cache = None
+    if args.cache == "cold":
+        temp_cache = tempfile.TemporaryDirectory(prefix="profile-cache-")
+        os.environ["VECTOR_CACHE_DIR"] = temp_cache.name
+
+    commit, dirty = _git_revision()
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+
+    imports = [] if args.skip_imports else [profile_import(m, env, args.top) for m in IMPORT_TARGETS]
+
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+
+    start_time = time.perf_counter()
+    timer, component_timings = profile_phases()
+    total_seconds = time.perf_counter() - start_time
+
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cache_mode": args.cache,
+        "database_settings": {
+            env_name: os.environ.get(env_name)
+            for env_name in DATABASE_OVERRIDES.values() if not env_name.endswith("PASSWORD")
+        },
+        "imports": imports,
+        "phases": timer.phases,
+        "orchestrator_component_timings": component_timings,
+        "total_seconds": round(total_seconds, 3),
+    }
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(DEFAULT_OUTPUT_DIR, f"startup-{(commit or 'nogit')[:8]}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as fh:
+        json.dump(report, fh, indent=2)
+
+    _print_summary(report)
+    print(f"\nreport written to {output}")
+
+    if temp_cache is not None:
+        temp_cache.cleanup()
+
+    return 1 if timer.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Re-embed stored interactions with the configured user vector model.
+
+After switching ``USER_VECTOR_BACKEND`` (or the model behind it), interactions
+embedded by the previous model are invisible to user similarity. This
+re-embeds them in batches through ``Neo4jConnector.get_user_vectors``, tags
+them with ``Interaction.embedding_model``, then rebuilds the profile vectors
+of affected users.
+
+Profile text is rebuilt from each user's current education, age group and
+profession, which are the only values stored; interactions whose profile
+fails to embed are reported and left untouched.
+
+Usage
+-----
+    python -m scripts.reembed_interactions --dry-run
+    USER_VECTOR_BACKEND=local python -m scripts.reembed_interactions --batch-size 960
+"""
+import argparse
+import time
+
+from core.config import (
+    USER_PROFILE_DECAY, USER_VECTOR_MODEL, UNTAGGED_USER_VECTOR_MODEL, VECTOR_STORAGE_ENCODING
+)
+from database.neo4j_connector import Neo4jConnector
+from database.vector_codec import encode_vector, LOSSLESS_ENCODINGS
+from scripts.backfill_user_profiles import backfill_profiles
+
+
+def count_stale(tx, model, untagged_model):
+    return tx.run("""
+        MATCH (:User)-[:MADE]->(i:Interaction)
+        WHERE coalesce(i.embedding_model, $untagged_model) <> $model
+        RETURN count(i) AS total
+    """, model=model, untagged_model=untagged_model).single()["total"]
+
+
+def read_stale(tx, model, untagged_model, exclude, limit):
+    result = tx.run("""
+        MATCH (u:User)-[:MADE]->(i:Interaction)
+        WHERE coalesce(i.embedding_model, $untagged_model) <> $model
+          AND NOT elementId(i) IN $exclude
+        RETURN elementId(i) AS element_id, u.education AS education, u.age_group AS age_group,
+               u.profession AS profession, i.query AS query
+        LIMIT $limit
+    """, model=model, untagged_model=untagged_model, exclude=exclude, limit=limit)
+    return [record.data() for record in result]
+
+
+def write_vectors(tx, rows, model, encoding):
+    tx.run("""
+        UNWIND $rows AS row
+        MATCH (i:Interaction) WHERE elementId(i) = row.element_id
+        SET i.user_vector = row.vector,
+            i.vector_encoding = $encoding,
+            i.vector_normalized = $encoding IN $lossless_encodings,
+            i.embedding_model = $model
+    """, rows=rows, model=model, encoding=encoding, lossless_encodings=list(LOSSLESS_ENCODINGS)).consume()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batch-size", type=int, default=960,
+                        help="Interactions read and written per round (default: 10 Cohere calls)")
+    parser.add_argument("--dry-run", action="store_true", help="Only count interactions to re-embed")
+    parser.add_argument("--skip-profiles", action="store_true",
+                        help="Do not rebuild User.profile_vector afterwards")
+    args = parser.parse_args()
+
+    connector = Neo4jConnector()
+    driver = connector.driver
+    start_time = time.perf_counter()
+    try:
+        with driver.session() as session:
+            total = session.execute_read(count_stale, USER_VECTOR_MODEL, UNTAGGED_USER_VECTOR_MODEL)
+            print(f"{total} interactions not embedded by {USER_VECTOR_MODEL}")
+            if args.dry_run or total == 0:
+                return
+
+            done = 0
+            failed = []
+            while True:
+                rows = session.execute_read(
+                    read_stale, USER_VECTOR_MODEL, UNTAGGED_USER_VECTOR_MODEL, failed, args.batch_size
+                )
+                if not rows:
+                    break
+
+                results = connector.get_user_vectors(rows)
+                updates = []
+                for row, result in zip(rows, results):
+                    if result["vector"] is None:
+                        failed.append(row["element_id"])
+                        print(f"  failed {row['element_id']}: {result['error']}")
+                    else:
+                        updates.append({
+                            "element_id": row["element_id"],
+                            "vector": encode_vector(result["vector"], VECTOR_STORAGE_ENCODING),
+                        })
+                if updates:
+                    session.execute_write(write_vectors, updates, USER_VECTOR_MODEL, VECTOR_STORAGE_ENCODING)
+                done += len(updates)
+                print(f"  {done}/{total} interactions re-embedded")
+
+        print(f"Re-embedded {done} interactions in {time.perf_counter() - start_time:.1f}s"
+              + (f"; {len(failed)} failed" if failed else ""))
+
+        if not args.skip_profiles:
+            written, skipped = backfill_profiles(driver, decay=USER_PROFILE_DECAY)
+            print(f"Rebuilt {written} user profiles"
+                  + (f"; {skipped} skipped after concurrent writes" if skipped else ""))
+    finally:
+        connector.close()
+
+
+if __name__ == "__main__":
+    main()
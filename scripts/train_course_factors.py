@@ -0,0 +1,141 @@
+"""
+Train implicit-feedback matrix factorisation (ALS) over enrollments and interactions.
+
+Builds a user x course feedback matrix from ``ENROLLED_IN`` edges (weight 1)
+and the ``**Course: <name>**`` headings of the recommendations users
+received in past interactions (weight ``--recommendation-weight``), factorises
+it with implicit ALS and publishes user and course factor arrays as a new
+version under ``COURSE_FACTORS_DIR``. Serving memory-maps the current
+version and switches to a new one within ``COLLABORATIVE_MODEL_REFRESH_SECONDS``,
+so training never blocks requests.
+
+Retraining starts from the factors of the currently published model, so
+``--warm-iterations`` sweeps are usually enough; ``--interval`` keeps the
+trainer running and retrains on that schedule.
+
+Usage
+-----
+    python -m scripts.train_course_factors
+    python -m scripts.train_course_factors --factors 64 --interval 3600
+"""
+import argparse
+import time
+
+from neo4j import GraphDatabase
+
+from core.config import neo4j_uri, neo4j_user, neo4j_password, COURSE_FACTORS_DIR
+from database.course_factors import (
+    build_feedback_matrix, courses_in_response, load_warm_start, save_course_factors, train_implicit_als
+)
+from utils.artifact_store import current_version_dir, publish_version
+
+
+def read_enrollments(tx):
+    result = tx.run("""
+        MATCH (u:User)-[:ENROLLED_IN]->(c:Course)
+        RETURN u.id AS user_id, c.name AS course
+    """)
+    return [(record["user_id"], record["course"]) for record in result]
+
+
+def read_recommendations(tx, course_names):
+    result = tx.run("""
+        MATCH (u:User)-[:MADE]->(i:Interaction)
+        WHERE i.response CONTAINS '**Course:'
+        RETURN u.id AS user_id, i.response AS response
+    """)
+    return [
+        (record["user_id"], course)
+        for record in result
+        for course in courses_in_response(record["response"], course_names)
+    ]
+
+
+def read_course_names(tx):
+    return {record["name"] for record in tx.run("MATCH (c:Course) RETURN c.name AS name")}
+
+
+def train_once(driver, args):
+    start_time = time.perf_counter()
+    with driver.session() as session:
+        enrollments = session.execute_read(read_enrollments)
+        recommendations = []
+        if args.recommendation_weight > 0:
+            course_names = session.execute_read(read_course_names)
+            recommendations = session.execute_read(read_recommendations, course_names)
+    user_ids, course_names, indptr, indices, values = build_feedback_matrix(
+        enrollments, recommendations, args.recommendation_weight
+    )
+    print(f"Read {len(enrollments)} enrollments and {len(recommendations)} recommended courses "
+          f"({len(user_ids)} users x {len(course_names)} courses) in {time.perf_counter() - start_time:.1f}s")
+    if not user_ids:
+        print("No feedback to train on")
+        return
+
+    warm_start = None if args.cold else load_warm_start(
+        current_version_dir(COURSE_FACTORS_DIR), user_ids, course_names, args.factors, args.seed
+    )
+    iterations = args.iterations if warm_start is None else args.warm_iterations
+    initial_users, initial_courses = warm_start or (None, None)
+
+    train_start = time.perf_counter()
+    user_factors, course_factors = train_implicit_als(
+        indptr, indices, values, len(course_names),
+        factors=args.factors, regularization=args.regularization, alpha=args.alpha,
+        iterations=iterations, seed=args.seed,
+        initial_users=initial_users, initial_courses=initial_courses
+    )
+    print(f"Trained {iterations} {'warm' if warm_start else 'cold'} ALS sweeps "
+          f"in {time.perf_counter() - train_start:.1f}s")
+
+    metadata = {
+        'factors': args.factors,
+        'regularization': args.regularization,
+        'alpha': args.alpha,
+        'iterations': iterations,
+        'warm_start': warm_start is not None,
+        'recommendation_weight': args.recommendation_weight,
+        'feedback_pairs': int(len(values)),
+        'trained_at': int(time.time()),
+    }
+    version_dir = publish_version(COURSE_FACTORS_DIR, lambda staging_dir: save_course_factors(
+        staging_dir, user_ids, course_names, user_factors, course_factors, indptr, indices, metadata
+    ))
+    print(f"Published {version_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--factors", type=int, default=32, help="Latent dimension")
+    parser.add_argument("--regularization", type=float, default=0.05)
+    parser.add_argument("--alpha", type=float, default=20.0, help="Confidence per unit of feedback")
+    parser.add_argument("--iterations", type=int, default=15, help="ALS sweeps from random factors")
+    parser.add_argument("--warm-iterations", type=int, default=5,
+                        help="ALS sweeps when starting from the published model")
+    parser.add_argument("--recommendation-weight", type=float, default=0.25,
+                        help="Feedback of a course shown in a past response, relative to an enrollment (0 disables)")
+    parser.add_argument("--cold", action="store_true", help="Ignore the published model and start from random factors")
+    parser.add_argument("--interval", type=float, default=0,
+                        help="Retrain every this many seconds instead of exiting (0 trains once)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+    try:
+        while True:
+            cycle_start = time.monotonic()
+            if args.interval <= 0:
+                train_once(driver, args)
+                break
+            try:
+                train_once(driver, args)
+            except Exception as e:
+                # Keep the schedule; serving continues on the last published model
+                print(f"Training failed: {e}")
+            time.sleep(max(0.0, args.interval - (time.monotonic() - cycle_start)))
+    finally:
+        driver.close()
+
+
+if __name__ == "__main__":
+    main()
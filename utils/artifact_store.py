@@ -0,0 +1,169 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from utils.logger import SystemLogger
+
+CURRENT_POINTER = "CURRENT"
+
+
+def _version_timestamp(name: str) -> Optional[int]:
+    """Parse the creation time from a version directory name (v<ns>-<pid>)."""
+    if not name.startswith("v"):
+        return None
+    try:
+        return int(name[1:].split("-", 1)[0])
+    except ValueError:
+        return None
+
+
+def current_version_dir(root: str) -> Optional[str]:
+    """
+    Return the directory of the currently published artifact version.
+
+    Parameters
+    ----------
+    root : str
+        Directory holding versioned artifacts and the CURRENT pointer
+
+    Returns
+    -------
+    str or None
+        Absolute path of the current version, or None if nothing is published
+    """
+    try:
+        with open(os.path.join(root, CURRENT_POINTER)) as fh:
+            version = fh.read().strip()
+    except OSError:
+        return None
+
+    version_dir = os.path.join(root, version)
+    return version_dir if version and os.path.isdir(version_dir) else None
+
+
+def publish_version(root: str, write_fn: Callable[[str], None], keep: int = 2) -> str:
+    """
+    Write a new artifact version and atomically point CURRENT at it.
+
+    ``write_fn`` fills a private staging directory, which is then renamed to a
+    new version directory. CURRENT is replaced with ``os.replace``, so readers
+    always see either the previous or the new version, never a partial one.
+    Older versions beyond ``keep`` are removed; the previous version is kept
+    by default for readers that resolved CURRENT just before the switch.
+
+    Parameters
+    ----------
+    root : str
+        Directory holding versioned artifacts and the CURRENT pointer
+    write_fn : callable
+        Called with the staging directory path; writes the artifact files
+    keep : int, optional
+        Number of most recent versions to keep, by default 2
+
+    Returns
+    -------
+    str
+        Path of the newly published version directory
+    """
+    os.makedirs(root, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=root)
+
+    try:
+        write_fn(staging_dir)
+        version = f"v{time.time_ns()}-{os.getpid()}"
+        version_dir = os.path.join(root, version)
+        os.rename(staging_dir, version_dir)
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    pointer_tmp = os.path.join(root, f".{CURRENT_POINTER}.{os.getpid()}.tmp")
+    with open(pointer_tmp, "w") as fh:
+        fh.write(version)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(pointer_tmp, os.path.join(root, CURRENT_POINTER))
+
+    versions = sorted(
+        (entry for entry in os.listdir(root)
+         if _version_timestamp(entry) is not None and os.path.isdir(os.path.join(root, entry))),
+        key=_version_timestamp
+    )
+    for stale in versions[:-keep] if keep > 0 else versions:
+        if stale != version:
+            shutil.rmtree(os.path.join(root, stale), ignore_errors=True)
+
+    SystemLogger.debug("Published artifact version", {'root': root, 'version': version})
+    return version_dir
+
+
+class PublishedArtifact:
+    """
+    Read-only handle on the latest version published under ``root``.
+
+    The version CURRENT points at is loaded on first use; afterwards CURRENT
+    is checked at most every ``refresh_seconds`` and a newer version is
+    loaded before it replaces the old one, so readers never wait on the
+    process that publishes. A version that fails to load is logged and the
+    previous one kept.
+
+    Parameters
+    ----------
+    root : str
+        Directory holding versioned artifacts and the CURRENT pointer
+    refresh_seconds : float
+        Seconds between checks for a newly published version
+    loader : callable
+        Called with a version directory; returns the loaded artifact
+    label : str
+        Artifact name used in log messages
+    """
+
+    def __init__(self, root: str, refresh_seconds: float, loader: Callable[[str], Any], label: str):
+        self._root = root
+        self._refresh_seconds = refresh_seconds
+        self._loader = loader
+        self.label = label
+        self._lock = threading.Lock()
+        self._artifact = None
+        self.version_dir = None
+        self._checked_at = None
+
+    def get(self) -> Any:
+        """Return the loaded artifact, or None if no version is published."""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self._refresh_seconds:
+            return self._artifact
+        if not self._lock.acquire(blocking=self._checked_at is None):
+            # Another thread is checking; keep serving the loaded version
+            return self._artifact
+        try:
+            self._checked_at = now
+            version_dir = current_version_dir(self._root)
+            if version_dir is not None and version_dir != self.version_dir:
+                self._load(version_dir)
+        finally:
+            self._lock.release()
+        return self._artifact
+
+    def _load(self, version_dir: str) -> None:
+        start_time = time.perf_counter()
+        try:
+            artifact = self._loader(version_dir)
+        except Exception as e:
+            SystemLogger.error(
+                f"{self.label} could not be loaded - Keeping the previous version",
+                exception=e,
+                context={'version_dir': version_dir, 'loaded_version': self.version_dir},
+                fail_fast=False
+            )
+            return
+        self._artifact = artifact
+        self.version_dir = version_dir
+        SystemLogger.info(f"{self.label} loaded", {
+            'version_dir': version_dir,
+            'load_seconds': round(time.perf_counter() - start_time, 3)
+        })
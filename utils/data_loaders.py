@@ -1,10 +1,16 @@
-from core.config import SPLITTER
+from core.config import (
+    get_splitter, EMBEDDING_MODEL_NAME, CHUNK_SIZE, CHUNK_OVERLAP, PAPER_INDEX_CACHE_DIR
+)
 from langchain_community.document_loaders import PyPDFLoader
+from langchain_community.vectorstores import FAISS
 from langchain.schema import Document
 import os
 from typing import List
 from utils.logger import SystemLogger
-from utils.exceptions import FileProcessingError, ConfigurationError
+from utils.exceptions import FileProcessingError, ConfigurationError, VectorStoreError
+from utils.vector_store_cache import (
+    compute_fingerprint, fingerprint_directory, load_or_build_faiss
+)
 
 def load_research_papers(path: str) -> List[Document]:
     """
@@ -79,10 +85,11 @@ def load_research_papers(path: str) -> List[Document]:
         raise FileProcessingError(f"No read permission for directory: {path}")
     
     # Validate text splitter configuration
-    if not SPLITTER:
+    splitter = get_splitter()
+    if not splitter:
         SystemLogger.error(
-            "Text splitter is not configured - Check SPLITTER initialization in config.py",
-            context={'splitter_configured': SPLITTER is not None}
+            "Text splitter is not configured - Check get_splitter() in config.py",
+            context={'splitter_configured': splitter is not None}
         )
         raise ConfigurationError("Text splitter not configured")
     
@@ -194,10 +201,10 @@ def load_research_papers(path: str) -> List[Document]:
         # Split documents
         SystemLogger.debug(f"Splitting documents with text splitter", {
             'total_docs': len(docs),
-            'splitter_type': type(SPLITTER).__name__
+            'splitter_type': type(splitter).__name__
         })
         
-        split_docs = SPLITTER.split_documents(docs)
+        split_docs = splitter.split_documents(docs)
         
         SystemLogger.info("Research papers loaded and split successfully", {
             'path': path,
@@ -226,4 +233,87 @@ def load_research_papers(path: str) -> List[Document]:
                 'error_type': type(e).__name__
             }
         )
-        raise FileProcessingError(f"Failed to load research papers: {e}")
\ No newline at end of file
+        raise FileProcessingError(f"Failed to load research papers: {e}")
+
+
+def load_research_paper_index(path: str, embed_model, cache_dir: str = PAPER_INDEX_CACHE_DIR) -> FAISS:
+    """
+    Load the research paper FAISS index from disk, rebuilding it only when stale.
+    
+    The cached index is keyed by a fingerprint of the PDF files in ``path``
+    together with the embedding model name and the chunking parameters, so
+    adding, removing or editing a paper, or changing how papers are embedded,
+    triggers exactly one rebuild. Rebuilt indexes replace the previous
+    artifact atomically.
+    
+    Parameters
+    ----------
+    path : str
+        Directory path containing PDF research papers
+    embed_model : Embeddings
+        Embedding model used to build and load the index
+    cache_dir : str, optional
+        Directory holding cached paper index artifacts
+        (default: PAPER_INDEX_CACHE_DIR from config)
+    
+    Returns
+    -------
+    FAISS
+        Vector store over chunked research paper content
+        
+    Raises
+    ------
+    FileProcessingError
+        If the papers directory cannot be read or contains no loadable PDFs
+    VectorStoreError
+        If the index cannot be fingerprinted or built
+        
+    Examples
+    --------
+    >>> index = load_research_paper_index("data/papers", embed_model)
+    >>> retriever = index.as_retriever(search_kwargs={"k": 5})
+    """
+    SystemLogger.debug("Resolving research paper index", {
+        'path': path, 'cache_dir': cache_dir
+    })
+    
+    if not path or not os.path.isdir(path):
+        SystemLogger.error(
+            f"Research papers directory does not exist - Check if path is correct: {path}",
+            context={'path': path}
+        )
+        raise FileProcessingError(f"Directory not found: {path}")
+    
+    fingerprint = compute_fingerprint([
+        fingerprint_directory(path, extensions=['.pdf']),
+        EMBEDDING_MODEL_NAME,
+        CHUNK_SIZE,
+        CHUNK_OVERLAP
+    ])
+    
+    def _build_index() -> FAISS:
+        docs = load_research_papers(path)
+        if not docs:
+            SystemLogger.error(
+                "No research papers loaded - Check papers directory and file permissions",
+                context={'papers_dir': path, 'docs_count': len(docs)}
+            )
+            raise FileProcessingError("No research papers loaded")
+        
+        try:
+            return FAISS.from_documents(docs, embed_model)
+        except Exception as e:
+            SystemLogger.error(
+                "Failed to build research paper vector store",
+                exception=e,
+                context={'papers_dir': path, 'docs_count': len(docs)}
+            )
+            raise VectorStoreError(f"Failed to build research paper index: {e}")
+    
+    return load_or_build_faiss(
+        cache_dir=cache_dir,
+        fingerprint=fingerprint,
+        embed_model=embed_model,
+        build_fn=_build_index,
+        label="research paper index"
+    )
@@ -0,0 +1,169 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+from utils.logger import SystemLogger
+
+
+def embedding_key(model: str, text: str) -> str:
+    """Cache key for ``text`` embedded by ``model``: the model name and a SHA-256 of the exact text."""
+    return f"{model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU of embeddings, optionally backed by a SQLite file.
+
+    Entries are keyed by model name and the exact input text, so switching
+    models never returns a vector from the old one. Vectors are held as
+    float32 arrays (4 bytes per dimension) and returned as lists of floats.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum vectors kept in memory; 0 disables the memory tier
+    db_path : str, optional
+        SQLite file for the disk tier, shared across processes and restarts;
+        None or empty disables it
+
+    Notes
+    -----
+    A disk hit is promoted into the memory tier. Disk errors are logged and
+    disable the disk tier for this process instead of failing the caller.
+    The lock only guards the memory tier, so memory hits never wait behind
+    disk I/O. SQLite connections are opened lazily per thread and process,
+    so a cache created before the server forks its workers is safe to use in
+    each of them.
+    """
+
+    def __init__(self, max_entries: int, db_path: Optional[str] = None):
+        self._max_entries = max_entries
+        self._db_path = db_path or None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """
+        Return the cached embedding of ``text`` by ``model``, or None on a miss.
+        """
+        key = embedding_key(model, text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return vector.tolist()
+
+        vector = self._disk_get(key)
+        with self._lock:
+            if vector is None:
+                self._misses += 1
+                return None
+            self._remember(key, vector)
+            self._disk_hits += 1
+        return vector.tolist()
+
+    def put(self, model: str, text: str, vector: List[float]):
+        """Store the embedding of ``text`` by ``model`` in both tiers."""
+        key = embedding_key(model, text)
+        array = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._remember(key, array)
+        self._disk_put(key, array)
+
+    def stats(self) -> dict:
+        """
+        Report hit/miss counters and tier sizes.
+
+        Returns
+        -------
+        dict
+            Memory and disk hits, misses, hit rate and entries in memory
+        """
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'hit_rate': round((self._hits + self._disk_hits) / lookups, 4) if lookups else None,
+                'entries': len(self._entries),
+                'max_entries': self._max_entries,
+                'disk_enabled': self._db_path is not None,
+            }
+
+    def _remember(self, key, array):
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = array
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    # Disk tier (called without self._lock; each thread uses its own connection)
+
+    def _connection(self):
+        db = getattr(self._local, 'db', None)
+        if db is not None and self._local.pid == os.getpid():
+            return db
+        directory = os.path.dirname(self._db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(self._db_path, timeout=5, check_same_thread=False)
+        # WAL lets every worker read while one of them writes
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        db.commit()
+        self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def _disk_get(self, key):
+        if self._db_path is None:
+            return None
+        try:
+            row = self._connection().execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            self._disable_disk(e)
+            return None
+        return None if row is None else np.frombuffer(row[0], dtype=np.float32)
+
+    def _disk_put(self, key, array):
+        if self._db_path is None:
+            return
+        try:
+            db = self._connection()
+            db.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector, created_at) VALUES (?, ?, ?)",
+                (key, array.tobytes(), time.time())
+            )
+            db.commit()
+        except (sqlite3.Error, OSError) as e:
+            self._disable_disk(e)
+
+    def _disable_disk(self, error):
+        SystemLogger.error(
+            "Embedding disk cache unavailable - Continuing with the in-memory cache only",
+            exception=error,
+            context={'db_path': self._db_path},
+            fail_fast=False
+        )
+        self._db_path = None
+        self._local.db = None
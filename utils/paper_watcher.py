@@ -0,0 +1,108 @@
+import os
+import threading
+from typing import Callable, Optional, Tuple
+
+from utils.logger import SystemLogger
+
+
+def snapshot_papers(path: str) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+    """
+    Take a cheap stat-based snapshot of the PDF files in a directory.
+
+    Parameters
+    ----------
+    path : str
+        Directory containing research paper PDFs
+
+    Returns
+    -------
+    tuple or None
+        Sorted (file name, size, mtime_ns) entries, or None if the directory
+        cannot be read
+    """
+    try:
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.lower().endswith('.pdf'):
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+        return tuple(sorted(entries))
+    except OSError:
+        return None
+
+
+class PaperCorpusWatcher:
+    """
+    Background thread that polls the papers directory and reports changes.
+
+    Every ``interval_seconds`` the watcher compares a stat snapshot of the
+    PDFs in ``path`` with the previous one; if a file was added, removed or
+    modified it calls ``on_change``. The callback runs on the watcher thread,
+    off the request path. A failing callback is logged and retried on the
+    next change.
+
+    Parameters
+    ----------
+    path : str
+        Directory containing research paper PDFs
+    interval_seconds : float
+        Seconds between polls (must be positive)
+    on_change : callable
+        Zero-argument callback invoked when the corpus changed
+    """
+
+    def __init__(self, path: str, interval_seconds: float, on_change: Callable[[], None]):
+        self.path = path
+        self.interval_seconds = interval_seconds
+        self.on_change = on_change
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._snapshot = snapshot_papers(path)
+
+    def start(self):
+        """Start polling on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="paper-corpus-watcher", daemon=True)
+        self._thread.start()
+        SystemLogger.info("Research paper watcher started", {
+            'papers_dir': self.path,
+            'interval_seconds': self.interval_seconds,
+            'pdf_files': len(self._snapshot) if self._snapshot is not None else None
+        })
+
+    def stop(self):
+        """Stop polling and wait for the thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval_seconds):
+            current = snapshot_papers(self.path)
+            if current is None or current == self._snapshot:
+                continue
+
+            previous_names = {name for name, _, _ in self._snapshot or ()}
+            current_names = {name for name, _, _ in current}
+            SystemLogger.info("Research paper corpus changed", {
+                'papers_dir': self.path,
+                'added': sorted(current_names - previous_names),
+                'removed': sorted(previous_names - current_names),
+                'pdf_files': len(current)
+            })
+
+            # Record the snapshot first so a corpus that cannot be indexed is
+            # not rebuilt on every poll; the next change triggers a new attempt
+            self._snapshot = current
+            try:
+                self.on_change()
+            except Exception as e:
+                SystemLogger.error(
+                    "Research paper reload failed - Keeping current index",
+                    exception=e,
+                    context={'papers_dir': self.path},
+                    fail_fast=False
+                )
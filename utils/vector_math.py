@@ -0,0 +1,174 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def stack_vectors(vectors: Sequence, dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack embedding vectors into a contiguous float32 matrix, masking bad rows.
+
+    Rows that are missing, not a list/tuple of ``dimension`` numbers, contain
+    NaN/inf, or have zero norm are excluded instead of raising.
+
+    Parameters
+    ----------
+    vectors : sequence
+        Candidate vectors as returned by the database (lists of floats or None)
+    dimension : int
+        Expected vector length
+
+    Returns
+    -------
+    matrix : np.ndarray
+        float32 array of shape (n_valid, dimension)
+    valid_indices : np.ndarray
+        Positions in ``vectors`` of the rows kept in ``matrix``
+    """
+    candidate_indices = np.fromiter(
+        (i for i, v in enumerate(vectors)
+         if isinstance(v, (list, tuple, np.ndarray)) and len(v) == dimension),
+        dtype=np.int64
+    )
+    if candidate_indices.size == 0:
+        return np.empty((0, dimension), dtype=np.float32), candidate_indices
+
+    try:
+        matrix = np.array([vectors[i] for i in candidate_indices], dtype=np.float32)
+    except (TypeError, ValueError):
+        # Non-numeric entries are rare; isolate them without failing the batch
+        keep = np.fromiter(
+            (_is_numeric_vector(vectors[i]) for i in candidate_indices),
+            dtype=bool, count=candidate_indices.size
+        )
+        candidate_indices = candidate_indices[keep]
+        matrix = np.array([vectors[i] for i in candidate_indices], dtype=np.float32)
+        matrix = matrix.reshape(-1, dimension)
+
+    finite = np.isfinite(matrix).all(axis=1)
+    nonzero = np.any(matrix != 0, axis=1)
+    keep = finite & nonzero
+    if not keep.all():
+        matrix = matrix[keep]
+        candidate_indices = candidate_indices[keep]
+
+    return np.ascontiguousarray(matrix), candidate_indices
+
+
+def infer_dimension(vectors: Sequence) -> Optional[int]:
+    """
+    Return the most common vector length, so a few malformed rows cannot set it.
+
+    Parameters
+    ----------
+    vectors : sequence
+        Candidate vectors (lists, tuples or arrays; other entries are ignored)
+
+    Returns
+    -------
+    int or None
+        Most common non-zero length, or None if no entry is a vector
+    """
+    lengths = {}
+    for vector in vectors:
+        if isinstance(vector, (list, tuple, np.ndarray)) and len(vector):
+            lengths[len(vector)] = lengths.get(len(vector), 0) + 1
+    return max(lengths, key=lengths.get) if lengths else None
+
+
+def _is_numeric_vector(vector) -> bool:
+    try:
+        np.asarray(vector, dtype=np.float32)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def normalize_rows(matrix: np.ndarray, unit_rows: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Scale each row of a float32 matrix to unit L2 norm.
+
+    Rows must have non-zero norm (see ``stack_vectors``).
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        float32 rows
+    unit_rows : np.ndarray, optional
+        Boolean mask of rows already stored unit-norm; their norms are not
+        computed. When given, the remaining rows are scaled in place.
+    """
+    if unit_rows is None:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / norms
+
+    pending = ~unit_rows
+    if pending.any():
+        matrix[pending] /= np.linalg.norm(matrix[pending], axis=1, keepdims=True)
+    return matrix
+
+
+def normalize_vector(vector, assume_unit: bool = False) -> np.ndarray:
+    """
+    Return ``vector`` as a unit-norm float32 array, or None if it is unusable.
+
+    A vector is unusable if it is empty, non-numeric, non-finite or all zeros.
+    With ``assume_unit`` (the vector was normalised when it was stored) it is
+    only validated, not rescaled.
+    """
+    try:
+        array = np.asarray(vector, dtype=np.float32).ravel()
+    except (TypeError, ValueError):
+        return None
+    if array.size == 0 or not np.isfinite(array).all():
+        return None
+    if assume_unit:
+        return array if array.any() else None
+    norm = np.linalg.norm(array)
+    if norm == 0:
+        return None
+    return array / norm
+
+
+def top_k_cosine(query: np.ndarray, normalized_matrix: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the rows most cosine-similar to a query with one matrix-vector product.
+
+    Parameters
+    ----------
+    query : np.ndarray
+        Unit-norm float32 query vector
+    normalized_matrix : np.ndarray
+        Unit-norm float32 candidate rows
+    k : int
+        Number of results to return
+
+    Returns
+    -------
+    indices : np.ndarray
+        Row indices of the top results, best first
+    scores : np.ndarray
+        Cosine similarities matching ``indices``
+    """
+    n_rows = normalized_matrix.shape[0]
+    k = min(k, n_rows)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    scores = normalized_matrix @ query
+    if k < n_rows:
+        top = np.argpartition(scores, -k)[-k:]
+    else:
+        top = np.arange(n_rows)
+    top = top[np.argsort(scores[top])[::-1]]
+    return top, scores[top]
+
+
+def fold_vector(profile: np.ndarray, vector: np.ndarray, count: int, decay: float) -> np.ndarray:
+    """
+    Fold ``vector`` into a running profile as its ``count``-th contribution.
+
+    The new vector gets weight ``max(1/count, decay)``: a plain running mean
+    while ``1/count`` exceeds ``decay``, an exponential moving average after.
+    """
+    alpha = max(1.0 / count, decay)
+    return (1 - alpha) * profile + alpha * vector
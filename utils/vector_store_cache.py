@@ -0,0 +1,200 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from typing import Callable, Iterable, List, Optional
+
+from langchain_community.vectorstores import FAISS
+from utils.logger import SystemLogger
+from utils.exceptions import VectorStoreError
+
+# Bump when the on-disk layout changes so stale artifacts are never loaded
+CACHE_FORMAT_VERSION = "1"
+FINGERPRINT_FILENAME = "fingerprint.txt"
+
+
+def compute_fingerprint(parts: Iterable[str]) -> str:
+    """
+    Compute a stable SHA-256 fingerprint over an ordered sequence of strings.
+
+    Parameters
+    ----------
+    parts : iterable of str
+        Values that together identify a vector store build (corpus digest,
+        embedding model name, chunking parameters, ...)
+
+    Returns
+    -------
+    str
+        Hex digest that also covers the cache format version
+    """
+    digest = hashlib.sha256()
+    digest.update(CACHE_FORMAT_VERSION.encode("utf-8"))
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(str(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def fingerprint_directory(path: str, extensions: Optional[List[str]] = None) -> str:
+    """
+    Fingerprint the contents of a directory by hashing file names and bytes.
+
+    Parameters
+    ----------
+    path : str
+        Directory to fingerprint (not recursive)
+    extensions : list of str, optional
+        Lower-case file extensions to include, e.g. ['.pdf']; all files if None
+
+    Returns
+    -------
+    str
+        Hex digest that changes whenever a matching file is added, removed,
+        renamed or modified
+
+    Raises
+    ------
+    VectorStoreError
+        If the directory cannot be read
+    """
+    digest = hashlib.sha256()
+
+    try:
+        file_names = sorted(
+            fn for fn in os.listdir(path)
+            if os.path.isfile(os.path.join(path, fn))
+            and (extensions is None or os.path.splitext(fn)[1].lower() in extensions)
+        )
+
+        for fn in file_names:
+            digest.update(fn.encode("utf-8"))
+            digest.update(b"\0")
+            with open(os.path.join(path, fn), "rb") as fh:
+                for block in iter(lambda: fh.read(1024 * 1024), b""):
+                    digest.update(block)
+            digest.update(b"\0")
+
+    except OSError as e:
+        SystemLogger.error(
+            "Failed to fingerprint directory contents - Check path and permissions",
+            exception=e,
+            context={'path': path}
+        )
+        raise VectorStoreError(f"Failed to fingerprint directory {path}: {e}")
+
+    return digest.hexdigest()
+
+
+def load_or_build_faiss(cache_dir: str,
+                        fingerprint: str,
+                        embed_model,
+                        build_fn: Callable[[], FAISS],
+                        label: str = "vector_store") -> FAISS:
+    """
+    Load a FAISS vector store from disk, or build and persist it on a miss.
+
+    Each artifact lives in ``<cache_dir>/<fingerprint>/``. On a miss the store
+    is built, written to a temporary directory next to the cache and renamed
+    into place, so readers never observe a partially written index. Artifacts
+    for older fingerprints are removed once the new one is in place.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory holding artifacts for this vector store
+    fingerprint : str
+        Key identifying the inputs the store was built from
+    embed_model : Embeddings
+        Embedding model used to load the store (must match the build model)
+    build_fn : callable
+        Zero-argument callable returning a freshly built FAISS store
+    label : str, optional
+        Name used in log messages, by default "vector_store"
+
+    Returns
+    -------
+    FAISS
+        Loaded or freshly built vector store
+
+    Raises
+    ------
+    VectorStoreError
+        If the store cannot be built
+    """
+    artifact_dir = os.path.join(cache_dir, fingerprint)
+
+    if os.path.isfile(os.path.join(artifact_dir, FINGERPRINT_FILENAME)):
+        try:
+            start_time = time.perf_counter()
+            vector_store = FAISS.load_local(
+                artifact_dir, embed_model, allow_dangerous_deserialization=True
+            )
+            SystemLogger.info(f"Loaded cached {label} from disk", {
+                'cache_dir': artifact_dir,
+                'load_seconds': round(time.perf_counter() - start_time, 3),
+                'vectors': vector_store.index.ntotal
+            })
+            return vector_store
+        except Exception as load_error:
+            SystemLogger.error(
+                f"Cached {label} could not be loaded - Rebuilding",
+                exception=load_error,
+                context={'cache_dir': artifact_dir},
+                fail_fast=False
+            )
+
+    SystemLogger.info(f"No usable cached {label} - Building from source", {
+        'cache_dir': cache_dir, 'fingerprint': fingerprint
+    })
+
+    start_time = time.perf_counter()
+    vector_store = build_fn()
+    build_seconds = time.perf_counter() - start_time
+
+    try:
+        _persist_atomically(vector_store, cache_dir, fingerprint)
+        SystemLogger.info(f"Built and cached {label}", {
+            'cache_dir': artifact_dir,
+            'build_seconds': round(build_seconds, 3),
+            'vectors': vector_store.index.ntotal
+        })
+    except Exception as save_error:
+        # A cache write failure must not take the freshly built store down with it
+        SystemLogger.error(
+            f"Failed to persist {label} to disk - Continuing with in-memory store",
+            exception=save_error,
+            context={'cache_dir': cache_dir, 'build_seconds': round(build_seconds, 3)},
+            fail_fast=False
+        )
+
+    return vector_store
+
+
+def _persist_atomically(vector_store: FAISS, cache_dir: str, fingerprint: str):
+    """Write a vector store under cache_dir/fingerprint via rename and prune old artifacts."""
+    os.makedirs(cache_dir, exist_ok=True)
+    artifact_dir = os.path.join(cache_dir, fingerprint)
+    staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=cache_dir)
+
+    try:
+        vector_store.save_local(staging_dir)
+        # The fingerprint file is written last and marks the artifact as complete
+        with open(os.path.join(staging_dir, FINGERPRINT_FILENAME), "w") as fh:
+            fh.write(fingerprint)
+
+        if os.path.isfile(os.path.join(artifact_dir, FINGERPRINT_FILENAME)):
+            # Another process published the same artifact first
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        else:
+            if os.path.isdir(artifact_dir):
+                shutil.rmtree(artifact_dir, ignore_errors=True)
+            os.rename(staging_dir, artifact_dir)
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    for entry in os.listdir(cache_dir):
+        if entry != fingerprint and not entry.startswith(".staging-"):
+            shutil.rmtree(os.path.join(cache_dir, entry), ignore_errors=True)